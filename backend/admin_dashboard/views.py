@@ -1,7 +1,8 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 from datetime import timedelta
 from core.models import User, Post, Trip, Activity, City
@@ -34,7 +35,7 @@ def dashboard_view(request):
     # Community Analytics
     total_posts = Post.objects.count()
     total_comments = Post.objects.aggregate(
-        total=Count('comments')
+        total=Sum('comments_count')
     )['total'] or 0
     
     # Popular Cities (top 10)
@@ -168,7 +169,10 @@ def delete_user(request, user_id):
     
     if request.method == 'POST':
         user_name = user.name
-        user.delete()
+        with transaction.atomic():
+            # The cascade removes their likes and comments; lower the counts they added.
+            Post.discount_users([user.pk])
+            user.delete()
         messages.success(request, f'User {user_name} has been deleted.')
         return redirect('admin_dashboard:manage_users')
     
@@ -179,10 +183,7 @@ def delete_user(request, user_id):
 @user_passes_test(is_staff_or_admin)
 def manage_posts_view(request):
     """Community posts management"""
-    posts = Post.objects.select_related('user').annotate(
-        like_count=Count('likes'),
-        comment_count=Count('comments')
-    ).order_by('-created_at')
+    posts = Post.objects.select_related('user').order_by('-created_at')
     
     context = {'posts': posts}
     return render(request, 'admin_dashboard/manage_posts.html', context)
@@ -150,6 +150,11 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
 }
 
+# Community popular feed: each decay period a newer post gains what 10x the engagement
+# gives an older one; `manage.py recompute_hot_scores --loop` rescores stale posts this often
+COMMUNITY_HOT_SCORE_DECAY_SECONDS = config('COMMUNITY_HOT_SCORE_DECAY_SECONDS', default=45000, cast=int)
+COMMUNITY_HOT_SCORE_REFRESH_SECONDS = config('COMMUNITY_HOT_SCORE_REFRESH_SECONDS', default=300, cast=int)
+
 # CORS
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 CORS_ALLOWED_ORIGINS = [
@@ -167,9 +172,41 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'globetrotter-cache',
         'TIMEOUT': config('CACHE_DEFAULT_TTL_SECONDS', default=3600, cast=int),
-    }
+    },
+    # Landing data (provider payloads, Amadeus token): a small per-process LRU in
+    # front of a cache every worker shares.
+    'landing': {
+        'BACKEND': 'landing.services.tiered_cache.TieredCache',
+        'LOCATION': 'landing-l1',
+        'TIMEOUT': config('CACHE_DEFAULT_TTL_SECONDS', default=3600, cast=int),
+        'OPTIONS': {
+            'SHARED_ALIAS': 'landing_shared',
+            'MAX_ENTRIES': config('LANDING_CACHE_LOCAL_MAX_ENTRIES', default=512, cast=int),
+            'LOCAL_TIMEOUT': config('LANDING_CACHE_LOCAL_TIMEOUT_SECONDS', default=30, cast=int),
+        },
+    },
 }
 
+# Shared tier: Redis when REDIS_URL is set, otherwise an on-disk cache so local runs
+# still share across workers and restarts. The file cache's add() is not atomic, so
+# cross-worker leases (single-flight, refreshes, warm-ups) only hold with Redis.
+_REDIS_URL = config('REDIS_URL', default='')
+if _REDIS_URL:
+    CACHES['landing_shared'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': _REDIS_URL,
+        'TIMEOUT': config('CACHE_DEFAULT_TTL_SECONDS', default=3600, cast=int),
+    }
+else:
+    CACHES['landing_shared'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('LANDING_FILE_CACHE_DIR', default='') or str(BASE_DIR / '.cache' / 'landing'),
+        'TIMEOUT': config('CACHE_DEFAULT_TTL_SECONDS', default=3600, cast=int),
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+
+LANDING_CACHE_ALIAS = 'landing'
+
 # Landing integrations (Phase 1)
 LANDING_INTEGRATIONS = {
     'openweather': bool(config('OPENWEATHER_API_KEY', default='')),
@@ -184,6 +221,86 @@ LANDING_INTEGRATIONS = {
 # Outbound HTTP defaults (Phase 1)
 OUTBOUND_HTTP_TIMEOUT_SECONDS = config('OUTBOUND_HTTP_TIMEOUT_SECONDS', default=6.0, cast=float)
 
+# Keep-alive connection pool shared by all landing providers
+OUTBOUND_HTTP_POOL_MAXSIZE = config('OUTBOUND_HTTP_POOL_MAXSIZE', default=10, cast=int)
+OUTBOUND_HTTP_POOL_IDLE_SECONDS = config('OUTBOUND_HTTP_POOL_IDLE_SECONDS', default=60.0, cast=float)
+OUTBOUND_HTTP_MAX_PER_HOST = config('OUTBOUND_HTTP_MAX_PER_HOST', default=20, cast=int)
+
+# Per-host circuit breaker and latency-derived timeouts (never above the caller's timeout)
+OUTBOUND_BREAKER_FAILURE_THRESHOLD = config('OUTBOUND_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+OUTBOUND_BREAKER_RESET_SECONDS = config('OUTBOUND_BREAKER_RESET_SECONDS', default=30.0, cast=float)
+OUTBOUND_ADAPTIVE_TIMEOUTS = config('OUTBOUND_ADAPTIVE_TIMEOUTS', default=True, cast=bool)
+OUTBOUND_ADAPTIVE_TIMEOUT_MULTIPLIER = config('OUTBOUND_ADAPTIVE_TIMEOUT_MULTIPLIER', default=3.0, cast=float)
+OUTBOUND_ADAPTIVE_TIMEOUT_MIN_SECONDS = config('OUTBOUND_ADAPTIVE_TIMEOUT_MIN_SECONDS', default=1.0, cast=float)
+
+# Concurrent upstream fan-out for landing views (image enrichment, default backfill)
+LANDING_FANOUT_MAX_WORKERS = config('LANDING_FANOUT_MAX_WORKERS', default=16, cast=int)
+LANDING_FANOUT_CONCURRENCY = config('LANDING_FANOUT_CONCURRENCY', default=8, cast=int)
+LANDING_FANOUT_DEADLINE_SECONDS = config('LANDING_FANOUT_DEADLINE_SECONDS', default=8.0, cast=float)
+
+# Landing caches: after the soft TTL (CACHE_DEFAULT_TTL_SECONDS) values stay servable
+# for this long while a background refresh runs; failed refreshes retry after the delay
+LANDING_CACHE_STALE_TTL_SECONDS = config('LANDING_CACHE_STALE_TTL_SECONDS', default=86400, cast=int)
+LANDING_CACHE_REFRESH_RETRY_SECONDS = config('LANDING_CACHE_REFRESH_RETRY_SECONDS', default=60, cast=int)
+LANDING_CACHE_REFRESH_WORKERS = config('LANDING_CACHE_REFRESH_WORKERS', default=4, cast=int)
+# Cached provider payloads under these long-lived prefixes are also kept in the
+# ProviderResponse table and restored on a cache miss
+LANDING_PERSISTENT_STORE_ENABLED = config('LANDING_PERSISTENT_STORE_ENABLED', default=True, cast=bool)
+LANDING_PERSISTENT_STORE_PREFIXES = config(
+    'LANDING_PERSISTENT_STORE_PREFIXES',
+    default='trending,destinations,home_destinations,attractions,pexels_image',
+).split(',')
+
+# Concurrent cache misses wait this long for the caller already computing the value
+LANDING_SINGLE_FLIGHT_TIMEOUT_SECONDS = config('LANDING_SINGLE_FLIGHT_TIMEOUT_SECONDS', default=10.0, cast=float)
+
+# Provider OAuth tokens (Amadeus) are refreshed in the background this long before expiry
+OAUTH_TOKEN_REFRESH_MARGIN_SECONDS = config('OAUTH_TOKEN_REFRESH_MARGIN_SECONDS', default=300, cast=int)
+OAUTH_TOKEN_CHECK_INTERVAL_SECONDS = config('OAUTH_TOKEN_CHECK_INTERVAL_SECONDS', default=60, cast=int)
+
+# Web workers build the trending payload at boot and rebuild it in the background
+# (0 = refresh at 80% of the cache TTL); turn off when a `warm_landing --loop` sidecar does it
+LANDING_PREWARM_ON_STARTUP = config('LANDING_PREWARM_ON_STARTUP', default=True, cast=bool)
+LANDING_TRENDING_REFRESH_SECONDS = config('LANDING_TRENDING_REFRESH_SECONDS', default=0, cast=int)
+# A rebuild where fewer destinations than this got an image doesn't replace the cached list
+# (Pexels configured only); with nothing cached it is served and cached this long
+LANDING_TRENDING_MIN_IMAGE_RATIO = config('LANDING_TRENDING_MIN_IMAGE_RATIO', default=0.5, cast=float)
+LANDING_TRENDING_DEGRADED_TTL_SECONDS = config('LANDING_TRENDING_DEGRADED_TTL_SECONDS', default=300, cast=int)
+
+# Local city/airport index (built by `manage.py build_city_index`); Amadeus is the fallback
+LANDING_CITY_INDEX_ENABLED = config('LANDING_CITY_INDEX_ENABLED', default=True, cast=bool)
+LANDING_CITY_INDEX_PATH = config('LANDING_CITY_INDEX_PATH', default='')
+# /autocomplete/ rebuilds its in-memory index from City + provider cities this often
+LANDING_AUTOCOMPLETE_REBUILD_SECONDS = config('LANDING_AUTOCOMPLETE_REBUILD_SECONDS', default=300, cast=int)
+# `manage.py prefetch_attractions` stores attractions for the default destinations plus this many top cities
+LANDING_ATTRACTIONS_PREFETCH_TOP = config('LANDING_ATTRACTIONS_PREFETCH_TOP', default=50, cast=int)
+LANDING_ATTRACTIONS_REFRESH_SECONDS = config('LANDING_ATTRACTIONS_REFRESH_SECONDS', default=86400, cast=int)
+
+# Pexels image lookups are cached per normalised query; misses are remembered for less time
+PEXELS_IMAGE_CACHE_TTL_SECONDS = config('PEXELS_IMAGE_CACHE_TTL_SECONDS', default=7 * 86400, cast=int)
+PEXELS_IMAGE_NEGATIVE_TTL_SECONDS = config('PEXELS_IMAGE_NEGATIVE_TTL_SECONDS', default=86400, cast=int)
+
+# Flight offer searches are cached briefly per route/dates/passengers/currency (fares move)
+AMADEUS_FLIGHT_CACHE_TTL_SECONDS = config('AMADEUS_FLIGHT_CACHE_TTL_SECONDS', default=300, cast=int)
+
+# Google Hotels searches (billed per call) are cached per city and dates
+SERPAPI_HOTEL_CACHE_TTL_SECONDS = config('SERPAPI_HOTEL_CACHE_TTL_SECONDS', default=21600, cast=int)
+
+# Time budget for attaching images to an AI itinerary; slower lookups are deferred to /trip/enhance/images/
+GROQ_IMAGE_ENRICH_DEADLINE_SECONDS = config('GROQ_IMAGE_ENRICH_DEADLINE_SECONDS', default=4.0, cast=float)
+
+# Chat intent: local keyword/gazetteer classifier, LLM only below this confidence
+GROQ_LOCAL_INTENT_ENABLED = config('GROQ_LOCAL_INTENT_ENABLED', default=True, cast=bool)
+GROQ_LOCAL_INTENT_MIN_CONFIDENCE = config('GROQ_LOCAL_INTENT_MIN_CONFIDENCE', default=0.7, cast=float)
+
+# Groq response cache (content-addressed on model/messages/temperature/response_format).
+# Temperature-0 calls are always cached; sampled ones only where the caller opts in
+# (the itinerary) or when GROQ_RESPONSE_CACHE_SAMPLED is set. MAX_ENTRIES bounds each worker's copy.
+GROQ_RESPONSE_CACHE_ENABLED = config('GROQ_RESPONSE_CACHE_ENABLED', default=True, cast=bool)
+GROQ_RESPONSE_CACHE_TTL_SECONDS = config('GROQ_RESPONSE_CACHE_TTL_SECONDS', default=86400, cast=int)
+GROQ_RESPONSE_CACHE_MAX_ENTRIES = config('GROQ_RESPONSE_CACHE_MAX_ENTRIES', default=500, cast=int)
+GROQ_RESPONSE_CACHE_SAMPLED = config('GROQ_RESPONSE_CACHE_SAMPLED', default=False, cast=bool)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Web workers keep the landing caches warm from boot, before the first request.
+from landing.apps import start_warmers  # noqa: E402
+
+start_warmers()
@@ -0,0 +1,154 @@
+import os
+import asyncio
+import atexit
+import json
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REQUESTS = int(os.environ.get('BENCH_REQUESTS', 400))
+THREADS = int(os.environ.get('BENCH_THREADS', 16))
+CONCURRENCY = int(os.environ.get('BENCH_CONCURRENCY', 200))
+UPSTREAM_DELAY = float(os.environ.get('BENCH_UPSTREAM_DELAY', 0.1))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Amadeus stand-in: OAuth token + flight offers, each answered after UPSTREAM_DELAY."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _send(self, payload):
+        time.sleep(UPSTREAM_DELAY)
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self._send({'access_token': 'bench-token', 'expires_in': 1799})
+
+    def do_GET(self):
+        self._send({'data': [{
+            'id': '1',
+            'itineraries': [{'segments': [{'departure': {'iataCode': 'MAA'}, 'arrival': {'iataCode': 'DEL'}}]}],
+            'price': {'total': '4999.00', 'currency': 'INR'},
+            'validatingAirlineCodes': ['AI'],
+        }]})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+stub = Server(('127.0.0.1', 0), StubHandler)
+threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+# Must be set before Django reads its settings / the providers read their config.
+os.environ['AMADEUS_API_BASE'] = f'http://127.0.0.1:{stub.server_port}/v1'
+os.environ.setdefault('AMADEUS_CLIENT_ID', 'bench')
+os.environ.setdefault('AMADEUS_CLIENT_SECRET', 'bench')
+os.environ['DRF_THROTTLE_ANON'] = '1000000/min'
+os.environ['ALLOWED_HOSTS'] = 'testserver'
+# Let the thread / task count be the limit being measured, not the per-host connection cap.
+os.environ['OUTBOUND_HTTP_MAX_PER_HOST'] = str(max(THREADS, CONCURRENCY))
+os.environ['OUTBOUND_HTTP_POOL_MAXSIZE'] = str(max(THREADS, CONCURRENCY))
+# A fresh shared cache tier per run: the on-disk one would serve offers from an earlier run.
+os.environ['LANDING_FILE_CACHE_DIR'] = tempfile.mkdtemp(prefix='bench-asgi-')
+atexit.register(shutil.rmtree, os.environ['LANDING_FILE_CACHE_DIR'], ignore_errors=True)
+os.environ['REDIS_URL'] = ''
+os.environ['DJANGO_SETTINGS_MODULE'] = 'backend.settings'
+
+import django
+
+django.setup()
+
+from django.test import AsyncClient, Client
+
+from landing.providers.amadeus import warm_access_token
+from landing.services.async_pool import async_pool_snapshot
+from landing.services.pool import get_pool
+
+
+FIRST_DATE = date(2027, 1, 1)
+
+
+def url(prefix, n):
+    # Request n of the whole run gets its own departure date (the async phase continues
+    # where the sync one stopped), so no request is answered from the offers cache.
+    departure = FIRST_DATE + timedelta(days=n)
+    return (f'/api/v1/landing/{prefix}trip/flights/'
+            f'?origin=MAA&destination=DEL&departure_date={departure.isoformat()}')
+
+
+def report(label, latencies, wall, errors, cached):
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<22} {len(latencies) / wall:8.1f} req/s  p50={p50:7.1f}ms  p99={p99:7.1f}ms  "
+          f"total={wall:5.2f}s  errors={errors}  cached={cached}")
+
+
+def run_sync():
+    client = Client()
+    latencies, errors, cached = [], 0, 0
+    lock = threading.Lock()
+
+    def one(i):
+        nonlocal errors, cached
+        start = time.perf_counter()
+        resp = client.get(url('', i))
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            errors += resp.status_code != 200
+            cached += resp.status_code == 200 and resp.json()['cached']
+
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(one, range(REQUESTS)))
+    report(f'sync  ({THREADS} threads)', latencies, time.perf_counter() - wall, errors, cached)
+
+
+async def run_async():
+    client = AsyncClient()
+    latencies, errors, cached = [], 0, 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(i):
+        nonlocal errors, cached
+        async with semaphore:
+            start = time.perf_counter()
+            resp = await client.get(url('async/', REQUESTS + i))
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += resp.status_code != 200
+            cached += resp.status_code == 200 and resp.json()['cached']
+
+    wall = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+    report(f'async ({CONCURRENCY} in flight)', latencies, time.perf_counter() - wall, errors, cached)
+
+
+def bench():
+    print(f"--- /trip/flights/: {REQUESTS} requests, upstream latency {UPSTREAM_DELAY * 1000:.0f}ms ---")
+    warm_access_token()
+    run_sync()
+    asyncio.run(run_async())
+    print(f"sync pool:  {get_pool().snapshot()}")
+    print(f"async pool: {async_pool_snapshot()}")
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,100 @@
+import os
+import django
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import Request, urlopen
+
+os.environ['DJANGO_SETTINGS_MODULE'] = 'backend.settings'
+django.setup()
+
+from landing.services.http import get_json
+from landing.services.pool import get_pool
+
+REQUESTS = int(os.environ.get('BENCH_REQUESTS', 500))
+THREADS = int(os.environ.get('BENCH_THREADS', 8))
+UPSTREAM_DELAY = float(os.environ.get('BENCH_UPSTREAM_DELAY', 0.002))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(UPSTREAM_DELAY)
+        body = json.dumps({'data': [{'name': 'PARIS', 'iataCode': 'PAR'}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):
+        conn = super().get_request()
+        self.connections += 1
+        return conn
+
+
+def urlopen_get_json(url):
+    """The per-call urlopen implementation used before the shared pool."""
+    req = Request(url, headers={'Accept': 'application/json', 'User-Agent': 'GlobeTrotterTechDecks/1.0'})
+    with urlopen(req, timeout=6.0) as resp:
+        return json.loads(resp.read().decode('utf-8'))
+
+
+def run(label, server, url, fn):
+    server.connections = 0
+    latencies = []
+    lock = threading.Lock()
+
+    def one(_):
+        start = time.perf_counter()
+        fn(url)
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed * 1000)
+
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(one, range(REQUESTS)))
+    wall = time.perf_counter() - wall
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<10} handshakes={server.connections:<5} p50={p50:.2f}ms p99={p99:.2f}ms total={wall:.2f}s")
+
+
+def bench():
+    print("--- Outbound HTTP: urlopen vs keep-alive pool ---")
+    print(f"requests={REQUESTS} threads={THREADS} upstream_delay={UPSTREAM_DELAY * 1000:.1f}ms\n")
+
+    server = CountingServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/reference-data/locations?keyword=paris"
+
+    # Build the process-wide pool (and its TLS context) up front; that is a one-off cost per worker.
+    get_pool()
+
+    try:
+        run('urlopen', server, url, urlopen_get_json)
+        run('pooled', server, url, lambda u: get_json(u).data)
+        print(f"\npool stats: {get_pool().snapshot()}")
+    finally:
+        get_pool().close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,161 @@
+import os
+import django
+import statistics
+import time
+from datetime import date
+
+os.environ['DJANGO_SETTINGS_MODULE'] = 'backend.settings'
+django.setup()
+
+from django.conf import settings
+from decouple import config
+
+from landing.providers.groq import _detect_intent_llm
+from landing.services.intent import Gazetteer, classify, get_gazetteer
+
+TODAY = date(2026, 3, 1)
+MODEL = 'llama-3.3-70b-versatile'
+THRESHOLD = float(getattr(settings, 'GROQ_LOCAL_INTENT_MIN_CONFIDENCE', 0.7))
+
+# Used when no city index / City rows exist yet (run build_city_index for the real one).
+SAMPLE_PLACES = [
+    ('Chennai', 'MAA'), ('Delhi', 'DEL'), ('New Delhi', 'DEL'), ('Mumbai', 'BOM'), ('Bangalore', 'BLR'),
+    ('Bengaluru', 'BLR'), ('Hyderabad', 'HYD'), ('Kolkata', 'CCU'), ('Goa', 'GOI'), ('Jaipur', 'JAI'),
+    ('Kochi', 'COK'), ('Pune', 'PNQ'), ('London', 'LON'), ('Paris', 'PAR'), ('New York', 'NYC'),
+    ('Singapore', 'SIN'), ('Bangkok', 'BKK'), ('Dubai', 'DXB'), ('Tokyo', 'TYO'), ('Rome', 'ROM'),
+    ('Barcelona', 'BCN'), ('Bali', 'DPS'), ('Sydney', 'SYD'), ('Istanbul', 'IST'), ('Amsterdam', 'AMS'),
+    ('Kathmandu', 'KTM'), ('Colombo', 'CMB'), ('Maldives', 'MLE'), ('Lisbon', 'LIS'), ('Kerala', None),
+    ('Manali', None), ('Shimla', None), ('Udaipur', 'UDR'), ('Phuket', 'HKT'), ('Zurich', 'ZRH'),
+]
+
+# (message, intent, expected slots); slots not listed are not scored.
+CORPUS = [
+    ('Find me flights from Chennai to Delhi on 5th April', 'flight', {'origin': 'MAA', 'destination': 'DEL', 'date': '2026-04-05'}),
+    ('MAA to DEL flights tomorrow', 'flight', {'origin': 'MAA', 'destination': 'DEL', 'date': '2026-03-02'}),
+    ('cheapest flight to Goa next friday', 'flight', {'destination': 'GOI', 'date': '2026-03-06'}),
+    ('I want to fly from Mumbai to Dubai', 'flight', {'origin': 'BOM', 'destination': 'DXB'}),
+    ('Any direct flights to Singapore?', 'flight', {'destination': 'SIN'}),
+    ('flights BLR - BKK on 2026-05-10', 'flight', {'origin': 'BLR', 'destination': 'BKK', 'date': '2026-05-10'}),
+    ('Book a plane ticket to London for June 12', 'flight', {'destination': 'LON', 'date': '2026-06-12'}),
+    ('What is the airfare from Delhi to Paris?', 'flight', {'origin': 'DEL', 'destination': 'PAR'}),
+    ('Show me airlines flying Hyderabad to Tokyo', 'flight', {'destination': 'TYO'}),
+    ('round trip from Kolkata to Bangkok in may', 'flight', {'origin': 'CCU', 'destination': 'BKK'}),
+    ('Need a flight out of Pune to Jaipur on 3/4', 'flight', {'origin': 'PNQ', 'destination': 'JAI', 'date': '2026-04-03'}),
+    ('flying to Rome from Chennai', 'flight', {'origin': 'MAA', 'destination': 'ROM'}),
+    ('Is there a nonstop from Bangalore to Sydney', 'flight', {'origin': 'BLR', 'destination': 'SYD'}),
+    ('flight options to Istanbul', 'flight', {'destination': 'IST'}),
+    ('Get me air tickets Chennai to Colombo', 'flight', {'origin': 'MAA', 'destination': 'CMB'}),
+    ('Hotels in Paris', 'hotel', {'destination': 'Paris'}),
+    ('Find a hotel in Goa for 3 nights from 10 April', 'hotel', {'destination': 'Goa', 'date': '2026-04-10'}),
+    ('where to stay in Bangkok', 'hotel', {'destination': 'Bangkok'}),
+    ('Cheap hostels in Amsterdam?', 'hotel', {'destination': 'Amsterdam'}),
+    ('Suggest a resort in the Maldives', 'hotel', {'destination': 'Maldives'}),
+    ('I need accommodation near Jaipur', 'hotel', {'destination': 'Jaipur'}),
+    ('good places to stay in Tokyo', 'hotel', {'destination': 'Tokyo'}),
+    ('book a room in London on May 3rd', 'hotel', {'destination': 'London', 'date': '2026-05-03'}),
+    ('Any airbnb in Lisbon?', 'hotel', {'destination': 'Lisbon'}),
+    ('Show me hotels in Dubai tomorrow', 'hotel', {'destination': 'Dubai', 'date': '2026-03-02'}),
+    ('luxury hotels Udaipur', 'hotel', {'destination': 'Udaipur'}),
+    ('Where should I go for a beach holiday?', 'destination', {}),
+    ('Suggest a place to visit in December', 'destination', {}),
+    ('What are the best places to visit near Manali', 'destination', {'destination': 'Manali'}),
+    ('recommend a city for a weekend trip', 'destination', {}),
+    ('top destinations in Europe', 'destination', {}),
+    ('Where can I go from Chennai for a weekend getaway?', 'destination', {}),
+    ('things to do in Bali', 'destination', {'destination': 'Bali'}),
+    ('Tourist attractions in Rome', 'destination', {'destination': 'Rome'}),
+    ('give me some trip ideas for monsoon', 'destination', {}),
+    ('cities like Lisbon', 'destination', {'destination': 'Lisbon'}),
+    ('Do I need a visa for Singapore?', 'general', {}),
+    ('What should I pack for Zurich in winter?', 'general', {}),
+    ("What's the best time to visit Kerala?", 'general', {}),
+    ('Is Istanbul safe for solo travellers?', 'general', {}),
+    ('What currency do they use in Thailand', 'general', {}),
+    ('hi', 'general', {}),
+    ('thanks, that helps!', 'general', {}),
+    ('How is the weather in London in March?', 'general', {}),
+    ('Any tips for dealing with jet lag?', 'general', {}),
+    ('what language do they speak in Barcelona', 'general', {}),
+    ('Do I need travel insurance?', 'general', {}),
+    ('who are you', 'general', {}),
+    ('Tell me about Shimla', 'general', {}),
+    ('how much luggage can I carry on a flight', 'general', {}),
+    ('I want to go to Phuket', 'destination', {}),
+    ('plan something for me', 'general', {}),
+]
+
+
+def gazetteer() -> Gazetteer:
+    live = get_gazetteer()
+    if len(live):
+        print(f'Gazetteer: {len(live)} names from the city index / catalog')
+        return live
+    print(f'Gazetteer: city index empty, using {len(SAMPLE_PLACES)} sample places')
+    return Gazetteer(SAMPLE_PLACES, codes=[c for _, c in SAMPLE_PLACES if c])
+
+
+def score(results):
+    intent_ok = sum(1 for (_, expected, _), got in zip(CORPUS, results) if got.get('intent') == expected)
+    slot_total = slot_ok = 0
+    for (_, _, slots), got in zip(CORPUS, results):
+        for name, value in slots.items():
+            slot_total += 1
+            slot_ok += str(got.get(name) or '').upper() == value.upper()
+    return intent_ok / len(CORPUS), slot_ok / max(1, slot_total)
+
+
+def main():
+    gaz = gazetteer()
+
+    latencies = []
+    local = []
+    for message, _, _ in CORPUS:
+        started = time.perf_counter()
+        result = classify(message, gaz, today=TODAY)
+        latencies.append(time.perf_counter() - started)
+        local.append(result)
+
+    confident = [r.confidence >= THRESHOLD for r in local]
+    intent_acc, slot_acc = score([r.as_dict() for r in local])
+    conf_results = [r.as_dict() for r, ok in zip(local, confident) if ok]
+    conf_corpus = [c for c, ok in zip(CORPUS, confident) if ok]
+    conf_acc = sum(1 for (_, exp, _), got in zip(conf_corpus, conf_results) if got['intent'] == exp) / max(1, len(conf_results))
+
+    print(f'\n{len(CORPUS)} labelled messages, confidence threshold {THRESHOLD}')
+    print(f'local   intent acc {intent_acc:6.1%}  slot acc {slot_acc:6.1%}  '
+          f'p50 {statistics.median(latencies) * 1e6:7.1f}us  max {max(latencies) * 1e6:7.1f}us')
+    print(f'        confident on {sum(confident)}/{len(CORPUS)} ({sum(confident) / len(CORPUS):.0%}) '
+          f'with {conf_acc:.1%} intent accuracy; the rest would go to the LLM')
+
+    for (message, expected, _), result in zip(CORPUS, local):
+        if result.intent != expected and result.confidence >= THRESHOLD:
+            print(f'  confident miss: {message!r} -> {result.intent} ({result.confidence})')
+
+    api_key = config('GROQ_API_KEY', default='')
+    if not api_key:
+        print('\nllm     skipped (GROQ_API_KEY not set)')
+        return
+
+    llm, llm_latencies = [], []
+    for message, _, _ in CORPUS:
+        started = time.perf_counter()
+        try:
+            llm.append(_detect_intent_llm(message, api_key=api_key, model=MODEL))
+        except Exception as e:
+            print(f'  LLM error for {message!r}: {e}')
+            llm.append({})
+        llm_latencies.append(time.perf_counter() - started)
+
+    llm_intent, llm_slots = score(llm)
+    print(f'llm     intent acc {llm_intent:6.1%}  slot acc {llm_slots:6.1%}  '
+          f'p50 {statistics.median(llm_latencies) * 1e3:7.1f}ms  max {max(llm_latencies) * 1e3:7.1f}ms')
+
+    hybrid = [r.as_dict() if ok else l for r, ok, l in zip(local, confident, llm)]
+    hybrid_latency = [lat if ok else lat + l_lat for lat, ok, l_lat in zip(latencies, confident, llm_latencies)]
+    h_intent, h_slots = score(hybrid)
+    print(f'hybrid  intent acc {h_intent:6.1%}  slot acc {h_slots:6.1%}  '
+          f'mean {statistics.mean(hybrid_latency) * 1e3:7.1f}ms  LLM calls {len(CORPUS) - sum(confident)}/{len(CORPUS)}')
+
+
+if __name__ == '__main__':
+    main()
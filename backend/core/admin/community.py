@@ -1,35 +1,47 @@
 from django.contrib import admin
+from django.db import transaction
 from django.db.models import Count
 from core.models import Post, PostLike, Comment
 
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['id', 'user', 'content_preview', 'destination', 'get_likes_count', 'get_comments_count', 'created_at']
+    list_display = ['id', 'user', 'content_preview', 'destination', 'likes_count', 'comments_count', 'created_at']
     list_filter = ['created_at', 'destination']
     search_fields = ['content', 'destination', 'user__name', 'user__email']
-    readonly_fields = ['created_at', 'updated_at', 'get_likes_count', 'get_comments_count']
+    readonly_fields = ['created_at', 'updated_at', 'likes_count', 'comments_count']
     date_hierarchy = 'created_at'
 
     def content_preview(self, obj):
         return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
     content_preview.short_description = 'Content'
 
-    def get_likes_count(self, obj):
-        return obj.likes.count()
-    get_likes_count.short_description = 'Likes'
-
-    def get_comments_count(self, obj):
-        return obj.comments.count()
-    get_comments_count.short_description = 'Comments'
-
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related('user').prefetch_related('likes', 'comments')
+        return qs.select_related('user')
+
+
+class CountedByPostAdmin(admin.ModelAdmin):
+    """Deletes here also lower the post's stored count (``counter`` is likes or comments)."""
+
+    counter = None
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            Post.adjust_counts(obj.post_id, **{self.counter: -1})
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            per_post = list(queryset.order_by().values('post_id').annotate(n=Count('id')).values_list('post_id', 'n'))
+            super().delete_queryset(request, queryset)
+            for post_id, n in per_post:
+                Post.adjust_counts(post_id, **{self.counter: -n})
 
 
 @admin.register(PostLike)
-class PostLikeAdmin(admin.ModelAdmin):
+class PostLikeAdmin(CountedByPostAdmin):
+    counter = 'likes'
     list_display = ['id', 'user', 'post', 'created_at']
     list_filter = ['created_at']
     search_fields = ['user__name', 'user__email', 'post__content']
@@ -38,7 +50,8 @@ class PostLikeAdmin(admin.ModelAdmin):
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(CountedByPostAdmin):
+    counter = 'comments'
     list_display = ['id', 'user', 'post', 'content_preview', 'created_at']
     list_filter = ['created_at']
     search_fields = ['content', 'user__name', 'user__email', 'post__content']
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from core.models import User
+from django.db import transaction
+from core.models import Post, User
 
 
 @admin.register(User)
@@ -25,3 +26,14 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('email', 'password1', 'password2', 'name', 'is_staff', 'is_active'),
         }),
     )
+
+    # The cascade removes the user's likes and comments; lower the counts they added first.
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            Post.discount_users([obj.pk])
+            super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            Post.discount_users(list(queryset.values_list('pk', flat=True)))
+            super().delete_queryset(request, queryset)
@@ -1,8 +1,9 @@
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from django.db.models import Count
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from core.api.pagination import KeysetPagination
 from core.models import Post, PostLike, Comment
 from core.serializers.community import (
     PostSerializer,
@@ -12,12 +13,19 @@ from core.serializers.community import (
 )
 
 
-class CommunityPagination(PageNumberPagination):
+class CommunityPagination(KeysetPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
 
 
+def _post_queryset(user):
+    """Posts with whether ``user`` liked each, computed in the same query."""
+    return Post.objects.select_related('user').annotate(
+        is_liked=Exists(PostLike.objects.filter(post=OuterRef('pk'), user=user)),
+    )
+
+
 class PostListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CommunityPagination
@@ -28,19 +36,18 @@ class PostListCreateView(generics.ListCreateAPIView):
         return PostSerializer
 
     def get_queryset(self):
-        queryset = Post.objects.select_related('user').annotate(
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', distinct=True)
-        )
+        queryset = _post_queryset(self.request.user)
 
         filter_type = self.request.query_params.get('filter', 'all')
 
+        # Each ordering ends in id so the pagination cursor is unique.
         if filter_type == 'popular':
-            queryset = queryset.order_by('-likes_count', '-created_at')
+            # Precomputed by `manage.py recompute_hot_scores`; an index scan, not an aggregate sort.
+            queryset = queryset.order_by('-hot_score', '-created_at', '-id')
         elif filter_type == 'recent':
-            queryset = queryset.order_by('-created_at')
+            queryset = queryset.order_by('-created_at', '-id')
         else:  # 'all'
-            queryset = queryset.order_by('-created_at')
+            queryset = queryset.order_by('-created_at', '-id')
 
         return queryset
 
@@ -50,10 +57,7 @@ class PostListCreateView(generics.ListCreateAPIView):
         post = serializer.save()
 
         # Annotate the created post for proper response
-        post = Post.objects.annotate(
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', distinct=True)
-        ).get(id=post.id)
+        post = _post_queryset(request.user).get(id=post.id)
 
         # Return the created post with full details
         response_serializer = PostSerializer(post, context={'request': request})
@@ -63,31 +67,32 @@ class PostListCreateView(generics.ListCreateAPIView):
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def like_post(request, post_id):
-    """Toggle like on a post"""
+    """Toggle like on a post.
+
+    Unlike is a DELETE plus a counter UPDATE; like is the counter UPDATE plus
+    an INSERT. The UPDATE returns the new count and doubles as the existence
+    check, so there is no separate read or recount.
+    """
     try:
-        post = Post.objects.annotate(
-            likes_count=Count('likes', distinct=True)
-        ).get(id=post_id)
-    except Post.DoesNotExist:
-        return Response(
-            {'error': 'Post not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-
-    like, created = PostLike.objects.get_or_create(user=request.user, post=post)
-
-    if not created:
-        # Unlike if already liked
-        like.delete()
-        likes_count = post.likes.count()
+        with transaction.atomic():
+            unliked, _ = PostLike.objects.filter(user=request.user, post_id=post_id).delete()
+            likes_count = Post.add_likes(post_id, -1 if unliked else 1)
+            if likes_count is None:
+                return Response(
+                    {'error': 'Post not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            if not unliked:
+                PostLike.objects.create(user=request.user, post_id=post_id)
+    except IntegrityError:
+        # A concurrent request (e.g. a double click) inserted the same like first.
         return Response({
-            'liked': False,
-            'likes_count': likes_count
+            'liked': True,
+            'likes_count': Post.objects.filter(pk=post_id).values_list('likes_count', flat=True).first() or 0
         })
 
-    likes_count = post.likes.count()
     return Response({
-        'liked': True,
+        'liked': not unliked,
         'likes_count': likes_count
     })
 
@@ -103,7 +108,7 @@ class CommentListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         post_id = self.kwargs['post_id']
-        return Comment.objects.filter(post_id=post_id).select_related('user')
+        return Comment.objects.filter(post_id=post_id).select_related('user').order_by('created_at', 'id')
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
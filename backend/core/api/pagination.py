@@ -0,0 +1,142 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _flip(field):
+    return field[1:] if field.startswith('-') else f'-{field}'
+
+
+def _encode_value(value):
+    # Full-precision ISO timestamps; a truncated one would skip or repeat rows.
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over the queryset's ``order_by``, which must end in a unique field.
+
+    The ordering fields must be non-null model fields. A cursor holds the
+    ordering values of the row it starts after, and a page is the rows past
+    that position, spelled out as ``a < x OR (a = x AND b < y) OR (a = x AND
+    b = y AND id < z)`` for ``-a, -b, -id``: no OFFSET and no COUNT(*), however
+    deep the page. Cursors are opaque strings inside the ``next`` / ``previous``
+    links; one whose values don't parse as the ordering fields is a 404.
+    """
+
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            position, reverse = data['p'], bool(data.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [self._to_python(field, value) for field, value in zip(self.ordering, position)]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _to_python(self, field, value):
+        """A cursor value as the ordering field's type, so a bad cursor never reaches the query."""
+        if value is None or isinstance(value, (list, dict)):
+            raise ValueError(f'Unusable cursor value for {field}')
+        name = field.lstrip('-')
+        opts = self.model._meta
+        return (opts.pk if name == 'pk' else opts.get_field(name)).to_python(value)
+
+    def encode_cursor(self, row, *, reverse=False):
+        position = [_encode_value(getattr(row, field.lstrip('-'))) for field in self.ordering]
+        data = {'p': position, 'r': 1} if reverse else {'p': position}
+        encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def _after(ordering, position):
+        """Rows strictly after ``position`` in ``ordering`` (a lexicographic tuple comparison)."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.ordering = tuple(queryset.query.order_by)
+        if not self.ordering:
+            raise ValueError('KeysetPagination needs an explicitly ordered queryset')
+
+        position, reverse = self.decode_cursor(request)
+        # A previous-page cursor walks backwards from the first row of the current page.
+        ordering = tuple(_flip(f) for f in self.ordering) if reverse else self.ordering
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = rows
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
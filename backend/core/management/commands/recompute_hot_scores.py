@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Recompute Post.hot_score for posts liked or commented on since their last scoring.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Rescore every post (e.g. after changing COMMUNITY_HOT_SCORE_DECAY_SECONDS).',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Posts scored per transaction.')
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and rescore every COMMUNITY_HOT_SCORE_REFRESH_SECONDS.',
+        )
+
+    def _rescore(self, batch_size: int) -> int:
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(
+                Post.objects.filter(hot_score_stale=True, id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'likes_count', 'comments_count', 'created_at')[:batch_size]
+            )
+            if not rows:
+                return updated
+            with transaction.atomic():
+                for post_id, likes, comments, created_at in rows:
+                    # Matching on the counts that were scored leaves the post stale if a
+                    # like or comment landed in between; the next run picks it up.
+                    updated += Post.objects.filter(
+                        id=post_id, likes_count=likes, comments_count=comments
+                    ).update(hot_score=Post.hot_score_for(likes, comments, created_at), hot_score_stale=False)
+            last_id = rows[-1][0]
+
+    def handle(self, *args, **options):
+        if options['all']:
+            Post.objects.update(hot_score_stale=True)
+        batch_size = max(1, options['batch_size'])
+        while True:
+            started = time.monotonic()
+            updated = self._rescore(batch_size)
+            self.stdout.write(self.style.SUCCESS(
+                f'Rescored {updated} posts in {time.monotonic() - started:.1f}s'
+            ))
+            if not options['loop']:
+                return
+            time.sleep(float(getattr(settings, 'COMMUNITY_HOT_SCORE_REFRESH_SECONDS', 300)))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from core.models import Comment, Post, PostLike
+
+
+def _count_of(model):
+    rows = model.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(n=Count('id')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+
+class Command(BaseCommand):
+    help = 'Recompute Post.likes_count and Post.comments_count from PostLike/Comment rows and fix any that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many posts are off.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Posts updated per UPDATE statement.')
+
+    def handle(self, *args, **options):
+        drifted = list(
+            Post.objects.annotate(actual_likes=_count_of(PostLike), actual_comments=_count_of(Comment))
+            .filter(~Q(likes_count=F('actual_likes')) | ~Q(comments_count=F('actual_comments')))
+            .values_list('id', flat=True)
+        )
+        if options['dry_run'] or not drifted:
+            self.stdout.write(f'{len(drifted)} posts have stale counts')
+            return
+
+        batch_size = max(1, options['batch_size'])
+        for start in range(0, len(drifted), batch_size):
+            # Counted inside the UPDATE, so likes/comments made since the scan are included.
+            Post.objects.filter(id__in=drifted[start:start + batch_size]).update(
+                likes_count=_count_of(PostLike),
+                comments_count=_count_of(Comment),
+            )
+        self.stdout.write(self.style.SUCCESS(f'Fixed counts on {len(drifted)} posts'))
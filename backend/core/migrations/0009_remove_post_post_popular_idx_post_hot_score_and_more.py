@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:05
+
+import math
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_hot_scores(apps, schema_editor):
+    Post = apps.get_model('core', 'Post')
+    decay = float(getattr(settings, 'COMMUNITY_HOT_SCORE_DECAY_SECONDS', 45000))
+    posts = list(Post.objects.only('id', 'likes_count', 'comments_count', 'created_at'))
+    for post in posts:
+        engagement = post.likes_count + 2 * post.comments_count
+        post.hot_score = math.log10(max(engagement, 1)) + post.created_at.timestamp() / decay
+        post.hot_score_stale = False
+    Post.objects.bulk_update(posts, ['hot_score', 'hot_score_stale'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_post_comments_count_post_likes_count_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_popular_idx',
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='hot_score_stale',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-hot_score', '-created_at'], name='post_hot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('hot_score_stale', True)), fields=['id'], name='post_hot_stale_idx'),
+        ),
+        migrations.RunPython(backfill_hot_scores, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,13 @@
-from django.db import models
+import math
+
+from django.db import connection, models
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
 from django.conf import settings
 
+# Engagement that counts toward the hot score: a comment is worth two likes.
+HOT_COMMENT_WEIGHT = 2
+
 class Post(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='posts')
     content = models.TextField()
@@ -8,17 +15,99 @@ class Post(models.Model):
     image = models.ImageField(upload_to='community_posts/', null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Denormalised counts, kept in step with PostLike/Comment by adjust_counts
+    # (repair drift with `manage.py reconcile_post_counts`).
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
+    # Ranking for the popular feed (see hot_score); likes/comments mark it stale and
+    # `manage.py recompute_hot_scores` refreshes only the stale posts.
+    hot_score = models.FloatField(default=0)
+    hot_score_stale = models.BooleanField(default=True)
 
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['user']),
+            models.Index(fields=['-hot_score', '-created_at'], name='post_hot_idx'),
+            models.Index(fields=['id'], condition=Q(hot_score_stale=True), name='post_hot_stale_idx'),
         ]
 
     def __str__(self):
         return f"{self.user.name} - {self.content[:50]}"
 
+    @staticmethod
+    def hot_score_for(likes, comments, created_at):
+        """log10 of engagement plus age, in units of COMMUNITY_HOT_SCORE_DECAY_SECONDS.
+
+        Each decay period a newer post gains one point, which an older post only
+        matches with ten times the engagement. Only new engagement changes a
+        post's score, so recomputing stale posts keeps the whole ranking exact.
+        """
+        decay = float(getattr(settings, 'COMMUNITY_HOT_SCORE_DECAY_SECONDS', 45000))
+        engagement = likes + HOT_COMMENT_WEIGHT * comments
+        return math.log10(max(engagement, 1)) + created_at.timestamp() / decay
+
+    @classmethod
+    def adjust_counts(cls, post_id, *, likes=0, comments=0):
+        """Add to a post's stored counts in one UPDATE; call inside the transaction that changed the rows."""
+        changes = {'hot_score_stale': True}
+        if likes:
+            changes['likes_count'] = Greatest(F('likes_count') + likes, 0)
+        if comments:
+            changes['comments_count'] = Greatest(F('comments_count') + comments, 0)
+        if likes or comments:
+            cls.objects.filter(pk=post_id).update(**changes)
+
+    @classmethod
+    def discount_users(cls, user_ids):
+        """Lower other posts' stored counts by the likes and comments of ``user_ids``.
+
+        Deleting a user cascades to their likes and comments without going
+        through ``adjust_counts``; call this in the same transaction, before the delete.
+        """
+        def per_post(model):
+            rows = (
+                model.objects.filter(user__in=user_ids)
+                .exclude(post__user__in=user_ids)  # deleted along with the user
+                .order_by()
+                .values('post_id')
+                .annotate(n=Count('id'))
+                .values_list('post_id', 'n')
+            )
+            return dict(rows)
+
+        likes, comments = per_post(PostLike), per_post(Comment)
+        for post_id in likes.keys() | comments.keys():
+            cls.adjust_counts(post_id, likes=-likes.get(post_id, 0), comments=-comments.get(post_id, 0))
+
+    @classmethod
+    def add_likes(cls, post_id, delta):
+        """Add ``delta`` to likes_count and return the new value (None if there is no such post).
+
+        One ``UPDATE ... RETURNING`` where the database supports it, instead of
+        an update followed by a read.
+        """
+        if connection.vendor == 'postgresql' or (
+            connection.vendor == 'sqlite' and connection.features.can_return_columns_from_insert
+        ):
+            qn = connection.ops.quote_name
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {qn(cls._meta.db_table)} "
+                    f"SET {qn('likes_count')} = CASE WHEN {qn('likes_count')} + %s > 0 THEN {qn('likes_count')} + %s ELSE 0 END, "
+                    f"{qn('hot_score_stale')} = %s "
+                    f"WHERE {qn('id')} = %s RETURNING {qn('likes_count')}",
+                    [delta, delta, True, post_id],
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+        if not cls.objects.filter(pk=post_id).update(
+            likes_count=Greatest(F('likes_count') + delta, 0), hot_score_stale=True
+        ):
+            return None
+        return cls.objects.filter(pk=post_id).values_list('likes_count', flat=True).first()
+
 
 class PostLike(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='liked_posts')
@@ -1,3 +1,5 @@
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
 from core.models import Post, PostLike, Comment
 
@@ -26,8 +28,6 @@ class CommentSerializer(serializers.ModelSerializer):
 
 class PostSerializer(serializers.ModelSerializer):
     user = PostUserSerializer(read_only=True)
-    likes_count = serializers.IntegerField(read_only=True, default=0)
-    comments_count = serializers.IntegerField(read_only=True, default=0)
     is_liked = serializers.SerializerMethodField()
 
     class Meta:
@@ -37,23 +37,17 @@ class PostSerializer(serializers.ModelSerializer):
             'likes_count', 'comments_count', 'is_liked',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'likes_count', 'comments_count', 'created_at', 'updated_at']
 
     def get_is_liked(self, obj):
+        # Feed querysets annotate this, so a page costs no query per post.
+        if hasattr(obj, 'is_liked'):
+            return obj.is_liked
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return PostLike.objects.filter(user=request.user, post=obj).exists()
         return False
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
-        # If counts not in instance (not annotated), query them
-        if not hasattr(instance, 'likes_count'):
-            ret['likes_count'] = instance.likes.count()
-        if not hasattr(instance, 'comments_count'):
-            ret['comments_count'] = instance.comments.count()
-        return ret
-
 
 class PostCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -62,7 +56,13 @@ class PostCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         user = self.context['request'].user
-        return Post.objects.create(user=user, **validated_data)
+        # Scored at creation so a new post shows up in the popular feed straight away.
+        return Post.objects.create(
+            user=user,
+            hot_score=Post.hot_score_for(0, 0, timezone.now()),
+            hot_score_stale=False,
+            **validated_data
+        )
 
 
 class CommentCreateSerializer(serializers.ModelSerializer):
@@ -73,5 +73,7 @@ class CommentCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         user = self.context['request'].user
         post_id = self.context['post_id']
-        post = Post.objects.get(id=post_id)
-        return Comment.objects.create(user=user, post=post, **validated_data)
+        with transaction.atomic():
+            comment = Comment.objects.create(user=user, post_id=post_id, **validated_data)
+            Post.adjust_counts(post_id, comments=1)
+        return comment
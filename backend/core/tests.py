@@ -0,0 +1,222 @@
+import base64
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Comment, Post, PostLike, User
+
+
+class FeedIsLikedTests(TestCase):
+    """is_liked comes from an Exists() annotation: the feed's query count doesn't grow with the page."""
+
+    POSTS = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='reader@example.com', password='x', name='Reader')
+        author = User.objects.create_user(email='author@example.com', password='x', name='Author')
+        posts = [Post.objects.create(user=author, content=f'Post {i}') for i in range(cls.POSTS)]
+        for i, post in enumerate(posts):
+            PostLike.objects.create(user=author, post=post)
+            if i % 2:
+                PostLike.objects.create(user=cls.user, post=post)
+        cls.liked = {post.pk for i, post in enumerate(posts) if i % 2}
+
+    def setUp(self):
+        cache.clear()  # throttle history
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _get_feed(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('core:community-posts'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data['results'], len(queries)
+
+    def test_is_liked_costs_no_query_per_post(self):
+        for filter_type in ('all', 'recent', 'popular'):
+            with self.subTest(filter=filter_type):
+                small, small_queries = self._get_feed(filter=filter_type, page_size=2)
+                full, full_queries = self._get_feed(filter=filter_type, page_size=self.POSTS)
+                self.assertEqual((len(small), len(full)), (2, self.POSTS))
+                self.assertEqual(small_queries, full_queries)
+                self.assertEqual({post['id'] for post in full if post['is_liked']}, self.liked)
+
+    def test_created_post_is_not_liked(self):
+        response = self.client.post(reverse('core:community-posts'), {'content': 'Hello'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertIs(response.data['is_liked'], False)
+
+
+class CommunityQueryCountTests(TestCase):
+    """Each community endpoint runs a fixed number of queries, whatever the page size."""
+
+    POSTS = 12
+    COMMENTS = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='reader@example.com', password='x', name='Reader')
+        authors = [
+            User.objects.create_user(email=f'author{i}@example.com', password='x', name=f'Author {i}')
+            for i in range(3)
+        ]
+        cls.posts = [
+            Post.objects.create(user=authors[i % len(authors)], content=f'Post {i}', destination='Goa')
+            for i in range(cls.POSTS)
+        ]
+        cls.post = cls.posts[0]
+        for i, post in enumerate(cls.posts):
+            for author in authors[:i % len(authors) + 1]:
+                PostLike.objects.create(user=author, post=post)
+            if i % 2:
+                PostLike.objects.create(user=cls.user, post=post)
+            Post.objects.filter(pk=post.pk).update(likes_count=post.likes.count())
+        for i in range(cls.COMMENTS):
+            Comment.objects.create(user=authors[i % len(authors)], post=cls.post, content=f'Comment {i}')
+        Post.objects.filter(pk=cls.post.pk).update(comments_count=cls.COMMENTS)
+
+    def setUp(self):
+        cache.clear()  # throttle history
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_feed(self):
+        url = reverse('core:community-posts')
+        for filter_type in ('all', 'recent', 'popular'):
+            for page_size in (2, 10, 50):
+                with self.subTest(filter=filter_type, page_size=page_size), self.assertNumQueries(1):
+                    response = self.client.get(url, {'filter': filter_type, 'page_size': page_size})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data['results']), min(page_size, self.POSTS))
+
+    def test_feed_next_page(self):
+        url = reverse('core:community-posts')
+        first = self.client.get(url, {'page_size': 5})
+        with self.assertNumQueries(1):
+            response = self.client.get(first.data['next'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_create_post(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(
+                reverse('core:community-posts'), {'content': 'Hello', 'destination': 'Goa'}, format='json'
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.data['is_liked'])
+
+    def test_like_toggle(self):
+        url = reverse('core:post-like', args=[self.post.pk])
+        likes = Post.objects.get(pk=self.post.pk).likes_count
+        # SAVEPOINT / RELEASE (the view's atomic block inside the test's transaction) around
+        # DELETE, UPDATE ... RETURNING and, when liking, INSERT.
+        with self.assertNumQueries(5):
+            liked = self.client.post(url)
+        self.assertEqual(liked.data, {'liked': True, 'likes_count': likes + 1})
+        with self.assertNumQueries(4):
+            unliked = self.client.post(url)
+        self.assertEqual(unliked.data, {'liked': False, 'likes_count': likes})
+
+    def test_like_missing_post(self):
+        response = self.client.post(reverse('core:post-like', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_comments(self):
+        url = reverse('core:post-comments', args=[self.post.pk])
+        for page_size in (2, 10, 50):
+            with self.subTest(page_size=page_size), self.assertNumQueries(1):
+                response = self.client.get(url, {'page_size': page_size})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), min(page_size, self.COMMENTS))
+
+    def test_create_comment(self):
+        url = reverse('core:post-comments', args=[self.post.pk])
+        # Post lookup, then SAVEPOINT / INSERT / counter UPDATE / RELEASE.
+        with self.assertNumQueries(5):
+            response = self.client.post(url, {'content': 'Nice'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Post.objects.get(pk=self.post.pk).comments_count, self.COMMENTS + 1)
+
+
+class UserDeleteCountsTests(TestCase):
+    def test_deleting_a_user_lowers_counts_on_other_posts(self):
+        author = User.objects.create_user(email='author@example.com', password='x', name='Author')
+        leaving = User.objects.create_user(email='leaving@example.com', password='x', name='Leaving')
+        post = Post.objects.create(user=author, content='Post')
+        own_post = Post.objects.create(user=leaving, content='Own post')
+        for user in (author, leaving):
+            PostLike.objects.create(user=user, post=post)
+        Comment.objects.create(user=leaving, post=post, content='One')
+        Comment.objects.create(user=leaving, post=post, content='Two')
+        PostLike.objects.create(user=author, post=own_post)
+        Post.objects.filter(pk=post.pk).update(likes_count=2, comments_count=2)
+
+        Post.discount_users([leaving.pk])
+        leaving.delete()
+
+        post.refresh_from_db()
+        self.assertEqual((post.likes_count, post.comments_count), (1, 0))
+        self.assertFalse(Post.objects.filter(pk=own_post.pk).exists())
+
+
+class KeysetCursorTests(TestCase):
+    """A cursor whose values don't parse as the ordering fields is a 404, never a 500."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='reader@example.com', password='x', name='Reader')
+        cls.post = Post.objects.create(user=cls.user, content='Post')
+        for i in range(3):
+            Comment.objects.create(user=cls.user, post=cls.post, content=f'Comment {i}')
+
+    def setUp(self):
+        cache.clear()  # throttle history
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def _cursor(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')).decode('ascii')
+
+    def test_bad_cursors(self):
+        created_at = self.post.created_at.isoformat()
+        cases = [
+            ('community-posts', {}, ['garbage', 1]),
+            ('community-posts', {}, [{'a': 1}, 1]),
+            ('community-posts', {}, [None, None]),
+            ('community-posts', {}, [created_at, 'abc']),
+            ('community-posts', {}, [created_at, '1.5']),
+            ('community-posts', {}, [created_at]),
+            ('community-posts', {'filter': 'popular'}, ['hot', created_at, 1]),
+            ('post-comments', {}, [created_at, [1]]),
+        ]
+        for name, params, position in cases:
+            args = [self.post.pk] if name == 'post-comments' else []
+            with self.subTest(endpoint=name, position=position):
+                response = self.client.get(
+                    reverse(f'core:{name}', args=args), {**params, 'cursor': self._cursor({'p': position})}
+                )
+                self.assertEqual(response.status_code, 404)
+
+        for cursor in ('not-base64!', self._cursor(['no', 'p']), self._cursor({'p': 'x'})):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(reverse('core:community-posts'), {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_cursor_values_are_parsed(self):
+        first = self.client.get(reverse('core:post-comments', args=[self.post.pk]), {'page_size': 1})
+        comment = Comment.objects.order_by('created_at', 'id').first()
+        # The same position with the id as a string, as a hand-edited cursor might have it.
+        cursor = self._cursor({'p': [comment.created_at.isoformat(), str(comment.pk)]})
+
+        response = self.client.get(
+            reverse('core:post-comments', args=[self.post.pk]), {'page_size': 1, 'cursor': cursor}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data['results'][0]['id'], first.data['results'][0]['id'])
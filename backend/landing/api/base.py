@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import exceptions, status
+from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 
-from landing.api.errors import error_response
+from landing.api.errors import error_response, json_error_response
 from landing.services.http import UpstreamError
 
 
+logger = logging.getLogger(__name__)
+
+
 class LandingAPIView(APIView):
     """Base APIView for landing endpoints.
 
@@ -61,3 +71,71 @@ class LandingAPIView(APIView):
             code='server_error',
             message='Unexpected server error',
         )
+
+
+class AsyncLandingView(View):
+    """Base for the async (ASGI) landing endpoints.
+
+    Plain Django async views rather than DRF, whose APIView is synchronous.
+    Errors use the same payloads and status codes as ``LandingAPIView``, and
+    ``throttle_classes`` are checked the same way (in a worker thread, since
+    they read the session user and the cache). Like the DRF views, these are
+    CSRF exempt and open to anonymous users.
+    """
+
+    throttle_classes = (AnonRateThrottle,)
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def _check_throttles(self, request) -> float | None:
+        waits = [t.wait() for t in (cls() for cls in self.throttle_classes) if not t.allow_request(request, self)]
+        return max([w for w in waits if w is not None], default=0) if waits else None
+
+    async def dispatch(self, request, *args, **kwargs):
+        wait = await sync_to_async(self._check_throttles)(request)
+        if wait is not None:
+            return json_error_response(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                code='rate_limited',
+                message='Too many requests',
+                details={'wait': wait},
+            )
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except UpstreamError as exc:
+            return json_error_response(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                code='upstream_error',
+                message=str(exc),
+                details={
+                    'status': getattr(exc, 'status', None),
+                    'details': getattr(exc, 'details', None),
+                },
+            )
+        except exceptions.ValidationError as exc:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='validation_error',
+                message='Validation error',
+                details=exc.detail,
+            )
+        except Exception:
+            logger.exception('Async landing view failed')
+            return json_error_response(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                code='server_error',
+                message='Unexpected server error',
+            )
+
+    @staticmethod
+    def json_body(request) -> dict:
+        """The JSON request body (``request.data`` in the DRF views)."""
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            raise exceptions.ValidationError('Request body must be valid JSON')
+        if not isinstance(data, dict):
+            raise exceptions.ValidationError('Request body must be a JSON object')
+        return data
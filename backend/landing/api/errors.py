@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from django.http import JsonResponse
 from rest_framework.response import Response
 
 
@@ -13,7 +14,7 @@ class ApiError:
     details: Any | None = None
 
 
-def error_response(*, status_code: int, code: str, message: str, details: Any | None = None) -> Response:
+def _error_payload(code: str, message: str, details: Any | None) -> dict[str, Any]:
     payload: dict[str, Any] = {
         'error': {
             'code': code,
@@ -22,4 +23,13 @@ def error_response(*, status_code: int, code: str, message: str, details: Any |
     }
     if details is not None:
         payload['error']['details'] = details
-    return Response(payload, status=status_code)
+    return payload
+
+
+def error_response(*, status_code: int, code: str, message: str, details: Any | None = None) -> Response:
+    return Response(_error_payload(code, message, details), status=status_code)
+
+
+def json_error_response(*, status_code: int, code: str, message: str, details: Any | None = None) -> JsonResponse:
+    """``error_response`` for plain Django (async) views, which do not render DRF Responses."""
+    return JsonResponse(_error_payload(code, message, details), status=status_code)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, AsyncIterable, Iterable, Tuple
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+
+from landing.services.http import UpstreamError
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_STREAM = 'text/event-stream'
+
+
+def wants_event_stream(request) -> bool:
+    """Streaming is opt-in: ``?stream=1`` or ``Accept: text/event-stream``."""
+    params = getattr(request, 'query_params', request.GET)
+    if (params.get('stream') or '').lower() in ('1', 'true', 'yes'):
+        return True
+    return EVENT_STREAM in (request.META.get('HTTP_ACCEPT') or '')
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    payload = json.dumps(data, separators=(',', ':'), default=str)
+    return f'event: {event}\ndata: {payload}\n\n'.encode('utf-8')
+
+
+def event_stream_response(events: Iterable[Tuple[str, Any]]) -> StreamingHttpResponse:
+    """Send ``(event, data)`` pairs as server-sent events, ending with ``done``.
+
+    Headers are already sent when the generator runs, so failures are
+    reported in-band as an ``error`` event (same shape as ``error_response``).
+    """
+
+    def body():
+        try:
+            for event, data in events:
+                yield sse_event(event, data)
+        except UpstreamError as e:
+            yield sse_event('error', {'code': 'upstream_error', 'message': str(e)})
+            return
+        except Exception:
+            logger.exception('Event stream failed')
+            yield sse_event('error', {'code': 'server_error', 'message': 'Unexpected server error'})
+            return
+        yield sse_event('done', {})
+
+    return _stream_response(body())
+
+
+def _stream_response(body) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(body, content_type=EVENT_STREAM)
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream until it completes.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def aiterate(iterable: Iterable) -> AsyncIterable:
+    """Drive a blocking iterator from a worker thread, one item at a time.
+
+    Under ASGI Django reads a synchronous streaming body to the end before
+    sending any of it; this keeps the provider generators streaming there.
+    """
+    iterator = iter(iterable)
+    done = object()
+    step = sync_to_async(next, thread_sensitive=False)
+    try:
+        while True:
+            item = await step(iterator, done)
+            if item is done:
+                return
+            yield item
+    finally:
+        # A client disconnect stops us early; let the generator release its connection.
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=False)()
+
+
+def aevent_stream_response(events: AsyncIterable[Tuple[str, Any]]) -> StreamingHttpResponse:
+    """``event_stream_response`` for async views (``events`` is an async iterable)."""
+
+    async def body():
+        try:
+            async for event, data in events:
+                yield sse_event(event, data)
+        except UpstreamError as e:
+            yield sse_event('error', {'code': 'upstream_error', 'message': str(e)})
+            return
+        except Exception:
+            logger.exception('Event stream failed')
+            yield sse_event('error', {'code': 'server_error', 'message': 'Unexpected server error'})
+            return
+        yield sse_event('done', {})
+
+    return _stream_response(body())
+
+
+class EventStreamMixin:
+    """Let clients that only accept ``text/event-stream`` through DRF content negotiation."""
+
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=force or wants_event_stream(request))
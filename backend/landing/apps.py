@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class LandingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'landing'
+
+
+def start_warmers() -> None:
+    """Build the trending payload as soon as a web worker boots and keep it warm.
+
+    Called from backend/wsgi.py and backend/asgi.py, which only servers
+    (gunicorn, uvicorn, runserver) import, so manage.py commands and scripts
+    never make these upstream calls. Workers sharing a cache skip rebuilds
+    another worker just did.
+    """
+    if not getattr(settings, 'LANDING_PREWARM_ON_STARTUP', True):
+        return
+    from landing.services.warmup import schedule_warmup
+    from landing.views import trending_refresh_interval, warm_trending
+
+    # The first trending build also fetches the shared Amadeus token, after
+    # which the token manager keeps it refreshed ahead of expiry.
+    schedule_warmup('trending', warm_trending, interval_seconds=trending_refresh_interval(), run_first=True)
@@ -0,0 +1,377 @@
+"""Async counterparts of the upstream-bound landing views, for ASGI deployments.
+
+Served under ``/async/`` with the same parameters, payloads, cache entries and
+error shapes as the views in ``landing.views``. While a request waits on
+Amadeus, Pexels, SerpApi, Wikipedia or Groq, the worker's event loop serves
+other requests instead of parking a thread per upstream call.
+"""
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from rest_framework import status
+
+from landing.api.base import AsyncLandingView
+from landing.api.errors import json_error_response
+from landing.api.streaming import aevent_stream_response, aiterate, wants_event_stream
+from landing.providers.amadeus import afind_flight_offers, asearch_cities
+from landing.providers.pexels import asearch_image
+from landing.providers.serpapi import afind_hotels
+from landing.services.attractions import attractions_url, parse_attractions, stored_attractions
+from landing.services.cache import acache_get_or_set
+from landing.services.concurrency import afan_out
+from landing.services.http import UpstreamError, aget_json
+from landing.views import (
+    AIRPORT_CODE_MAP,
+    DEFAULT_DESTINATIONS,
+    TRENDING_MAX_LIMIT,
+    DegradedTrending,
+    _banner_payload,
+    _best_match_first,
+    _check_trending,
+    _default_fill,
+    _place_result,
+    _request_deadline,
+    _store_degraded_trending,
+)
+
+
+async def _aplace_image(place, timeout: float):
+    image_query = f"{place.name} {place.country or ''} travel".strip()
+    try:
+        return await asearch_image(image_query, timeout_seconds=timeout)
+    except UpstreamError:
+        return None
+
+
+async def abuild_trending(*, timeout: float) -> list[dict]:
+    """``build_trending`` on the event loop; same deadline and partial-result rules."""
+    deadline = _request_deadline()
+
+    async def lookup(dest):
+        places = await asearch_cities(dest['name'], limit=1, timeout_seconds=timeout)
+        return places[0] if places else None
+
+    found = await afan_out(lookup, DEFAULT_DESTINATIONS[:TRENDING_MAX_LIMIT], deadline=deadline)
+    places = [p for p in found if p is not None]
+    images = await afan_out(lambda p: _aplace_image(p, timeout), places, deadline=deadline)
+    _check_trending(places, images)
+    return [_place_result(p, img) for p, img in zip(places, images)]
+
+
+class AsyncTrendingView(AsyncLandingView):
+    async def get(self, request):
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+        try:
+            limit = int(request.GET.get('limit') or 8)
+        except ValueError:
+            limit = 8
+        limit = max(4, min(limit, TRENDING_MAX_LIMIT))
+
+        try:
+            results, cached = await acache_get_or_set(
+                'trending',
+                {'limit': TRENDING_MAX_LIMIT},
+                ttl,
+                lambda: abuild_trending(timeout=timeout),
+            )
+        except DegradedTrending as e:
+            await sync_to_async(_store_degraded_trending, thread_sensitive=False)(e.results)
+            results, cached = e.results, False
+        return JsonResponse({
+            'cached': cached,
+            'results': results[:limit],
+        })
+
+
+class AsyncBannerView(AsyncLandingView):
+    async def get(self, request):
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+
+        query = request.GET.get('q') or 'travel landscape'
+
+        async def compute():
+            try:
+                img = await asearch_image(query, timeout_seconds=timeout)
+            except UpstreamError:
+                img = None
+            return _banner_payload(query, img)
+
+        payload, cached = await acache_get_or_set('banner', {'q': query}, ttl, compute)
+        return JsonResponse({
+            'cached': cached,
+            'banner': payload,
+        })
+
+
+class AsyncHomeView(AsyncLandingView):
+    async def get(self, request):
+        banner_query = request.GET.get('banner_q') or 'travel landscape'
+        q = (request.GET.get('q') or '').strip()
+
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+
+        async def compute_banner():
+            try:
+                img = await asearch_image(banner_query, timeout_seconds=timeout)
+            except UpstreamError:
+                img = None
+            return _banner_payload(banner_query, img)
+
+        banner, banner_cached = await acache_get_or_set('home_banner', {'q': banner_query}, ttl, compute_banner)
+
+        destinations = []
+        destinations_cached = False
+        if q:
+            integrations = getattr(settings, 'LANDING_INTEGRATIONS', {})
+            if not integrations.get('amadeus'):
+                return json_error_response(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    code='service_unavailable',
+                    message='Destination search is temporarily unavailable. Please try again later.',
+                )
+
+            async def compute_destinations():
+                places = await asearch_cities(q, limit=6, timeout_seconds=timeout)
+                images = await afan_out(lambda p: _aplace_image(p, timeout), places, deadline=_request_deadline())
+                return [_place_result(p, img) for p, img in zip(places, images)]
+
+            destinations, destinations_cached = await acache_get_or_set(
+                'home_destinations', {'q': q}, ttl, compute_destinations
+            )
+
+        return JsonResponse({
+            'banner': banner,
+            'banner_cached': banner_cached,
+            'destinations': destinations,
+            'destinations_cached': destinations_cached,
+        })
+
+
+class AsyncDestinationsView(AsyncLandingView):
+    async def get(self, request):
+        q = (request.GET.get('q') or '').strip()
+        if not q:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_query',
+                message='Search query is required. Please enter a city or destination name.',
+            )
+
+        integrations = getattr(settings, 'LANDING_INTEGRATIONS', {})
+        if not integrations.get('amadeus'):
+            return json_error_response(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                code='service_unavailable',
+                message='Destination search is temporarily unavailable. Please try again later.',
+            )
+
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+
+        async def compute():
+            deadline = _request_deadline()
+
+            places = await asearch_cities(q, limit=15, timeout_seconds=timeout)
+            if not places:
+                for code in AIRPORT_CODE_MAP.get(q.lower(), []):
+                    places = await asearch_cities(code, limit=15, timeout_seconds=timeout)
+                    if places:
+                        break
+
+            selected = _best_match_first(q, places)
+            needed, candidates = _default_fill(selected, places)
+            if needed:
+                async def lookup_default(default_dest):
+                    default_places = await asearch_cities(default_dest['name'], limit=1, timeout_seconds=timeout)
+                    return default_places[0] if default_places else None
+
+                found = await afan_out(lookup_default, candidates, deadline=deadline)
+                selected.extend([p for p in found if p is not None][:needed])
+
+            images = await afan_out(lambda p: _aplace_image(p, timeout), selected, deadline=deadline)
+            return [_place_result(p, img) for p, img in zip(selected, images)]
+
+        results, cached = await acache_get_or_set('destinations', {'q': q}, ttl, compute)
+        return JsonResponse({
+            'cached': cached,
+            'query': q,
+            'results': results,
+        })
+
+
+class AsyncAttractionsView(AsyncLandingView):
+    async def get(self, request):
+        city = (request.GET.get('city') or request.GET.get('q') or '').strip()
+        if not city:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_city',
+                message='City is required. Provide ?city=...'
+            )
+
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+        try:
+            limit = int(request.GET.get('limit') or 18)
+        except ValueError:
+            limit = 18
+        limit = max(6, min(limit, 40))
+
+        stored = await sync_to_async(stored_attractions)(city, limit)
+        if stored is not None:
+            return JsonResponse({
+                'cached': True,
+                'city': city,
+                'results': stored,
+            })
+
+        async def compute():
+            resp = await aget_json(attractions_url(city, limit), timeout_seconds=timeout)
+            return parse_attractions(resp.data or {}, city, limit)
+
+        results, cached = await acache_get_or_set('attractions', {'city': city, 'limit': limit, 'v': 2}, ttl, compute)
+        return JsonResponse({
+            'cached': cached,
+            'city': city,
+            'results': results,
+        })
+
+
+class AsyncTripSearchFlightsView(AsyncLandingView):
+    async def get(self, request):
+        origin = request.GET.get('origin')
+        destination = request.GET.get('destination')
+        departure_date = request.GET.get('departure_date')
+        return_date = request.GET.get('return_date')
+
+        if not all([origin, destination, departure_date]):
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_params',
+                message='origin, destination, and departure_date are required.'
+            )
+
+        offers, cached = await afind_flight_offers(
+            origin_code=origin,
+            destination_code=destination,
+            departure_date=departure_date,
+            return_date=return_date
+        )
+        return JsonResponse({
+            'cached': cached,
+            'results': [offer.as_dict() for offer in offers],
+        })
+
+
+class AsyncTripSearchHotelsView(AsyncLandingView):
+    async def get(self, request):
+        city = request.GET.get('city')
+        check_in = request.GET.get('check_in')
+        check_out = request.GET.get('check_out')
+
+        if not all([city, check_in, check_out]):
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_params',
+                message='city, check_in, and check_out are required.'
+            )
+
+        hotels, cached = await afind_hotels(
+            city_name=city,
+            check_in_date=check_in,
+            check_out_date=check_out
+        )
+        return JsonResponse({
+            'cached': cached,
+            'results': hotels,
+        })
+
+
+class AsyncTripAIEnhanceView(AsyncLandingView):
+    """``?stream=1`` streams the sync provider generator from a worker thread."""
+
+    async def post(self, request):
+        from landing.providers.groq import agenerate_itinerary_enhancement, stream_itinerary_enhancement
+
+        data = self.json_body(request)
+        destination = data.get('destination')
+        duration = data.get('duration')
+        current_activities = data.get('activities', [])
+        hotel = data.get('hotel')
+
+        if not destination or not duration:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_params',
+                message='destination and duration are required.'
+            )
+
+        try:
+            duration = int(duration)
+        except (TypeError, ValueError):
+            duration = 0
+        if duration < 1:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='invalid_params',
+                message='duration must be a positive whole number of days.'
+            )
+
+        if wants_event_stream(request):
+            return aevent_stream_response(aiterate(stream_itinerary_enhancement(
+                destination=destination,
+                duration=duration,
+                current_activities=current_activities,
+                hotel=hotel
+            )))
+
+        try:
+            enhanced_days = await agenerate_itinerary_enhancement(
+                destination=destination,
+                duration=duration,
+                current_activities=current_activities,
+                hotel=hotel
+            )
+            return JsonResponse({'days': enhanced_days})
+        except Exception as e:
+            return json_error_response(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                code='ai_failed',
+                message=str(e)
+            )
+
+
+class AsyncChatBotView(AsyncLandingView):
+    """``?stream=1`` streams the sync provider generator from a worker thread."""
+
+    async def post(self, request):
+        from landing.providers.groq import achat_with_ai, stream_chat_with_ai
+
+        data = self.json_body(request)
+        message = data.get('message')
+        history = data.get('history', [])
+
+        if not message:
+            return json_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_message',
+                message='Message is required.'
+            )
+
+        if wants_event_stream(request):
+            return aevent_stream_response(aiterate(stream_chat_with_ai(message=message, history=history)))
+
+        try:
+            result = await achat_with_ai(message=message, history=history)
+            return JsonResponse(result)
+        except Exception as e:
+            return json_error_response(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                code='chat_failed',
+                message=str(e)
+            )
@@ -0,0 +1,149 @@
+import csv
+import io
+import time
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import City
+from landing.services.autocomplete import warm_from_geoapify
+from landing.services.city_index import AIRPORT, CITY, CityIndex, Place, index_path, normalize, write_index
+
+
+OURAIRPORTS_URL = 'https://davidmegginson.github.io/ourairports-data/airports.csv'
+_AIRPORT_TYPES = {'large_airport': 2, 'medium_airport': 1}
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Build the local city/airport index used by search_cities (Amadeus becomes the fallback). '
+        'Source: an OurAirports airports.csv, ranked with core.City.popularity_score.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--airports',
+            default=OURAIRPORTS_URL,
+            help='Path or URL of an OurAirports airports.csv (default: the public OurAirports export).',
+        )
+        parser.add_argument(
+            '--include-unscheduled',
+            action='store_true',
+            help='Also index airports without scheduled passenger service.',
+        )
+        parser.add_argument(
+            '--geoapify',
+            type=int,
+            default=0,
+            metavar='N',
+            help='Also fetch Geoapify suggestions for the N most popular catalog cities missing from the index '
+                 '(feeds /autocomplete/; needs GEOAPIFY_API_KEY).',
+        )
+        parser.add_argument('--output', default='', help='Where to write the index (default: LANDING_CITY_INDEX_PATH).')
+
+    def _read_csv(self, source: str) -> list[dict]:
+        if source.startswith(('http://', 'https://')):
+            self.stdout.write(f'Downloading {source} ...')
+            req = Request(source, headers={'User-Agent': 'GlobeTrotterTechDecks/1.0'})
+            with urlopen(req, timeout=60) as resp:
+                text = resp.read().decode('utf-8')
+        else:
+            try:
+                with open(source, encoding='utf-8') as fh:
+                    text = fh.read()
+            except OSError as e:
+                raise CommandError(f'Cannot read {source}: {e}') from e
+        return list(csv.DictReader(io.StringIO(text)))
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        rows = self._read_csv(options['airports'])
+
+        popularity = {
+            normalize(name): float(score or 0)
+            for name, score in City.objects.values_list('name', 'popularity_score')
+        }
+
+        airports: list[Place] = []
+        # (city name, country) -> (airport rank, airport) used to give each city a code and position
+        cities: dict[tuple[str, str], tuple[int, Place]] = {}
+
+        for row in rows:
+            code = (row.get('iata_code') or '').strip().upper()
+            rank = _AIRPORT_TYPES.get(row.get('type') or '')
+            if len(code) != 3 or rank is None:
+                continue
+            if row.get('scheduled_service') != 'yes' and not options['include_unscheduled']:
+                continue
+
+            country = (row.get('iso_country') or '').strip() or None
+            municipality = (row.get('municipality') or '').strip()
+            score = popularity.get(normalize(municipality), 0.0)
+            airport = Place(
+                code=code,
+                name=(row.get('name') or code).upper(),
+                subtype=AIRPORT,
+                country=country,
+                lat=_float(row.get('latitude_deg')),
+                lon=_float(row.get('longitude_deg')),
+                city=municipality.upper() or None,
+                popularity=score + rank * 0.01,
+            )
+            airports.append(airport)
+
+            if municipality:
+                key = (normalize(municipality), country or '')
+                current = cities.get(key)
+                if current is None or rank > current[0]:
+                    cities[key] = (rank, airport)
+
+        city_places = [
+            Place(
+                # No metro codes in OurAirports: a city takes its main airport's code.
+                code=airport.code,
+                name=airport.city or airport.name,
+                subtype=CITY,
+                country=airport.country,
+                lat=airport.lat,
+                lon=airport.lon,
+                city=airport.city,
+                popularity=airport.popularity + 1.0,
+            )
+            for _, airport in cities.values()
+        ]
+
+        places = [*city_places, *airports]
+        if not places:
+            raise CommandError('No airports with IATA codes found; is this an OurAirports airports.csv?')
+
+        output = Path(options['output']) if options['output'] else index_path()
+        path = write_index(places, output)
+        index = CityIndex(places)
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {len(city_places)} cities and {len(airports)} airports ({len(index)} places) '
+            f'into {path} in {time.monotonic() - started:.1f}s'
+        ))
+
+        if options['geoapify']:
+            self._warm_geoapify(index, options['geoapify'])
+
+    def _warm_geoapify(self, index: CityIndex, count: int) -> None:
+        if not getattr(settings, 'LANDING_INTEGRATIONS', {}).get('geoapify'):
+            raise CommandError('GEOAPIFY_API_KEY is not set')
+        missing = [
+            name
+            for name in City.objects.order_by('-popularity_score').values_list('name', flat=True)
+            if not index.prefix(name, limit=1)
+        ][:count]
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        stored = warm_from_geoapify(missing, timeout_seconds=timeout)
+        self.stdout.write(f'Geoapify: queried {len(missing)} cities, {stored} suggestions cached for autocomplete')
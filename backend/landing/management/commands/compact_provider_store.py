@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from landing.services import store
+
+
+class Command(BaseCommand):
+    help = 'Delete persisted provider responses past their hard TTL (and, optionally, whole cache namespaces).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix',
+            action='append',
+            default=[],
+            help='Also drop every entry in this cache namespace, e.g. pexels_image (repeatable).',
+        )
+
+    def handle(self, *args, **options):
+        counts = store.compact(prefixes=options['prefix'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Removed {counts['expired']} expired and {counts['dropped']} dropped entries; "
+            f"{counts['remaining']} remain"
+        ))
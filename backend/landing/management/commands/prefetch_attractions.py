@@ -0,0 +1,85 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import City
+from landing.services.attractions import prefetch_attractions
+from landing.services.city_index import normalize
+from landing.services.http import UpstreamError
+from landing.views import DEFAULT_DESTINATIONS
+
+
+class Command(BaseCommand):
+    help = (
+        'Store Wikipedia attractions for the default destinations and the most popular catalog cities '
+        'in the Attraction table, so /attractions/ serves them without calling Wikipedia. '
+        'Re-runs only refetch pages whose revision changed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=None,
+            metavar='N',
+            help='Also prefetch the N cities with the highest popularity_score '
+                 '(default: LANDING_ATTRACTIONS_PREFETCH_TOP).',
+        )
+        parser.add_argument(
+            '--city',
+            action='append',
+            default=[],
+            help='Prefetch only this city (repeatable); skips the default and popular lists.',
+        )
+        parser.add_argument('--full', action='store_true', help='Refetch every page, changed or not.')
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and refresh every LANDING_ATTRACTIONS_REFRESH_SECONDS.',
+        )
+
+    def _cities(self, options) -> list[str]:
+        if options['city']:
+            names = options['city']
+        else:
+            top = options['top']
+            if top is None:
+                top = int(getattr(settings, 'LANDING_ATTRACTIONS_PREFETCH_TOP', 50))
+            popular = City.objects.order_by('-popularity_score').values_list('name', flat=True)[:max(0, top)]
+            names = [*(d['name'] for d in DEFAULT_DESTINATIONS), *popular]
+
+        seen, out = set(), []
+        for name in names:
+            key = normalize(name)
+            if key and key not in seen:
+                seen.add(key)
+                out.append(name.strip())
+        return out
+
+    def handle(self, *args, **options):
+        timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+        while True:
+            started = time.monotonic()
+            totals = {'fetched': 0, 'unchanged': 0, 'removed': 0}
+            cities = self._cities(options)
+            failed = 0
+            # One city at a time: Wikipedia asks API clients not to make parallel requests.
+            for city in cities:
+                try:
+                    counts = prefetch_attractions(city, full=options['full'], timeout_seconds=timeout)
+                except UpstreamError as e:
+                    failed += 1
+                    self.stderr.write(f'{city}: {e}')
+                    continue
+                for name, count in counts.items():
+                    totals[name] += count
+
+            self.stdout.write(self.style.SUCCESS(
+                f"Prefetched attractions for {len(cities) - failed}/{len(cities)} cities: "
+                f"{totals['fetched']} pages fetched, {totals['unchanged']} unchanged, {totals['removed']} removed "
+                f"in {time.monotonic() - started:.1f}s"
+            ))
+            if not options['loop']:
+                return
+            time.sleep(float(getattr(settings, 'LANDING_ATTRACTIONS_REFRESH_SECONDS', 86400)))
@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from landing.providers.amadeus import warm_access_token
+from landing.services.cache import cache_preload
+from landing.services.http import UpstreamError
+from landing.views import trending_refresh_interval, warm_trending
+
+
+class Command(BaseCommand):
+    help = (
+        'Pre-build cached landing payloads (persisted provider responses, Amadeus token, trending destinations) '
+        'so visitors never hit a cold cache.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and rebuild before the cache TTL lapses (useful as a sidecar with a shared cache).',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        loaded = cache_preload()
+        self.stdout.write(f'Loaded {loaded} persisted provider responses into the cache in {time.monotonic() - started:.1f}s')
+        while True:
+            started = time.monotonic()
+            if getattr(settings, 'LANDING_INTEGRATIONS', {}).get('amadeus'):
+                warm_access_token()
+            try:
+                results = warm_trending()
+            except UpstreamError as e:
+                self.stderr.write(f'Trending not rebuilt, keeping the cached list: {e}')
+            else:
+                if results is None:
+                    self.stdout.write('Trending was rebuilt recently by another worker; skipped')
+                else:
+                    self.stdout.write(self.style.SUCCESS(
+                        f'Warmed trending: {len(results)} destinations in {time.monotonic() - started:.1f}s'
+                    ))
+            if not options['loop']:
+                return
+            time.sleep(trending_refresh_interval())
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Attraction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_key', models.CharField(help_text='Normalised city name', max_length=255)),
+                ('city', models.CharField(max_length=255)),
+                ('page_id', models.PositiveIntegerField(help_text='Wikipedia page id')),
+                ('revision_id', models.PositiveBigIntegerField(help_text='Wikipedia revision the stored fields came from')),
+                ('rank', models.PositiveSmallIntegerField(help_text='Position in the Wikipedia search results')),
+                ('relevant', models.BooleanField(default=True, help_text='Mentions the city in its title or extract')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('image_url', models.URLField(blank=True, max_length=1000, null=True)),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['city_key', 'rank'], name='attraction_city_rank_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attraction',
+            constraint=models.UniqueConstraint(fields=('city_key', 'page_id'), name='attraction_city_page_unique'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderResponse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Landing cache key', max_length=200, unique=True)),
+                ('prefix', models.CharField(help_text='Cache namespace, e.g. pexels_image', max_length=64)),
+                ('payload', models.BinaryField(help_text='Pickled cached value')),
+                ('fresh_until', models.DateTimeField(help_text='Soft TTL: served without a refresh until then')),
+                ('expires_at', models.DateTimeField(db_index=True, help_text='Hard TTL: removed by compact_provider_store')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['prefix', 'expires_at'], name='provider_resp_prefix_exp_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import models
+
+
+class Attraction(models.Model):
+    """A Wikipedia page listed for "tourist attractions in <city>".
+
+    Filled by ``manage.py prefetch_attractions`` for popular destinations, so
+    ``/attractions/`` can answer them without calling Wikipedia. Every listed
+    page is kept, even ones that don't mention the city (``relevant=False``,
+    never shown), so a refresh only refetches pages whose revision changed.
+    """
+
+    city_key = models.CharField(max_length=255, help_text="Normalised city name")
+    city = models.CharField(max_length=255)
+    page_id = models.PositiveIntegerField(help_text="Wikipedia page id")
+    revision_id = models.PositiveBigIntegerField(help_text="Wikipedia revision the stored fields came from")
+    rank = models.PositiveSmallIntegerField(help_text="Position in the Wikipedia search results")
+    relevant = models.BooleanField(default=True, help_text="Mentions the city in its title or extract")
+    name = models.CharField(max_length=255)
+    description = models.TextField(blank=True, default='')
+    image_url = models.URLField(max_length=1000, blank=True, null=True)
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.city})"
+
+    def as_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'description': self.description,
+            'image_url': self.image_url,
+            'source': 'wikipedia',
+            'source_url': f"https://en.wikipedia.org/?curid={self.page_id}",
+        }
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['city_key', 'page_id'], name='attraction_city_page_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['city_key', 'rank'], name='attraction_city_rank_idx'),
+        ]
+
+
+class ProviderResponse(models.Model):
+    """Durable copy of a landing cache entry (see ``landing.services.store``).
+
+    The cache stays the fast path; this table lets a restarted or cleared cache
+    be refilled from the last good provider payloads instead of from upstream.
+    """
+
+    key = models.CharField(max_length=200, unique=True, help_text="Landing cache key")
+    prefix = models.CharField(max_length=64, help_text="Cache namespace, e.g. pexels_image")
+    payload = models.BinaryField(help_text="Pickled cached value")
+    fresh_until = models.DateTimeField(help_text="Soft TTL: served without a refresh until then")
+    expires_at = models.DateTimeField(db_index=True, help_text="Hard TTL: removed by compact_provider_store")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.key
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['prefix', 'expires_at'], name='provider_resp_prefix_exp_idx'),
+        ]
@@ -4,15 +4,18 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urlencode
 
+from asgiref.sync import sync_to_async
 from decouple import config
-from django.core.cache import cache
+from django.conf import settings
 
-from landing.services.http import UpstreamError, get_json, post_form
+from landing.services import city_index
+from landing.services.cache import acache_get_or_set, cache_get_or_set
+from landing.services.http import UpstreamError, aget_json, get_json, post_form
+from landing.services.tokens import SharedToken
 
 
 # Use test API by default (production requires Amadeus approval + live credentials)
 AMADEUS_BASE = config('AMADEUS_API_BASE', default='https://test.api.amadeus.com/v1')
-_TOKEN_CACHE_KEY = 'amadeus:oauth:access_token:v2'
 
 
 @dataclass(frozen=True)
@@ -33,6 +36,43 @@ class AmadeusFlightSearch:
     validating_airline_codes: list[str]
     raw: Any
 
+    def as_dict(self) -> dict:
+        """The offer in Amadeus field names, as the frontend and chat read it."""
+        return {
+            'id': self.id,
+            'itineraries': self.itineraries,
+            'price': self.price,
+            'validatingAirlineCodes': self.validating_airline_codes,
+        }
+
+
+# What is kept of an offer; fare rules, traveler pricings etc. are dropped.
+_SEGMENT_FIELDS = ('departure', 'arrival', 'carrierCode', 'number', 'duration', 'numberOfStops')
+_PRICE_FIELDS = ('currency', 'total', 'base', 'grandTotal')
+
+
+def _compact_offer(item: dict) -> AmadeusFlightSearch | None:
+    offer_id = (item or {}).get('id')
+    if not offer_id:
+        return None
+    itineraries = [
+        {
+            'duration': itinerary.get('duration'),
+            'segments': [
+                {k: segment[k] for k in _SEGMENT_FIELDS if k in segment}
+                for segment in itinerary.get('segments') or []
+            ],
+        }
+        for itinerary in item.get('itineraries') or []
+    ]
+    return AmadeusFlightSearch(
+        id=str(offer_id),
+        itineraries=itineraries,
+        price={k: v for k, v in (item.get('price') or {}).items() if k in _PRICE_FIELDS},
+        validating_airline_codes=list(item.get('validatingAirlineCodes') or []),
+        raw=None,
+    )
+
 
 def _client_id() -> str:
     return config('AMADEUS_CLIENT_ID', default='')
@@ -42,12 +82,7 @@ def _client_secret() -> str:
     return config('AMADEUS_CLIENT_SECRET', default='')
 
 
-def _get_access_token(*, timeout_seconds: float = 6.0, force_refresh: bool = False) -> str:
-    if not force_refresh:
-        cached = cache.get(_TOKEN_CACHE_KEY)
-        if isinstance(cached, str) and cached:
-            return cached
-
+def _fetch_access_token(timeout_seconds: float = 6.0) -> tuple[str, int]:
     client_id = _client_id()
     client_secret = _client_secret()
     if not client_id or not client_secret:
@@ -88,30 +123,130 @@ def _get_access_token(*, timeout_seconds: float = 6.0, force_refresh: bool = Fal
     except Exception:
         expires_seconds = 900
 
-    # Keep a small buffer so we don't use an almost-expired token.
-    cache.set(_TOKEN_CACHE_KEY, str(token), timeout=max(30, expires_seconds - 30))
-    return str(token)
+    return str(token), expires_seconds
+
+
+# One token per deployment, shared through the landing cache and refreshed ahead of expiry.
+_token = SharedToken(
+    'amadeus',
+    lambda timeout_seconds: _fetch_access_token(timeout_seconds=timeout_seconds),
+    scope={'base': AMADEUS_BASE, 'client_id': _client_id()},
+)
+
+
+def _get_access_token(*, timeout_seconds: float = 6.0, force_refresh: bool = False, rejected: str | None = None) -> str:
+    if force_refresh:
+        return _token.invalidate(rejected or '', timeout_seconds=timeout_seconds)
+    return _token.get(timeout_seconds=timeout_seconds)
+
+
+def warm_access_token() -> None:
+    """Fetch the token now (startup / warm-up) so no user request pays for OAuth."""
+    _token.get()
+
+
+def token_state() -> dict:
+    return _token.snapshot()
+
+
+def _city_from_place(place: city_index.Place) -> AmadeusCity:
+    return AmadeusCity(
+        provider_place_id=place.code,
+        name=place.name,
+        country=place.country,
+        lat=place.lat,
+        lon=place.lon,
+        raw=place.amadeus_raw(),
+    )
 
 
 def search_cities(keyword: str, *, limit: int = 6, timeout_seconds: float = 6.0) -> list[AmadeusCity]:
-    """Search for cities using Amadeus reference data (real data, no dummy).
+    """Search for cities: the local city index first, Amadeus reference data as fallback.
 
-    Uses the Amadeus test environment endpoint.
+    Amadeus is also asked when the index only has a few fuzzy matches (see
+    ``_local_is_enough``); both lists are then merged. Results found upstream are
+    remembered by the index, so the same lookup is answered locally next time.
     """
+    local = _local_cities(keyword, limit)
+    if _local_is_enough(keyword, local, limit):
+        return local
+
+    try:
+        upstream = _search_cities_upstream(keyword, limit=limit, timeout_seconds=timeout_seconds)
+    except UpstreamError:
+        if local:
+            return local
+        raise
+    _remember_cities(upstream)
+    return _merge_cities(upstream, local, limit)
+
+
+def _local_is_enough(keyword: str, local: list[AmadeusCity], limit: int) -> bool:
+    """A full page, or a code / name-prefix hit: fuzzy-only partial results still go upstream."""
+    if len(local) >= limit:
+        return True
+    code = keyword.strip().upper()
+    query = city_index.normalize(keyword)
+    return any(
+        c.provider_place_id.upper() == code or (query and city_index.normalize(c.name).startswith(query))
+        for c in local
+    )
+
+
+def _place_key(city: AmadeusCity) -> tuple[str, str]:
+    # An airport entry names its city in address.cityName, so it matches that city's entry.
+    city_name = ((city.raw or {}).get('address') or {}).get('cityName') or city.name
+    return city_index.normalize(city_name), (city.country or '').upper()
+
+
+def _merge_cities(upstream: list[AmadeusCity], local: list[AmadeusCity], limit: int) -> list[AmadeusCity]:
+    """Upstream first (the local list had no exact or prefix hit, only fuzzy guesses).
+
+    Duplicates are dropped by code and by normalised (city name, country), so a
+    city and its airport, keyed by different codes, are returned once.
+    """
+    out, seen_codes, seen_places = [], set(), set()
+    for city in (*upstream, *local):
+        code, place = city.provider_place_id.upper(), _place_key(city)
+        if code in seen_codes or place in seen_places:
+            continue
+        seen_codes.add(code)
+        seen_places.add(place)
+        out.append(city)
+    return out[:limit]
+
+
+def _local_cities(keyword: str, limit: int) -> list[AmadeusCity]:
+    if not city_index.is_enabled():
+        return []
+    return [_city_from_place(p) for p in city_index.search(keyword, limit=limit)]
+
+
+def _remember_cities(cities: list[AmadeusCity]) -> None:
+    if not city_index.is_enabled():
+        return
+    city_index.remember(
+        city_index.Place(
+            code=c.provider_place_id,
+            name=c.name,
+            subtype=str((c.raw or {}).get('subType') or city_index.CITY),
+            country=c.country,
+            lat=c.lat,
+            lon=c.lon,
+            city=((c.raw or {}).get('address') or {}).get('cityName'),
+        )
+        for c in cities
+    )
+
+
+def _search_cities_upstream(keyword: str, *, limit: int, timeout_seconds: float) -> list[AmadeusCity]:
+    """Amadeus reference-data/locations lookup (test environment endpoint by default)."""
 
     token = _get_access_token(timeout_seconds=timeout_seconds)
 
     def do_request(access_token: str) -> Any:
-        params = {
-            # In the Amadeus test environment, CITY-only can be sparse for some queries.
-            # Including AIRPORT keeps Screen 3 search results useful (still real data).
-            'subType': 'CITY,AIRPORT',
-            'keyword': keyword,
-            'page[limit]': limit,
-        }
-        url = f"{AMADEUS_BASE}/reference-data/locations?{urlencode(params)}"
         resp = get_json(
-            url,
+            _locations_url(keyword, limit),
             headers={'Authorization': f'Bearer {access_token}'},
             timeout_seconds=timeout_seconds,
         )
@@ -122,11 +257,26 @@ def search_cities(keyword: str, *, limit: int = 6, timeout_seconds: float = 6.0)
     except UpstreamError as e:
         # If token expired/invalid, refresh once and retry.
         if e.status in (401, 403):
-            token = _get_access_token(timeout_seconds=timeout_seconds, force_refresh=True)
+            token = _get_access_token(timeout_seconds=timeout_seconds, force_refresh=True, rejected=token)
             data = do_request(token)
         else:
             raise
 
+    return _parse_cities(data)
+
+
+def _locations_url(keyword: str, limit: int) -> str:
+    params = {
+        # In the Amadeus test environment, CITY-only can be sparse for some queries.
+        # Including AIRPORT keeps Screen 3 search results useful (still real data).
+        'subType': 'CITY,AIRPORT',
+        'keyword': keyword,
+        'page[limit]': limit,
+    }
+    return f"{AMADEUS_BASE}/reference-data/locations?{urlencode(params)}"
+
+
+def _parse_cities(data: Any) -> list[AmadeusCity]:
     items = (data or {}).get('data', [])
     out: list[AmadeusCity] = []
     for item in items:
@@ -161,6 +311,57 @@ def search_cities(keyword: str, *, limit: int = 6, timeout_seconds: float = 6.0)
     return out
 
 
+def _flight_query(
+    origin_code: str,
+    destination_code: str,
+    departure_date: str,
+    return_date: Optional[str],
+    adults: int,
+    limit: int,
+    currency: str,
+) -> dict:
+    """Cache identity of a flight search (also what is sent upstream)."""
+    return {
+        'origin': origin_code.strip().upper(),
+        'destination': destination_code.strip().upper(),
+        'departure_date': departure_date,
+        'return_date': return_date or None,
+        'adults': int(adults),
+        'limit': int(limit),
+        'currency': currency.upper(),
+    }
+
+
+def _flight_cache_ttl() -> int:
+    return int(getattr(settings, 'AMADEUS_FLIGHT_CACHE_TTL_SECONDS', 300))
+
+
+def find_flight_offers(
+    origin_code: str,
+    destination_code: str,
+    departure_date: str,
+    return_date: Optional[str] = None,
+    adults: int = 1,
+    limit: int = 5,
+    currency: str = 'INR',
+    timeout_seconds: float = 20.0
+) -> tuple[list[AmadeusFlightSearch], bool]:
+    """Flight offers for a route and dates, cached for AMADEUS_FLIGHT_CACHE_TTL_SECONDS.
+
+    Identical concurrent searches share one upstream call. Offers are stored
+    compacted (``raw`` is not kept) and never served past the TTL, since fares
+    change. The second return value is True when the offers came from the cache.
+    """
+    query = _flight_query(origin_code, destination_code, departure_date, return_date, adults, limit, currency)
+    return cache_get_or_set(
+        'flight_offers',
+        query,
+        _flight_cache_ttl(),
+        lambda: _fetch_flight_offers(query, timeout_seconds=timeout_seconds),
+        stale_ttl_seconds=0,
+    )
+
+
 def search_flights_offer(
     origin_code: str,
     destination_code: str,
@@ -174,23 +375,17 @@ def search_flights_offer(
     
     API docs: https://developers.amadeus.com/self-service/category/flights/api-doc/flight-offers-search/api-reference
     """
+    offers, _ = find_flight_offers(
+        origin_code, destination_code, departure_date, return_date, adults, limit, timeout_seconds=timeout_seconds
+    )
+    return [offer.as_dict() for offer in offers]
+
+
+def _fetch_flight_offers(query: dict, *, timeout_seconds: float) -> list[AmadeusFlightSearch]:
     token = _get_access_token(timeout_seconds=timeout_seconds)
-    
+    url = _flight_offers_url(query)
+
     def do_request(access_token: str) -> Any:
-        # Note: Amadeus Flight Offers Search uses v2 base
-        base_v2 = AMADEUS_BASE.replace('/v1', '/v2')
-        params = {
-            'originLocationCode': origin_code,
-            'destinationLocationCode': destination_code,
-            'departureDate': departure_date,
-            'adults': adults,
-            'max': limit,
-            'currencyCode': 'INR',
-        }
-        if return_date:
-            params['returnDate'] = return_date
-            
-        url = f"{base_v2}/shopping/flight-offers?{urlencode(params)}"
         resp = get_json(
             url,
             headers={'Authorization': f'Bearer {access_token}'},
@@ -202,9 +397,104 @@ def search_flights_offer(
         data = do_request(token)
     except UpstreamError as e:
         if e.status in (401, 403):
-            token = _get_access_token(timeout_seconds=timeout_seconds, force_refresh=True)
+            token = _get_access_token(timeout_seconds=timeout_seconds, force_refresh=True, rejected=token)
             data = do_request(token)
         else:
             raise
 
-    return (data or {}).get('data', [])
+    return _parse_offers(data)
+
+
+def _parse_offers(data: Any) -> list[AmadeusFlightSearch]:
+    offers = (_compact_offer(item) for item in (data or {}).get('data', []))
+    return [offer for offer in offers if offer is not None]
+
+
+def _flight_offers_url(query: dict) -> str:
+    # Note: Amadeus Flight Offers Search uses v2 base
+    base_v2 = AMADEUS_BASE.replace('/v1', '/v2')
+    params = {
+        'originLocationCode': query['origin'],
+        'destinationLocationCode': query['destination'],
+        'departureDate': query['departure_date'],
+        'adults': query['adults'],
+        'max': query['limit'],
+        'currencyCode': query['currency'],
+    }
+    if query['return_date']:
+        params['returnDate'] = query['return_date']
+    return f"{base_v2}/shopping/flight-offers?{urlencode(params)}"
+
+
+# -- asyncio variants (async views) ------------------------------------------------------------
+#
+# The token is still managed by SharedToken; fetching it runs in a worker
+# thread because a refresh does a blocking OAuth call and cache I/O.
+
+_aget_token = sync_to_async(lambda timeout: _token.get(timeout_seconds=timeout), thread_sensitive=False)
+_ainvalidate_token = sync_to_async(
+    lambda rejected, timeout: _token.invalidate(rejected, timeout_seconds=timeout), thread_sensitive=False
+)
+
+
+async def _aget_with_token(url: str, *, timeout_seconds: float) -> Any:
+    token = await _aget_token(timeout_seconds)
+    try:
+        resp = await aget_json(url, headers={'Authorization': f'Bearer {token}'}, timeout_seconds=timeout_seconds)
+    except UpstreamError as e:
+        if e.status not in (401, 403):
+            raise
+        token = await _ainvalidate_token(token, timeout_seconds)
+        resp = await aget_json(url, headers={'Authorization': f'Bearer {token}'}, timeout_seconds=timeout_seconds)
+    return resp.data
+
+
+async def asearch_cities(keyword: str, *, limit: int = 6, timeout_seconds: float = 6.0) -> list[AmadeusCity]:
+    """``search_cities`` for async views (local index first, Amadeus as fallback)."""
+    local = _local_cities(keyword, limit)
+    if _local_is_enough(keyword, local, limit):
+        return local
+
+    try:
+        data = await _aget_with_token(_locations_url(keyword, limit), timeout_seconds=timeout_seconds)
+    except UpstreamError:
+        if local:
+            return local
+        raise
+    upstream = _parse_cities(data)
+    _remember_cities(upstream)
+    return _merge_cities(upstream, local, limit)
+
+
+async def afind_flight_offers(
+    origin_code: str,
+    destination_code: str,
+    departure_date: str,
+    return_date: Optional[str] = None,
+    adults: int = 1,
+    limit: int = 5,
+    currency: str = 'INR',
+    timeout_seconds: float = 20.0
+) -> tuple[list[AmadeusFlightSearch], bool]:
+    """``find_flight_offers`` for async views; shares its cache entries."""
+    query = _flight_query(origin_code, destination_code, departure_date, return_date, adults, limit, currency)
+
+    async def fetch():
+        return _parse_offers(await _aget_with_token(_flight_offers_url(query), timeout_seconds=timeout_seconds))
+
+    return await acache_get_or_set('flight_offers', query, _flight_cache_ttl(), fetch, stale_ttl_seconds=0)
+
+
+async def asearch_flights_offer(
+    origin_code: str,
+    destination_code: str,
+    departure_date: str,
+    return_date: Optional[str] = None,
+    adults: int = 1,
+    limit: int = 5,
+    timeout_seconds: float = 20.0
+) -> list[dict]:
+    offers, _ = await afind_flight_offers(
+        origin_code, destination_code, departure_date, return_date, adults, limit, timeout_seconds=timeout_seconds
+    )
+    return [offer.as_dict() for offer in offers]
@@ -1,20 +1,262 @@
 from __future__ import annotations
 
 import json
-from typing import Any, List, Dict
+import re
+import threading
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+from asgiref.sync import sync_to_async
 from decouple import config
-from landing.services.http import UpstreamError, post_json
+from django.conf import settings
+
+from landing.services import intent
+from landing.services.cache import _key, cache
+from landing.services.concurrency import Deadline, afan_out, fan_out
+from landing.services.http import UpstreamError, apost_json, post_json, stream_post_json
+from landing.services.tiered_cache import LocalLRU
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
-def generate_itinerary_enhancement(destination: str, duration: int, current_activities: List[Dict], hotel: str = None) -> List[Dict]:
+# Result of an image lookup that did not finish within the enrichment budget.
+IMAGE_PENDING = object()
+
+
+def lookup_images(queries: List[str], *, deadline: Deadline) -> Dict[str, Any]:
+    """Resolve Pexels images for ``queries`` concurrently within ``deadline``.
+
+    Returns {query: url or None}; queries still in flight when the deadline
+    passes map to ``IMAGE_PENDING``. Their lookups keep running and land in the
+    image cache, so asking again shortly afterwards is a cache hit.
     """
-    Use Groq AI to generate additional activities to fill gaps in a travel itinerary.
+    from landing.providers.pexels import search_image
+
+    timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+
+    def lookup(query: str):
+        try:
+            img = search_image(query, timeout_seconds=timeout)
+        except UpstreamError:
+            return None
+        return img.url if img else None
+
+    unique = list(dict.fromkeys(queries))
+    urls = fan_out(lookup, unique, deadline=deadline, default=IMAGE_PENDING)
+    return dict(zip(unique, urls))
+
+
+def attach_activity_images(days: List[Dict], destination: str) -> None:
+    """Add an ``image`` to each schedule item, batched and bounded in time.
+
+    Items whose lookup misses GROQ_IMAGE_ENRICH_DEADLINE_SECONDS get an
+    ``image_query`` instead, to be resolved later via ``/trip/enhance/images/``.
     """
+    items, queries = _schedule_items(days, destination)
+    images = lookup_images(queries, deadline=_image_deadline())
+    _apply_images(items, queries, images)
+
+
+def _image_deadline() -> Deadline:
+    return Deadline(float(getattr(settings, 'GROQ_IMAGE_ENRICH_DEADLINE_SECONDS', 4.0)))
+
+
+def _schedule_items(days: List[Dict], destination: str) -> Tuple[List[Dict], List[str]]:
+    items = [item for day in days for item in (day.get('schedule') or []) if isinstance(item, dict)]
+    return items, [f"{item.get('title')} {destination}" for item in items]
+
+
+def _apply_images(items: List[Dict], queries: List[str], images: Dict[str, Any]) -> None:
+    for item, query in zip(items, queries):
+        url = images.get(query)
+        if url is IMAGE_PENDING:
+            item['image_query'] = query
+        elif url:
+            item['image'] = url
+
+def _api_key() -> str:
     api_key = config('GROQ_API_KEY', default='')
     if not api_key:
         raise UpstreamError("Groq API key not configured", status=503)
+    return api_key
+
+
+# -- response cache ----------------------------------------------------------------------------
+
+_WHITESPACE = re.compile(r"\s+")
+_response_lru: LocalLRU | None = None
+_response_lru_lock = threading.Lock()
+_cache_stats_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0, 'bypassed': 0}
+
+
+def _bump(name: str) -> None:
+    with _cache_stats_lock:
+        _cache_stats[name] += 1
+
+
+def response_cache_stats() -> Dict[str, Any]:
+    with _cache_stats_lock:
+        stats: Dict[str, Any] = dict(_cache_stats)
+    if _response_lru is not None:
+        local = _response_lru.stats()
+        stats['local'] = {k: local[k] for k in ('entries', 'max_entries', 'evictions')}
+    return stats
+
+
+def _lru() -> LocalLRU:
+    global _response_lru
+    if _response_lru is None:
+        with _response_lru_lock:
+            if _response_lru is None:
+                _response_lru = LocalLRU(int(getattr(settings, 'GROQ_RESPONSE_CACHE_MAX_ENTRIES', 500)))
+    return _response_lru
+
+
+def _response_key(payload: Dict[str, Any], *, cache_sampled: bool) -> str | None:
+    """Content address of a completion request, or None if it must not be cached.
+
+    Temperature-0 calls are deterministic and always cacheable. Sampled calls
+    (temperature > 0) are only cached when the caller opts in with
+    ``cache_sampled`` or GROQ_RESPONSE_CACHE_SAMPLED is set, because repeating
+    them would otherwise return a different answer.
+    """
+    if not getattr(settings, 'GROQ_RESPONSE_CACHE_ENABLED', True):
+        return None
+    temperature = float(payload.get("temperature", 1.0))
+    if temperature > 0 and not (cache_sampled or getattr(settings, 'GROQ_RESPONSE_CACHE_SAMPLED', False)):
+        return None
+    messages = [
+        {"role": m.get("role"), "content": _WHITESPACE.sub(" ", str(m.get("content") or "")).strip()}
+        for m in payload.get("messages", [])
+    ]
+    return _key('groq_completion', {
+        "model": payload.get("model"),
+        "messages": messages,
+        "temperature": temperature,
+        "response_format": payload.get("response_format"),
+    })
+
+
+def _cached_content(key: str | None) -> str | None:
+    if key is None:
+        _bump('bypassed')
+        return None
+    found, content = _lru().get(key)
+    if not found:
+        content = cache.get(key)
+        if content is not None:
+            _lru().set(key, content, float(getattr(settings, 'GROQ_RESPONSE_CACHE_TTL_SECONDS', 86400)))
+    _bump('hits' if content is not None else 'misses')
+    return content
+
+
+def _store_content(key: str | None, content: str) -> None:
+    if key is None or not content:
+        return
+    ttl = int(getattr(settings, 'GROQ_RESPONSE_CACHE_TTL_SECONDS', 86400))
+    _lru().set(key, content, ttl)
+    cache.set(key, content, timeout=ttl)
+
+
+def _complete(payload: Dict[str, Any], *, api_key: str, timeout_seconds: float, cache_sampled: bool = False) -> str:
+    """Message content of a chat completion, served from the response cache when possible."""
+    key = _response_key(payload, cache_sampled=cache_sampled)
+    content = _cached_content(key)
+    if content is not None:
+        return content
+    resp = post_json(
+        GROQ_API_URL,
+        payload=payload,
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout_seconds=timeout_seconds
+    )
+    content = resp.data['choices'][0]['message']['content']
+    _store_content(key, content)
+    return content
+
+
+def _stream_completion(
+    payload: Dict[str, Any], *, api_key: str, timeout_seconds: float, cache_sampled: bool = False
+) -> Iterator[str]:
+    """Streamed ``_complete``: a cached response is replayed as a single chunk,
+    and a fully received stream is stored for next time."""
+    key = _response_key(payload, cache_sampled=cache_sampled)
+    content = _cached_content(key)
+    if content is not None:
+        yield content
+        return
+    parts: List[str] = []
+    for delta in _stream_deltas(payload, api_key=api_key, timeout_seconds=timeout_seconds):
+        parts.append(delta)
+        yield delta
+    _store_content(key, "".join(parts))
+
+
+def _stream_deltas(payload: Dict[str, Any], *, api_key: str, timeout_seconds: float) -> Iterator[str]:
+    """Yield the content deltas of a streamed chat completion (OpenAI-style SSE chunks)."""
+    lines = stream_post_json(
+        GROQ_API_URL,
+        payload={**payload, "stream": True},
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout_seconds=timeout_seconds,
+    )
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            continue  # read to the end of the body so the connection can be reused
+        chunk = json.loads(data)
+        choices = chunk.get("choices") or [{}]
+        content = (choices[0].get("delta") or {}).get("content")
+        if content:
+            yield content
 
+
+class DayStreamParser:
+    """Pull complete day objects out of a partially received ``{"days": [...]}`` document.
+
+    Each object is decoded as soon as its closing brace arrives, so days can be
+    sent to the client while the model is still writing the next one.
+    """
+
+    _DAYS_START = re.compile(r'"days"\s*:\s*\[')
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos: int | None = None
+        self._decoder = json.JSONDecoder()
+        self.finished = False
+
+    def feed(self, text: str) -> List[Dict]:
+        self._buffer += text
+        if self._pos is None:
+            match = self._DAYS_START.search(self._buffer)
+            if not match:
+                return []
+            self._pos = match.end()
+
+        days = []
+        while not self.finished:
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in " \t\r\n,":
+                pos += 1
+            self._pos = pos
+            if pos >= len(self._buffer):
+                break
+            if self._buffer[pos] == "]":
+                self.finished = True
+                break
+            try:
+                day, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                break  # incomplete; wait for more text
+            self._pos = end
+            if isinstance(day, dict):
+                days.append(day)
+        return days
+
+
+def _itinerary_payload(destination: str, duration: int, current_activities: List[Dict], hotel: str = None) -> Dict[str, Any]:
     model = "llama-3.3-70b-versatile"
     
     hotel_context = f" Staying at: {hotel}." if hotel else ""
@@ -44,54 +286,72 @@ def generate_itinerary_enhancement(destination: str, duration: int, current_acti
         {"role": "user", "content": prompt}
     ]
 
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": 0.7,
+        "response_format": {"type": "json_object"}
+    }
+
+
+def generate_itinerary_enhancement(destination: str, duration: int, current_activities: List[Dict], hotel: str = None) -> List[Dict]:
+    """
+    Use Groq AI to generate additional activities to fill gaps in a travel itinerary.
+    """
+    api_key = _api_key()
+    payload = _itinerary_payload(destination, duration, current_activities, hotel)
+
     try:
-        resp = post_json(
-            GROQ_API_URL,
-            payload={
-                "model": model,
-                "messages": messages,
-                "temperature": 0.7,
-                "response_format": {"type": "json_object"}
-            },
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout_seconds=30.0
-        )
-        
-        content = resp.data['choices'][0]['message']['content']
+        # Identical trip requests get the same itinerary back instead of a new sample.
+        content = _complete(payload, api_key=api_key, timeout_seconds=30.0, cache_sampled=True)
         data = json.loads(content)
         days = data.get("days", [])
 
-        # Fetch images from Pexels for each activity
-        from landing.providers.pexels import search_image
-        
-        for day in days:
-            for item in day.get('schedule', []):
-                query = f"{item.get('title')} {destination}"
-                try:
-                    img = search_image(query)
-                    if img:
-                        item['image'] = img.url
-                except Exception as e:
-                    print(f"DEBUG: Pexels search failed for '{query}': {e}")
-                    # Keep existing or fallback image if search fails
-        
+        attach_activity_images(days, destination)
         return days
         
     except Exception as e:
         raise UpstreamError(f"AI generation failed: {str(e)}", status=502)
 
-def chat_with_ai(message: str, history: List[Dict] = None) -> Dict[str, Any]:
-    """
-    General conversational chat with Groq AI.
-    Detects travel queries and fetches real data from APIs.
+
+def stream_itinerary_enhancement(destination: str, duration: int, current_activities: List[Dict], hotel: str = None) -> Iterator[Tuple[str, Any]]:
+    """Streaming variant of ``generate_itinerary_enhancement``.
+
+    Yields ``("day", day)`` as soon as each day is complete (items carry an
+    ``image_query``), then one ``("images", {query: url})`` with the images
+    resolved within GROQ_IMAGE_ENRICH_DEADLINE_SECONDS.
     """
-    api_key = config('GROQ_API_KEY', default='')
-    if not api_key:
-        raise UpstreamError("Groq API key not configured", status=503)
+    api_key = _api_key()
+    payload = _itinerary_payload(destination, duration, current_activities, hotel)
+    parser = DayStreamParser()
+    queries: List[str] = []
 
-    model = "llama-3.3-70b-versatile"
-    
-    # First, use AI to detect intent and extract parameters
+    try:
+        for delta in _stream_completion(payload, api_key=api_key, timeout_seconds=30.0, cache_sampled=True):
+            for day in parser.feed(delta):
+                for item in day.get('schedule') or []:
+                    if isinstance(item, dict):
+                        item['image_query'] = f"{item.get('title')} {destination}"
+                        queries.append(item['image_query'])
+                yield "day", day
+    except Exception as e:
+        raise UpstreamError(f"AI generation failed: {str(e)}", status=502)
+
+    images = lookup_images(queries, deadline=_image_deadline())
+    yield "images", {q: url for q, url in images.items() if url is not IMAGE_PENDING}
+
+def _detect_intent(message: str, *, api_key: str, model: str) -> Dict[str, Any]:
+    """Local rule-based classifier first; the LLM only when it is not confident."""
+    if getattr(settings, 'GROQ_LOCAL_INTENT_ENABLED', True):
+        local = intent.classify(message)
+        if local.confidence >= float(getattr(settings, 'GROQ_LOCAL_INTENT_MIN_CONFIDENCE', 0.7)):
+            intent.record('local')
+            return local.as_dict()
+    intent.record('llm_fallback')
+    return _detect_intent_llm(message, api_key=api_key, model=model)
+
+
+def _intent_payload(message: str, model: str) -> Dict[str, Any]:
     intent_prompt = f"""
     Analyze this user message and determine if they're asking about:
     1. Flights (looking for flight options, prices, routes)
@@ -109,134 +369,327 @@ def chat_with_ai(message: str, history: List[Dict] = None) -> Dict[str, Any]:
         "date": "date if mentioned, else null"
     }}
     """
+
+    # temperature 0: classification should be repeatable, and cacheable
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": "You are a travel intent analyzer. Return only valid JSON."},
+            {"role": "user", "content": intent_prompt}
+        ],
+        "temperature": 0,
+        "response_format": {"type": "json_object"}
+    }
+
+
+def _detect_intent_llm(message: str, *, api_key: str, model: str) -> Dict[str, Any]:
+    content = _complete(_intent_payload(message, model), api_key=api_key, timeout_seconds=15.0)
+    return json.loads(content)
+
+
+def _flight_params(intent_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    origin = intent_data.get('origin') or 'MAA'  # Default Chennai
+    dest = intent_data.get('destination') or 'DEL'  # Default Delhi
+    dep_date = intent_data.get('date') or '2026-04-05'
+    return origin, dest, dep_date
+
+
+def _flight_answer(flights: List[Dict], origin: str, dest: str, dep_date: str) -> Dict[str, Any]:
+    flight_cards = []
+    for f in flights[:3]:
+        price = f.get('price', {})
+        itineraries = f.get('itineraries', [])
+        route = f"{origin} → {dest}"
+        if itineraries:
+            segments = itineraries[0].get('segments', [])
+            if segments:
+                route = f"{segments[0].get('departure', {}).get('iataCode', origin)} → {segments[-1].get('arrival', {}).get('iataCode', dest)}"
+        
+        flight_cards.append({
+            'price': price.get('total', 'N/A'),
+            'route': route,
+            'airline': f.get('validatingAirlineCodes', [''])[0] if f.get('validatingAirlineCodes') else 'N/A'
+        })
     
+    return {
+        'response': f"Here are {len(flight_cards)} flights from {origin} to {dest} on {dep_date}:",
+        'data': {
+            'type': 'flight',
+            'items': flight_cards
+        }
+    }
+
+
+def _next_day(date_str: str) -> str:
     try:
-        # Get intent from AI
-        intent_resp = post_json(
-            GROQ_API_URL,
-            payload={
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": "You are a travel intent analyzer. Return only valid JSON."},
-                    {"role": "user", "content": intent_prompt}
-                ],
-                "temperature": 0.3,
-                "response_format": {"type": "json_object"}
-            },
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout_seconds=15.0
-        )
-        
-        intent_data = json.loads(intent_resp.data['choices'][0]['message']['content'])
-        intent = intent_data.get('intent', 'general')
-        
-        # If flight query detected, fetch real flights
-        if intent == 'flight':
-            from landing.providers.amadeus import search_flights_offer
-            origin = intent_data.get('origin') or 'MAA'  # Default Chennai
-            dest = intent_data.get('destination') or 'DEL'  # Default Delhi
-            dep_date = intent_data.get('date') or '2026-04-05'
-            
-            try:
-                flights = search_flights_offer(origin, dest, dep_date, limit=3)
-                if flights:
-                    flight_cards = []
-                    for f in flights[:3]:
-                        price = f.get('price', {})
-                        itineraries = f.get('itineraries', [])
-                        route = f"{origin} → {dest}"
-                        if itineraries:
-                            segments = itineraries[0].get('segments', [])
-                            if segments:
-                                route = f"{segments[0].get('departure', {}).get('iataCode', origin)} → {segments[-1].get('arrival', {}).get('iataCode', dest)}"
-                        
-                        flight_cards.append({
-                            'price': price.get('total', 'N/A'),
-                            'route': route,
-                            'airline': f.get('validatingAirlineCodes', [''])[0] if f.get('validatingAirlineCodes') else 'N/A'
-                        })
-                    
-                    return {
-                        'response': f"Here are {len(flight_cards)} flights from {origin} to {dest} on {dep_date}:",
-                        'data': {
-                            'type': 'flight',
-                            'items': flight_cards
-                        }
-                    }
-            except Exception as e:
-                print(f"Flight fetch error: {e}")
+        return (date.fromisoformat(date_str) + timedelta(days=1)).isoformat()
+    except ValueError:
+        return date_str
+
+
+def _hotel_params(intent_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    city = intent_data.get('destination') or 'Paris'
+    check_in = intent_data.get('date') or '2026-04-05'
+    return city, check_in, _next_day(check_in)
+
+
+def _hotel_answer(hotels: List[Dict], city: str) -> Dict[str, Any]:
+    hotel_cards = []
+    for h in hotels[:3]:
+        hotel_cards.append({
+            'name': h.get('name', 'Hotel'),
+            'rating': h.get('overall_rating', 'N/A'),
+            'price': h.get('rate_per_night', {}).get('lowest', 'N/A')
+        })
+    
+    return {
+        'response': f"Here are {len(hotel_cards)} hotels in {city}:",
+        'data': {
+            'type': 'hotel',
+            'items': hotel_cards
+        }
+    }
+
+
+def _destination_query(message: str, intent_data: Dict[str, Any]) -> str:
+    return intent_data.get('destination') or message.split()[-1]
+
+
+def _destination_answer(cities: List[Any], query: str) -> Dict[str, Any]:
+    dest_cards = []
+    for c in cities[:3]:
+        dest_cards.append({
+            'name': c.name,
+            'country': c.country or 'Unknown'
+        })
+    
+    return {
+        'response': f"Here are some destinations matching '{query}':",
+        'data': {
+            'type': 'destination',
+            'items': dest_cards
+        }
+    }
+
+
+def _answer_with_data(message: str, intent_data: Dict[str, Any]) -> Dict[str, Any] | None:
+    """Answer flight/hotel/destination intents with real provider data; None falls back to chat."""
+    intent = intent_data.get('intent', 'general')
+
+    # If flight query detected, fetch real flights
+    if intent == 'flight':
+        from landing.providers.amadeus import search_flights_offer
+        origin, dest, dep_date = _flight_params(intent_data)
         
-        # If hotel query detected, fetch real hotels
-        elif intent == 'hotel':
-            from landing.providers.serpapi import search_hotels
-            city = intent_data.get('destination') or 'Paris'
-            check_in = intent_data.get('date') or '2026-04-05'
-            
-            try:
-                hotels = search_hotels(city, check_in, limit=3)
-                if hotels:
-                    hotel_cards = []
-                    for h in hotels[:3]:
-                        hotel_cards.append({
-                            'name': h.get('name', 'Hotel'),
-                            'rating': h.get('rating', 'N/A'),
-                            'price': h.get('rate_per_night', {}).get('lowest', 'N/A')
-                        })
-                    
-                    return {
-                        'response': f"Here are {len(hotel_cards)} hotels in {city}:",
-                        'data': {
-                            'type': 'hotel',
-                            'items': hotel_cards
-                        }
-                    }
-            except Exception as e:
-                print(f"Hotel fetch error: {e}")
+        try:
+            flights = search_flights_offer(origin, dest, dep_date, limit=3)
+            if flights:
+                return _flight_answer(flights, origin, dest, dep_date)
+        except Exception as e:
+            print(f"Flight fetch error: {e}")
+    
+    # If hotel query detected, fetch real hotels
+    elif intent == 'hotel':
+        from landing.providers.serpapi import search_hotels
+        city, check_in, check_out = _hotel_params(intent_data)
         
-        # If destination query, fetch destinations
-        elif intent == 'destination':
-            from landing.providers.amadeus import search_cities
-            query = intent_data.get('destination') or message.split()[-1]
-            
-            try:
-                cities = search_cities(query, limit=3)
-                if cities:
-                    dest_cards = []
-                    for c in cities[:3]:
-                        dest_cards.append({
-                            'name': c.name,
-                            'country': c.country or 'Unknown'
-                        })
-                    
-                    return {
-                        'response': f"Here are some destinations matching '{query}':",
-                        'data': {
-                            'type': 'destination',
-                            'items': dest_cards
-                        }
-                    }
-            except Exception as e:
-                print(f"Destination fetch error: {e}")
+        try:
+            hotels = search_hotels(city, check_in, check_out)
+            if hotels:
+                return _hotel_answer(hotels, city)
+        except Exception as e:
+            print(f"Hotel fetch error: {e}")
+    
+    # If destination query, fetch destinations
+    elif intent == 'destination':
+        from landing.providers.amadeus import search_cities
+        query = _destination_query(message, intent_data)
         
+        try:
+            cities = search_cities(query, limit=3)
+            if cities:
+                return _destination_answer(cities, query)
+        except Exception as e:
+            print(f"Destination fetch error: {e}")
+
+    return None
+
+
+def _general_payload(message: str, history: List[Dict] | None, model: str) -> Dict[str, Any]:
+    system_prompt = "You are GlobeTrotter, a helpful and friendly travel assistant. Keep responses concise and engaging."
+    messages = [{"role": "system", "content": system_prompt}]
+    if history:
+        messages.extend(history[-6:])  # Last 6 messages for context
+    messages.append({"role": "user", "content": message})
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": 0.7,
+    }
+
+
+def chat_with_ai(message: str, history: List[Dict] = None) -> Dict[str, Any]:
+    """
+    General conversational chat with Groq AI.
+    Detects travel queries and fetches real data from APIs.
+    """
+    api_key = _api_key()
+    model = "llama-3.3-70b-versatile"
+
+    try:
+        # First, use AI to detect intent and extract parameters
+        intent_data = _detect_intent(message, api_key=api_key, model=model)
+        answer = _answer_with_data(message, intent_data)
+        if answer:
+            return answer
+
         # Fallback to general conversation
-        system_prompt = "You are GlobeTrotter, a helpful and friendly travel assistant. Keep responses concise and engaging."
-        messages = [{"role": "system", "content": system_prompt}]
-        if history:
-            messages.extend(history[-6:])  # Last 6 messages for context
-        messages.append({"role": "user", "content": message})
-
-        resp = post_json(
-            GROQ_API_URL,
-            payload={
-                "model": model,
-                "messages": messages,
-                "temperature": 0.7,
-            },
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout_seconds=20.0
-        )
-        
-        return {'response': resp.data['choices'][0]['message']['content']}
+        content = _complete(_general_payload(message, history, model), api_key=api_key, timeout_seconds=20.0)
+        return {'response': content}
         
     except Exception as e:
         raise UpstreamError(f"Chat failed: {str(e)}", status=502)
+
+
+def stream_chat_with_ai(message: str, history: List[Dict] = None) -> Iterator[Tuple[str, Any]]:
+    """Streaming variant of ``chat_with_ai``.
+
+    Yields one ``("data", result)`` for provider-backed answers, otherwise the
+    general reply as ``("delta", text)`` chunks as Groq produces them.
+    """
+    api_key = _api_key()
+    model = "llama-3.3-70b-versatile"
+
+    try:
+        intent_data = _detect_intent(message, api_key=api_key, model=model)
+        answer = _answer_with_data(message, intent_data)
+        if answer:
+            yield "data", answer
+            return
+
+        payload = _general_payload(message, history, model)
+        for delta in _stream_completion(payload, api_key=api_key, timeout_seconds=20.0):
+            yield "delta", delta
+    except Exception as e:
+        raise UpstreamError(f"Chat failed: {str(e)}", status=502)
+
+
+
+# -- asyncio variants (async views) ------------------------------------------------------------
+#
+# Same prompts, response cache and image budget as above; cache and DB access
+# (response cache, intent gazetteer) run in worker threads.
+
+_acached_content = sync_to_async(_cached_content, thread_sensitive=False)
+_astore_content = sync_to_async(_store_content, thread_sensitive=False)
+
+
+async def _acomplete(payload: Dict[str, Any], *, api_key: str, timeout_seconds: float, cache_sampled: bool = False) -> str:
+    key = _response_key(payload, cache_sampled=cache_sampled)
+    content = await _acached_content(key)
+    if content is not None:
+        return content
+    resp = await apost_json(
+        GROQ_API_URL,
+        payload=payload,
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout_seconds=timeout_seconds
+    )
+    content = resp.data['choices'][0]['message']['content']
+    await _astore_content(key, content)
+    return content
+
+
+async def alookup_images(queries: List[str], *, deadline: Deadline) -> Dict[str, Any]:
+    from landing.providers.pexels import asearch_image
+
+    timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+
+    async def lookup(query: str):
+        try:
+            img = await asearch_image(query, timeout_seconds=timeout)
+        except UpstreamError:
+            return None
+        return img.url if img else None
+
+    unique = list(dict.fromkeys(queries))
+    urls = await afan_out(lookup, unique, deadline=deadline, default=IMAGE_PENDING)
+    return dict(zip(unique, urls))
+
+
+async def agenerate_itinerary_enhancement(destination: str, duration: int, current_activities: List[Dict], hotel: str = None) -> List[Dict]:
+    api_key = _api_key()
+    payload = _itinerary_payload(destination, duration, current_activities, hotel)
+
+    try:
+        content = await _acomplete(payload, api_key=api_key, timeout_seconds=30.0, cache_sampled=True)
+        days = json.loads(content).get("days", [])
+
+        items, queries = _schedule_items(days, destination)
+        _apply_images(items, queries, await alookup_images(queries, deadline=_image_deadline()))
+        return days
+    except Exception as e:
+        raise UpstreamError(f"AI generation failed: {str(e)}", status=502)
+
+
+async def _adetect_intent(message: str, *, api_key: str, model: str) -> Dict[str, Any]:
+    if getattr(settings, 'GROQ_LOCAL_INTENT_ENABLED', True):
+        local = await sync_to_async(intent.classify)(message)
+        if local.confidence >= float(getattr(settings, 'GROQ_LOCAL_INTENT_MIN_CONFIDENCE', 0.7)):
+            intent.record('local')
+            return local.as_dict()
+    intent.record('llm_fallback')
+    content = await _acomplete(_intent_payload(message, model), api_key=api_key, timeout_seconds=15.0)
+    return json.loads(content)
+
+
+async def _aanswer_with_data(message: str, intent_data: Dict[str, Any]) -> Dict[str, Any] | None:
+    intent = intent_data.get('intent', 'general')
+
+    if intent == 'flight':
+        from landing.providers.amadeus import asearch_flights_offer
+        origin, dest, dep_date = _flight_params(intent_data)
+        try:
+            flights = await asearch_flights_offer(origin, dest, dep_date, limit=3)
+            if flights:
+                return _flight_answer(flights, origin, dest, dep_date)
+        except Exception as e:
+            print(f"Flight fetch error: {e}")
+
+    elif intent == 'hotel':
+        from landing.providers.serpapi import asearch_hotels
+        city, check_in, check_out = _hotel_params(intent_data)
+        try:
+            hotels = await asearch_hotels(city, check_in, check_out)
+            if hotels:
+                return _hotel_answer(hotels, city)
+        except Exception as e:
+            print(f"Hotel fetch error: {e}")
+
+    elif intent == 'destination':
+        from landing.providers.amadeus import asearch_cities
+        query = _destination_query(message, intent_data)
+        try:
+            cities = await asearch_cities(query, limit=3)
+            if cities:
+                return _destination_answer(cities, query)
+        except Exception as e:
+            print(f"Destination fetch error: {e}")
+
+    return None
+
+
+async def achat_with_ai(message: str, history: List[Dict] = None) -> Dict[str, Any]:
+    api_key = _api_key()
+    model = "llama-3.3-70b-versatile"
+
+    try:
+        intent_data = await _adetect_intent(message, api_key=api_key, model=model)
+        answer = await _aanswer_with_data(message, intent_data)
+        if answer:
+            return answer
+
+        content = await _acomplete(_general_payload(message, history, model), api_key=api_key, timeout_seconds=20.0)
+        return {'response': content}
+    except Exception as e:
+        raise UpstreamError(f"Chat failed: {str(e)}", status=502)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlencode
 
+from asgiref.sync import sync_to_async
 from decouple import config
+from django.conf import settings
 
-from landing.services.http import get_json
+from landing.services.cache import _key, _store, acache_get_or_set, cache_get_or_set
+from landing.services.city_index import normalize
+from landing.services.http import aget_json, get_json
 
 
 PEXELS_BASE = 'https://api.pexels.com/v1'
@@ -23,20 +28,58 @@ def _api_key() -> str:
     return config('PEXELS_API_KEY', default='')
 
 
-def search_image(query: str, *, per_page: int = 1, timeout_seconds: float = 6.0) -> PexelsImage | None:
-    key = _api_key()
-    if not key:
-        return None
+# Words callers add to steer Pexels ("Paris FR travel") that don't change which place is meant.
+_GENERIC_WORDS = frozenset({'travel', 'tourism', 'tourist', 'city', 'photo', 'photos', 'the', 'in', 'of'})
+
+_stats_lock = threading.Lock()
+_stats = {'lookups': 0, 'upstream_calls': 0, 'not_found': 0}
+
+
+def _bump(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def image_cache_stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def normalize_query(query: str) -> str:
+    """Cache identity of an image query: 'São Paulo BR travel' == 'sao paulo br'.
 
+    Accents, case, punctuation, generic words and word order are ignored, so
+    the variants built by different endpoints share one entry.
+    """
+    words = set(normalize(query).split())
+    meaningful = words - _GENERIC_WORDS
+    return ' '.join(sorted(meaningful or words))
+
+
+def _search_url(query: str, per_page: int) -> str:
     params = {
         'query': query,
         'per_page': per_page,
         'orientation': 'landscape',
         'size': 'large',
     }
-    url = f"{PEXELS_BASE}/search?{urlencode(params)}"
-    resp = get_json(url, headers={'Authorization': key}, timeout_seconds=timeout_seconds)
-    photos = (resp.data or {}).get('photos', [])
+    return f"{PEXELS_BASE}/search?{urlencode(params)}"
+
+
+def _fetch_image(query: str, *, key: str, per_page: int, timeout_seconds: float) -> dict | None:
+    _bump('upstream_calls')
+    resp = get_json(_search_url(query, per_page), headers={'Authorization': key}, timeout_seconds=timeout_seconds)
+    return _first_photo(resp.data)
+
+
+async def _afetch_image(query: str, *, key: str, per_page: int, timeout_seconds: float) -> dict | None:
+    _bump('upstream_calls')
+    resp = await aget_json(_search_url(query, per_page), headers={'Authorization': key}, timeout_seconds=timeout_seconds)
+    return _first_photo(resp.data)
+
+
+def _first_photo(data: Any) -> dict | None:
+    photos = (data or {}).get('photos', [])
     if not photos:
         return None
 
@@ -46,8 +89,72 @@ def search_image(query: str, *, per_page: int = 1, timeout_seconds: float = 6.0)
     if not image_url:
         return None
 
-    return PexelsImage(
-        url=str(image_url),
-        photographer=str((photo or {}).get('photographer')) if (photo or {}).get('photographer') else None,
-        raw=photo,
+    # Only what callers use is cached, not the full Pexels photo object.
+    return {
+        'id': (photo or {}).get('id'),
+        'url': str(image_url),
+        'photographer': str((photo or {}).get('photographer')) if (photo or {}).get('photographer') else None,
+    }
+
+
+def search_image(query: str, *, per_page: int = 1, timeout_seconds: float = 6.0) -> PexelsImage | None:
+    """First landscape photo for ``query``, shared across all endpoints.
+
+    Results are cached by normalised query for PEXELS_IMAGE_CACHE_TTL_SECONDS;
+    queries without a photo are remembered for PEXELS_IMAGE_NEGATIVE_TTL_SECONDS.
+    Upstream errors are raised and never cached.
+    """
+    key = _api_key()
+    if not key:
+        return None
+    normalized = normalize_query(query)
+    if not normalized:
+        return None
+
+    _bump('lookups')
+    payload = {'q': normalized}
+    ttl = int(getattr(settings, 'PEXELS_IMAGE_CACHE_TTL_SECONDS', 7 * 86400))
+    photo, cached = cache_get_or_set(
+        'pexels_image',
+        payload,
+        ttl,
+        lambda: _fetch_image(query, key=key, per_page=per_page, timeout_seconds=timeout_seconds),
     )
+    if photo is None:
+        if not cached:
+            _remember_not_found(payload)
+        return None
+
+    return PexelsImage(url=photo['url'], photographer=photo['photographer'], raw=photo)
+
+
+def _remember_not_found(payload: dict) -> None:
+    _bump('not_found')
+    negative_ttl = int(getattr(settings, 'PEXELS_IMAGE_NEGATIVE_TTL_SECONDS', 86400))
+    _store(_key('pexels_image', payload), None, negative_ttl, 0)
+
+
+async def asearch_image(query: str, *, per_page: int = 1, timeout_seconds: float = 6.0) -> PexelsImage | None:
+    """``search_image`` for async views; shares its cache entries."""
+    key = _api_key()
+    if not key:
+        return None
+    normalized = normalize_query(query)
+    if not normalized:
+        return None
+
+    _bump('lookups')
+    payload = {'q': normalized}
+    ttl = int(getattr(settings, 'PEXELS_IMAGE_CACHE_TTL_SECONDS', 7 * 86400))
+    photo, cached = await acache_get_or_set(
+        'pexels_image',
+        payload,
+        ttl,
+        lambda: _afetch_image(query, key=key, per_page=per_page, timeout_seconds=timeout_seconds),
+    )
+    if photo is None:
+        if not cached:
+            await sync_to_async(_remember_not_found, thread_sensitive=False)(payload)
+        return None
+
+    return PexelsImage(url=photo['url'], photographer=photo['photographer'], raw=photo)
@@ -2,16 +2,17 @@ from __future__ import annotations
 from typing import Any
 from urllib.parse import urlencode
 from decouple import config
-from landing.services.http import UpstreamError, get_json
+from django.conf import settings
+from landing.services.cache import acache_get_or_set, cache_get_or_set
+from landing.services.city_index import normalize
+from landing.services.http import UpstreamError, aget_json, get_json
+
+MAX_HOTELS = 6
 
 def _api_key() -> str:
     return config('SERPAPI_KEY', default='')
 
-def search_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float = 20.0) -> list[dict]:
-    """Search for hotels using SerpApi's Google Hotels engine.
-    
-    API docs: https://serpapi.com/google-hotels-api
-    """
+def _search_url(city_name: str, check_in_date: str, check_out_date: str) -> str:
     api_key = _api_key()
     if not api_key:
         raise UpstreamError('SerpApi (Google Hotels) is not configured', status=503)
@@ -26,13 +27,88 @@ def search_hotels(city_name: str, check_in_date: str, check_out_date: str, timeo
         'gl': 'in',
         'currency': 'INR',
     }
-    
-    url = f"https://serpapi.com/search?{urlencode(params)}"
-    
+    return f"https://serpapi.com/search?{urlencode(params)}"
+
+def _project(prop: dict) -> dict:
+    """The fields of a Google Hotels property that the trip builder and chat read.
+
+    Field names are SerpApi's, so callers are unaffected; only the first image is kept.
+    """
+    rate = prop.get('rate_per_night') or {}
+    images = prop.get('images') or []
+    thumbnail = (images[0] or {}).get('thumbnail') if images else None
+    return {
+        'name': prop.get('name'),
+        'description': prop.get('description'),
+        'overall_rating': prop.get('overall_rating'),
+        'reviews': prop.get('reviews'),
+        'hotel_class': prop.get('hotel_class'),
+        'rate_per_night': {k: rate[k] for k in ('lowest', 'extracted_lowest') if k in rate},
+        'images': [{'thumbnail': thumbnail}] if thumbnail else [],
+        'link': prop.get('link'),
+        'property_token': prop.get('property_token'),
+    }
+
+def _parse_hotels(data: Any) -> list[dict]:
+    # SerpApi returns results in 'properties' key for google_hotels
+    return [_project(p) for p in (data or {}).get('properties', [])[:MAX_HOTELS] if isinstance(p, dict)]
+
+def _hotel_query(city_name: str, check_in_date: str, check_out_date: str) -> dict:
+    return {'city': normalize(city_name), 'check_in': check_in_date, 'check_out': check_out_date}
+
+def _hotel_cache_ttl() -> int:
+    return int(getattr(settings, 'SERPAPI_HOTEL_CACHE_TTL_SECONDS', 6 * 3600))
+
+def _fetch_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float) -> list[dict]:
+    url = _search_url(city_name, check_in_date, check_out_date)
+
     try:
         resp = get_json(url, timeout_seconds=timeout_seconds)
-        data = resp.data or {}
-        # SerpApi returns results in 'properties' key for google_hotels
-        return data.get('properties', [])[:6]
+        return _parse_hotels(resp.data)
     except Exception as e:
         raise UpstreamError(f"Hotel search failed: {str(e)}", status=502)
+
+def find_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float = 20.0) -> tuple[list[dict], bool]:
+    """Hotels for a city and dates, cached for SERPAPI_HOTEL_CACHE_TTL_SECONDS.
+
+    Each SerpApi search is billed, so identical searches (city compared after
+    normalisation) share one call; errors are not cached. Hotels are never
+    served past the TTL, since rates and availability change. The second return
+    value is True when the hotels came from the cache.
+    """
+    return cache_get_or_set(
+        'hotels',
+        _hotel_query(city_name, check_in_date, check_out_date),
+        _hotel_cache_ttl(),
+        lambda: _fetch_hotels(city_name, check_in_date, check_out_date, timeout_seconds),
+        stale_ttl_seconds=0,
+    )
+
+def search_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float = 20.0) -> list[dict]:
+    """Search for hotels using SerpApi's Google Hotels engine.
+
+    API docs: https://serpapi.com/google-hotels-api
+    """
+    hotels, _ = find_hotels(city_name, check_in_date, check_out_date, timeout_seconds)
+    return hotels
+
+async def afind_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float = 20.0) -> tuple[list[dict], bool]:
+    """``find_hotels`` for async views; shares its cache entries."""
+
+    async def fetch():
+        url = _search_url(city_name, check_in_date, check_out_date)
+        try:
+            resp = await aget_json(url, timeout_seconds=timeout_seconds)
+            return _parse_hotels(resp.data)
+        except Exception as e:
+            raise UpstreamError(f"Hotel search failed: {str(e)}", status=502)
+
+    return await acache_get_or_set(
+        'hotels', _hotel_query(city_name, check_in_date, check_out_date), _hotel_cache_ttl(), fetch,
+        stale_ttl_seconds=0,
+    )
+
+async def asearch_hotels(city_name: str, check_in_date: str, check_out_date: str, timeout_seconds: float = 20.0) -> list[dict]:
+    """``search_hotels`` for async views."""
+    hotels, _ = await afind_hotels(city_name, check_in_date, check_out_date, timeout_seconds)
+    return hotels
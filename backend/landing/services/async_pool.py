@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import ssl
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from landing.services.pool import PoolStats, PoolTimeout, RawResponse
+
+
+# Same idea as pool._STALE_CONNECTION_ERRORS: the server closed an idle
+# keep-alive socket before answering. Only retried on a reused connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    asyncio.IncompleteReadError,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_MAX_HEADER_LINES = 100
+_NO_BODY_STATUSES = (204, 304)
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> tuple[int, str, dict[str, str]]:
+    line = await reader.readline()
+    if not line:
+        raise http.client.RemoteDisconnected('Remote end closed connection without response')
+    try:
+        version, status, *_ = line.decode('latin-1').split(None, 2)
+        status_code = int(status)
+    except ValueError:
+        raise http.client.BadStatusLine(line.decode('latin-1', errors='replace').strip())
+
+    headers: dict[str, str] = {}
+    for _ in range(_MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip()] = value.strip()
+    else:
+        raise http.client.HTTPException('Too many response headers')
+    return status_code, version, headers
+
+
+def _header(headers: dict[str, str], name: str) -> str:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return ''
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    parts = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b''.join(parts), None)
+        size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+        if size == 0:
+            # Trailers (rarely sent) end with a blank line.
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            return b''.join(parts)
+        parts.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+class AsyncHostPool:
+    """asyncio counterpart of ``pool.HostPool``: keep-alive connections for one (scheme, host, port).
+
+    Bound to the event loop it was created on; ``AsyncConnectionPool`` keeps one set per loop.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        *,
+        max_idle: int,
+        max_connections: int,
+        idle_timeout: float,
+        ssl_context: ssl.SSLContext | None,
+        stats: PoolStats,
+    ):
+        self.scheme = scheme
+        self.host = host
+        self.port = port or (443 if scheme == 'https' else 80)
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle: list[tuple[_Connection, float]] = []
+        self._stats = stats
+        default_port = 443 if scheme == 'https' else 80
+        self._host_header = host if self.port == default_port else f'{host}:{self.port}'
+
+    async def _new_connection(self) -> _Connection:
+        self._stats.connections_opened += 1
+        reader, writer = await asyncio.open_connection(
+            self.host,
+            self.port,
+            ssl=self._ssl_context,
+            server_hostname=self.host if self._ssl_context else None,
+        )
+        return _Connection(reader, writer)
+
+    def _take_idle(self) -> _Connection | None:
+        now = time.monotonic()
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if now - last_used <= self.idle_timeout and not conn.reader.at_eof():
+                self._stats.connections_reused += 1
+                return conn
+            self._stats.connections_discarded += 1
+            conn.close()
+        return None
+
+    def _put_idle(self, conn: _Connection) -> None:
+        if len(self._idle) < self.max_idle:
+            self._idle.append((conn, time.monotonic()))
+            return
+        self._stats.connections_discarded += 1
+        conn.close()
+
+    def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def _encode(self, method: str, target: str, body: bytes | None, headers: dict[str, str]) -> bytes:
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {self._host_header}']
+        names = {k.lower() for k in headers}
+        if 'accept-encoding' not in names:
+            lines.append('Accept-Encoding: identity')
+        lines.extend(f'{k}: {v}' for k, v in headers.items())
+        if body is not None or method in ('POST', 'PUT', 'PATCH'):
+            lines.append(f'Content-Length: {len(body or b"")}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+    async def _exchange(self, conn: _Connection, method: str, request: bytes) -> tuple[RawResponse, bool]:
+        """Send one request and read the whole response; returns it and whether the socket is reusable."""
+        conn.writer.write(request)
+        await conn.writer.drain()
+
+        status, version, headers = await _read_headers(conn.reader)
+        while status == 100:
+            status, version, headers = await _read_headers(conn.reader)
+
+        connection = _header(headers, 'connection').lower()
+        keep_alive = 'close' not in connection and (version != 'HTTP/1.0' or 'keep-alive' in connection)
+
+        if method == 'HEAD' or status in _NO_BODY_STATUSES or 100 <= status < 200:
+            body = b''
+        elif 'chunked' in _header(headers, 'transfer-encoding').lower():
+            body = await _read_chunked(conn.reader)
+        elif _header(headers, 'content-length'):
+            body = await conn.reader.readexactly(int(_header(headers, 'content-length')))
+        else:
+            body = await conn.reader.read()
+            keep_alive = False
+        return RawResponse(status=status, headers=headers, body=body), keep_alive
+
+    async def _request(self, method: str, target: str, body: bytes | None, headers: dict[str, str]) -> RawResponse:
+        request = self._encode(method, target, body, headers)
+        conn = self._take_idle()
+        reused = conn is not None
+        if conn is None:
+            conn = await self._new_connection()
+
+        while True:
+            try:
+                raw, keep_alive = await self._exchange(conn, method, request)
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive socket; retry once on a fresh one.
+                reused = False
+                conn = await self._new_connection()
+            except BaseException:
+                # Includes cancellation by the timeout: the socket is mid-response.
+                conn.close()
+                raise
+
+        self._stats.requests += 1
+        if keep_alive:
+            self._put_idle(conn)
+        else:
+            conn.close()
+        return raw
+
+    async def request(self, method: str, target: str, body: bytes | None, headers: dict[str, str], timeout: float) -> RawResponse:
+        """Like ``HostPool.request``; ``timeout`` bounds the slot wait, then the whole exchange."""
+        if self._slots.locked():
+            self._stats.waits += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(f'No free connection to {self.host} within {timeout}s') from None
+        try:
+            return await asyncio.wait_for(self._request(method, target, body, headers), timeout)
+        finally:
+            self._slots.release()
+
+
+class AsyncConnectionPool:
+    """Per-host asyncio keep-alive pools for one event loop (no locking needed within a loop)."""
+
+    def __init__(self, *, max_idle: int = 10, max_connections: int = 20, idle_timeout: float = 60.0, stats: PoolStats | None = None):
+        self.max_idle = max_idle
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.stats = stats or PoolStats()
+        self._ssl_context = ssl.create_default_context()
+        self._hosts: dict[tuple[str, str, int | None], AsyncHostPool] = {}
+
+    def _host_pool(self, scheme: str, host: str, port: int | None) -> AsyncHostPool:
+        key = (scheme, host, port)
+        pool = self._hosts.get(key)
+        if pool is None:
+            pool = self._hosts[key] = AsyncHostPool(
+                scheme,
+                host,
+                port,
+                max_idle=self.max_idle,
+                max_connections=self.max_connections,
+                idle_timeout=self.idle_timeout,
+                ssl_context=self._ssl_context if scheme == 'https' else None,
+                stats=self.stats,
+            )
+        return pool
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 6.0,
+    ) -> RawResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'Unsupported URL: {url}')
+        target = parts.path or '/'
+        if parts.query:
+            target = f'{target}?{parts.query}'
+        pool = self._host_pool(parts.scheme, parts.hostname, parts.port)
+        return await pool.request(method, target, body, headers or {}, timeout)
+
+    def idle_connections(self) -> int:
+        return sum(len(p._idle) for p in self._hosts.values())
+
+    def close(self) -> None:
+        pools, self._hosts = list(self._hosts.values()), {}
+        for pool in pools:
+            pool.close()
+
+
+# Sockets belong to the loop that opened them, so each loop gets its own pool.
+# Under uvicorn/daphne that is a single loop; async_to_sync may create short-lived ones.
+_loop_pools: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool]' = weakref.WeakKeyDictionary()
+_loop_pools_lock = threading.Lock()
+_stats = PoolStats()
+
+
+def get_async_pool() -> AsyncConnectionPool:
+    """Pool for the running event loop, configured from the same ``OUTBOUND_HTTP_POOL_*`` settings."""
+    loop = asyncio.get_running_loop()
+    with _loop_pools_lock:
+        pool = _loop_pools.get(loop)
+        if pool is None:
+            pool = _loop_pools[loop] = AsyncConnectionPool(
+                max_idle=int(getattr(settings, 'OUTBOUND_HTTP_POOL_MAXSIZE', 10)),
+                max_connections=int(getattr(settings, 'OUTBOUND_HTTP_MAX_PER_HOST', 20)),
+                idle_timeout=float(getattr(settings, 'OUTBOUND_HTTP_POOL_IDLE_SECONDS', 60.0)),
+                stats=_stats,
+            )
+    return pool
+
+
+def async_pool_snapshot() -> dict[str, int]:
+    """Counters across all loops, in the same shape as ``ConnectionPool.snapshot``."""
+    with _loop_pools_lock:
+        pools = list(_loop_pools.values())
+    return {
+        'loops': len(pools),
+        'hosts': sum(len(p._hosts) for p in pools),
+        'idle_connections': sum(p.idle_connections() for p in pools),
+        'connections_opened': _stats.connections_opened,
+        'connections_reused': _stats.connections_reused,
+        'connections_discarded': _stats.connections_discarded,
+        'requests': _stats.requests,
+        'waits': _stats.waits,
+    }
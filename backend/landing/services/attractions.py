@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import transaction
+
+from landing.services.city_index import normalize
+from landing.services.http import UpstreamError, get_json
+
+
+# The largest ?limit= the attractions views accept; prefetched cities store this many.
+PREFETCH_LIMIT = 40
+# Wikipedia returns intro extracts for at most 20 pages per request.
+_DETAILS_BATCH = 20
+_PAGE_PROPS = "&prop=pageimages%7Cextracts%7Cdescription"
+_EXTRACT_PARAMS = (
+    "&piprop=thumbnail"
+    "&pithumbsize=400"
+    "&exintro=1"
+    "&explaintext=1"
+    "&exsentences=2"
+)
+
+
+def _search(city: str, limit: int) -> str:
+    search = f"tourist attractions in {city}"
+    return (
+        "https://en.wikipedia.org/w/api.php"
+        "?action=query"
+        "&format=json"
+        "&origin=*"
+        "&generator=search"
+        f"&gsrsearch={search.replace(' ', '%20')}"
+        f"&gsrlimit={limit}"
+        "&gsrnamespace=0"
+    )
+
+
+def attractions_url(city: str, limit: int) -> str:
+    return _search(city, limit) + _PAGE_PROPS + _EXTRACT_PARAMS + "&redirects=1"
+
+
+def _revisions_url(city: str, limit: int) -> str:
+    # Page ids, search positions and latest revision ids only: no extracts or images.
+    return _search(city, limit) + "&prop=info&redirects=1"
+
+
+def _details_url(page_ids: list[int]) -> str:
+    return (
+        "https://en.wikipedia.org/w/api.php"
+        "?action=query"
+        "&format=json"
+        "&origin=*"
+        f"&pageids={'%7C'.join(str(p) for p in page_ids)}"
+        f"&exlimit={_DETAILS_BATCH}"
+        + _PAGE_PROPS + "%7Cinfo"
+        + _EXTRACT_PARAMS
+    )
+
+
+def _pages(data: Any) -> dict:
+    return ((data or {}).get('query') or {}).get('pages') or {}
+
+
+def _required_pages(data: Any) -> dict:
+    """``query.pages`` of a prefetch response; raises UpstreamError when it is missing.
+
+    Error and maxlag bodies have no ``query``, and neither has an empty search;
+    treating any of them as "no pages listed" would delete the city's rows.
+    """
+    pages = _pages(data)
+    if not pages:
+        error = (data or {}).get('error') if isinstance(data, dict) else None
+        raise UpstreamError('Wikipedia returned no pages', details=error)
+    return pages
+
+
+def _attraction(page: dict, city: str) -> dict | None:
+    """The attraction for a Wikipedia page, or None when it isn't about a place in ``city``."""
+    title = (page.get('title') or '').strip()
+    if not title:
+        return None
+    city_lower = city.lower()
+    if title.lower() == city_lower:
+        return None
+
+    title_lower = title.lower()
+    if title_lower.startswith('lists of tourist attractions'):
+        return None
+
+    thumb = (page.get('thumbnail') or {}).get('source')
+    extract = (page.get('extract') or '').strip()
+    desc = (page.get('description') or '').strip()
+    pageid = page.get('pageid')
+
+    # Keep results relevant to the selected destination.
+    extract_lower = extract.lower() if extract else ''
+    if city_lower not in title_lower and city_lower not in extract_lower:
+        return None
+
+    return {
+        'name': title,
+        'description': extract or desc or '',
+        'image_url': thumb,
+        'source': 'wikipedia',
+        'source_url': f"https://en.wikipedia.org/?curid={pageid}" if pageid else None,
+    }
+
+
+def parse_attractions(data: dict, city: str, limit: int) -> list[dict]:
+    out = []
+    for page in _pages(data).values():
+        item = _attraction(page, city)
+        if item is not None:
+            out.append(item)
+    return out[:limit]
+
+
+def stored_attractions(city: str, limit: int) -> list[dict] | None:
+    """Prefetched attractions for ``city`` in search order; None if it was never prefetched."""
+    from landing.models import Attraction
+
+    rows = list(Attraction.objects.filter(city_key=normalize(city)).order_by('rank'))
+    if not rows:
+        return None
+    return [row.as_dict() for row in rows if row.relevant][:limit]
+
+
+def prefetch_attractions(city: str, *, full: bool = False, timeout_seconds: float = 6.0) -> dict[str, int]:
+    """Store the attractions Wikipedia lists for ``city`` in the Attraction table.
+
+    One search request returns the listed pages with their latest revision ids;
+    extracts and thumbnails are then fetched only for pages that are new or
+    whose revision changed (all of them with ``full``). Pages that dropped out
+    of the results are deleted. A response without pages raises UpstreamError and
+    leaves the stored rows alone. Returns counts of fetched, unchanged and removed pages.
+    """
+    from landing.models import Attraction
+
+    key = normalize(city)
+    listed = {
+        int(page['pageid']): page
+        for page in _required_pages(get_json(_revisions_url(city, PREFETCH_LIMIT), timeout_seconds=timeout_seconds).data).values()
+        if page.get('pageid')
+    }
+    if not listed:
+        raise UpstreamError(f'Wikipedia listed no pages for {city}')
+    stored = {
+        page_id: (revision_id, rank)
+        for page_id, revision_id, rank in Attraction.objects.filter(city_key=key).values_list('page_id', 'revision_id', 'rank')
+    }
+    changed = [
+        page_id for page_id, page in listed.items()
+        if full or stored.get(page_id, (None,))[0] != page.get('lastrevid')
+    ]
+
+    details: dict[int, dict] = {}
+    for start in range(0, len(changed), _DETAILS_BATCH):
+        batch = changed[start:start + _DETAILS_BATCH]
+        resp = get_json(_details_url(batch), timeout_seconds=timeout_seconds)
+        details.update({int(page['pageid']): page for page in _required_pages(resp.data).values() if page.get('pageid')})
+
+    with transaction.atomic():
+        removed, _ = Attraction.objects.filter(city_key=key).exclude(page_id__in=list(listed)).delete()
+        for page_id, listing in listed.items():
+            rank = int(listing.get('index') or 0)
+            page = details.get(page_id)
+            if page is None:
+                if page_id in stored and stored[page_id][1] != rank:
+                    Attraction.objects.filter(city_key=key, page_id=page_id).update(rank=rank)
+                continue
+            item = _attraction(page, city)
+            Attraction.objects.update_or_create(
+                city_key=key,
+                page_id=page_id,
+                defaults={
+                    'city': city,
+                    'revision_id': int(page.get('lastrevid') or listing.get('lastrevid') or 0),
+                    'rank': rank,
+                    'relevant': item is not None,
+                    'name': (item or {}).get('name') or (page.get('title') or '')[:255],
+                    'description': (item or {}).get('description') or '',
+                    'image_url': (item or {}).get('image_url'),
+                },
+            )
+
+    return {
+        'fetched': len(details),
+        'unchanged': len(listed) - len(details),
+        'removed': removed,
+    }
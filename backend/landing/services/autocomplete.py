@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import threading
+import time
+from typing import Any, Iterable
+
+from django.conf import settings
+
+from landing.providers.geoapify import autocomplete_cities
+from landing.services import city_index
+from landing.services.cache import _key, cache
+from landing.services.city_index import normalize
+from landing.services.http import UpstreamError
+
+
+logger = logging.getLogger(__name__)
+
+# Prefixes up to this length get their top results precomputed at build time;
+# they match the most names, so scanning them per keystroke would be the slow case.
+_PRECOMPUTED_PREFIX_LENGTH = 3
+_MAX_LIMIT = 20
+_EXTRA_KEY = _key('autocomplete_extra', {'source': 'geoapify'})
+
+
+class Autocompleter:
+    """Sorted-array prefix index over city names, ranked by popularity.
+
+    Entries are stored most popular first, so an entry's position is its rank
+    and the top-k for a prefix are the k smallest positions in its bisect range.
+    """
+
+    def __init__(self, entries: Iterable[dict[str, Any]]):
+        ordered = sorted(entries, key=lambda e: (-e['popularity'], e['name']))
+        self.entries: list[dict[str, Any]] = ordered
+        keys: list[tuple[str, int]] = []
+        for pos, entry in enumerate(ordered):
+            words = normalize(entry['name']).split()
+            for i in range(len(words)):
+                keys.append((' '.join(words[i:]), pos))
+        keys.sort()
+        self._key_strings = [k for k, _ in keys]
+        self._key_positions = [p for _, p in keys]
+
+        top: dict[str, list[int]] = {}
+        for key, pos in keys:
+            for length in range(1, min(len(key), _PRECOMPUTED_PREFIX_LENGTH) + 1):
+                top.setdefault(key[:length], []).append(pos)
+        self._top = {prefix: sorted(set(positions))[:_MAX_LIMIT] for prefix, positions in top.items()}
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def complete(self, query: str, *, limit: int = 8) -> list[dict[str, Any]]:
+        q = normalize(query)
+        if not q:
+            return []
+        limit = max(1, min(limit, _MAX_LIMIT))
+        if len(q) <= _PRECOMPUTED_PREFIX_LENGTH:
+            positions = self._top.get(q, [])[:limit]
+        else:
+            start = bisect.bisect_left(self._key_strings, q)
+            end = bisect.bisect_left(self._key_strings, q + '\uffff', lo=start)
+            positions = heapq.nsmallest(limit, set(self._key_positions[start:end]))
+        return [self.entries[p] for p in positions]
+
+
+def _entries() -> list[dict[str, Any]]:
+    """Merge core.City rows, indexed/learned provider cities and cached Geoapify results.
+
+    Names are matched after normalisation; a DB row supplies the ranking score
+    and the provider data fills in the IATA code and coordinates.
+    """
+    from core.models import City
+
+    merged: dict[str, dict[str, Any]] = {}
+
+    def add(name: str, *, country, code=None, lat=None, lon=None, popularity=0.0, source: str) -> None:
+        norm = normalize(name)
+        if not norm:
+            return
+        entry = merged.get(norm)
+        if entry is None:
+            merged[norm] = {
+                'name': name.strip().title() if name.isupper() else name.strip(),
+                'country': country,
+                'code': code,
+                'lat': lat,
+                'lon': lon,
+                'popularity': float(popularity or 0.0),
+                'source': source,
+            }
+            return
+        for field, value in (('code', code), ('lat', lat), ('lon', lon), ('country', country)):
+            if entry[field] is None and value is not None:
+                entry[field] = value
+
+    for name, country, score in City.objects.values_list('name', 'country', 'popularity_score'):
+        add(name, country=country, popularity=score, source='catalog')
+
+    index_places = [*city_index.get_index().places, *city_index.learned_places()]
+    for place in index_places:
+        if place.subtype == city_index.CITY:
+            add(place.name, country=place.country, code=place.code, lat=place.lat, lon=place.lon,
+                popularity=place.popularity, source='index')
+
+    for item in cache.get(_EXTRA_KEY) or []:
+        add(item['name'], country=item.get('country'), lat=item.get('lat'), lon=item.get('lon'), source='geoapify')
+
+    return list(merged.values())
+
+
+_lock = threading.Lock()
+_completer: Autocompleter | None = None
+
+
+def get_completer() -> Autocompleter:
+    """Process-wide completer, rebuilt every LANDING_AUTOCOMPLETE_REBUILD_SECONDS.
+
+    Only one thread rebuilds; the others keep answering from the previous copy.
+    """
+    global _completer
+    interval = float(getattr(settings, 'LANDING_AUTOCOMPLETE_REBUILD_SECONDS', 300))
+    current = _completer
+    if current is not None and time.monotonic() - current.built_at < interval:
+        return current
+    if current is not None and not _lock.acquire(blocking=False):
+        return current
+    if current is None:
+        _lock.acquire()
+    try:
+        if _completer is None or _completer is current:
+            _completer = Autocompleter(_entries())
+        return _completer
+    finally:
+        _lock.release()
+
+
+def complete(query: str, *, limit: int = 8) -> list[dict[str, Any]]:
+    return get_completer().complete(query, limit=limit)
+
+
+def warm_from_geoapify(queries: Iterable[str], *, timeout_seconds: float = 6.0) -> int:
+    """Store Geoapify city suggestions for ``queries`` in the shared cache.
+
+    Used by ``build_city_index --geoapify`` to cover catalog-less places;
+    workers pick them up on their next rebuild.
+    """
+    extra = {normalize(item['name']): item for item in cache.get(_EXTRA_KEY) or []}
+    for query in queries:
+        try:
+            places = autocomplete_cities(query, limit=5, timeout_seconds=timeout_seconds)
+        except UpstreamError:
+            logger.warning('Geoapify autocomplete failed for %r', query, exc_info=True)
+            continue
+        for place in places:
+            extra.setdefault(normalize(place.name), {
+                'name': place.name,
+                'country': place.country,
+                'lat': place.lat,
+                'lon': place.lon,
+            })
+    cache.set(_EXTRA_KEY, list(extra.values()), timeout=None)
+    return len(extra)
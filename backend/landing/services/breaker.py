@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from django.conf import settings
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Latency samples needed before a timeout is derived from them.
+_MIN_SAMPLES = 20
+_WINDOW = 200
+
+
+class LatencyWindow:
+    """Recent successful call latencies for one class of request."""
+
+    def __init__(self, size: int = _WINDOW):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        if len(self._samples) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one upstream host.
+
+    Opens after ``failure_threshold`` consecutive failures. While open, calls
+    are rejected until ``reset_seconds`` have passed; then a single probe is let
+    through (half-open). A successful probe closes the breaker, a failed one
+    re-opens it.
+    """
+
+    def __init__(self, host: str, *, failure_threshold: int, reset_seconds: float):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._latency: dict[Any, LatencyWindow] = {}
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.total_rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+
+    def record_success(self, latency_key: Any, seconds: float) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._state = CLOSED
+            self._probe_in_flight = False
+            self._latency.setdefault(latency_key, LatencyWindow()).add(seconds)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.total_failures += 1
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.times_opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def timeout_for(self, latency_key: Any, configured: float) -> float:
+        """Derive a timeout from observed p99 latency, never above the configured one."""
+        if not getattr(settings, 'OUTBOUND_ADAPTIVE_TIMEOUTS', True):
+            return configured
+        with self._lock:
+            window = self._latency.get(latency_key)
+            p99 = window.percentile(0.99) if window is not None else None
+        if p99 is None:
+            return configured
+        multiplier = float(getattr(settings, 'OUTBOUND_ADAPTIVE_TIMEOUT_MULTIPLIER', 3.0))
+        floor = float(getattr(settings, 'OUTBOUND_ADAPTIVE_TIMEOUT_MIN_SECONDS', 1.0))
+        return min(configured, max(floor, p99 * multiplier))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            latency = {}
+            for key, window in self._latency.items():
+                p50, p99 = window.percentile(0.5), window.percentile(0.99)
+                latency[' '.join(str(part) for part in key)] = {
+                    'samples': len(window),
+                    'p50_ms': round(p50 * 1000, 1) if p50 is not None else None,
+                    'p99_ms': round(p99 * 1000, 1) if p99 is not None else None,
+                }
+            return {
+                'state': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'total_failures': self.total_failures,
+                'total_rejected': self.total_rejected,
+                'times_opened': self.times_opened,
+                'latency': latency,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=int(getattr(settings, 'OUTBOUND_BREAKER_FAILURE_THRESHOLD', 5)),
+                reset_seconds=float(getattr(settings, 'OUTBOUND_BREAKER_RESET_SECONDS', 30.0)),
+            )
+        return breaker
+
+
+def breaker_states() -> dict[str, dict[str, Any]]:
+    """Per-host breaker state and latency percentiles for monitoring."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.host: b.snapshot() for b in breakers}
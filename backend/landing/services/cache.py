@@ -1,10 +1,116 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from django.core.cache import cache
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.utils.connection import ConnectionProxy
+
+from landing.services import store
+
+
+logger = logging.getLogger(__name__)
+
+# Landing data lives in its own (tiered) cache alias when configured.
+_CACHE_ALIAS = getattr(settings, 'LANDING_CACHE_ALIAS', 'default')
+cache = ConnectionProxy(caches, _CACHE_ALIAS if _CACHE_ALIAS in settings.CACHES else 'default')
+
+_POLL_INTERVAL_SECONDS = 0.05
+_ENVELOPE_MARKER = '__landing_swr__'
+
+_stats_lock = threading.Lock()
+_stats = {
+    'hits': 0,
+    'misses': 0,
+    'computed': 0,
+    'coalesced_local': 0,
+    'coalesced_remote': 0,
+    'wait_timeouts': 0,
+    'stale_served': 0,
+    'refreshes': 0,
+    'refresh_failures': 0,
+    'restored': 0,
+}
+
+
+def _bump(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def cache_stats() -> dict[str, Any]:
+    """Counters for monitoring; ``coalesced`` is how many callers reused another's compute."""
+    with _stats_lock:
+        snapshot: dict[str, Any] = dict(_stats)
+    snapshot['coalesced'] = snapshot['coalesced_local'] + snapshot['coalesced_remote']
+    tier_stats = getattr(cache, 'stats', None)
+    if callable(tier_stats):
+        snapshot['tiers'] = tier_stats()
+    return snapshot
+
+
+def _stale_ttl(stale_ttl_seconds: int | None) -> int:
+    if stale_ttl_seconds is not None:
+        return max(0, int(stale_ttl_seconds))
+    return max(0, int(getattr(settings, 'LANDING_CACHE_STALE_TTL_SECONDS', 0)))
+
+
+def _store(key: str, value: Any, ttl_seconds: int, stale_ttl_seconds: int) -> None:
+    """Store ``value`` fresh for ``ttl_seconds`` (soft TTL) and servable as stale until the hard TTL."""
+    envelope = {
+        _ENVELOPE_MARKER: 1,
+        'value': value,
+        'fresh_until': time.time() + ttl_seconds,
+    }
+    cache.set(key, envelope, timeout=ttl_seconds + stale_ttl_seconds)
+    if value is not None and store.persists(key):
+        store.save(key, value, envelope['fresh_until'], ttl_seconds + stale_ttl_seconds)
+
+
+def _restore(key: str) -> Any:
+    """On a cache miss, put the persisted copy of ``key`` back into the cache and return its envelope."""
+    if not store.persists(key):
+        return None
+    entry = store.load(key)
+    if entry is None:
+        return None
+    value, fresh_until, timeout = entry
+    envelope = {_ENVELOPE_MARKER: 1, 'value': value, 'fresh_until': fresh_until}
+    cache.set(key, envelope, timeout=timeout)
+    _bump('restored')
+    return envelope
+
+
+def cache_preload(prefixes: list[str] | None = None) -> int:
+    """Copy every unexpired persisted entry (by default under the persisted prefixes) into the cache.
+
+    Used at deploy time so the shared cache is full before traffic arrives;
+    returns the number of entries loaded.
+    """
+    if not store.is_enabled():
+        return 0
+    count = 0
+    for key, value, fresh_until, timeout in store.iter_entries(prefixes or store.persisted_prefixes()):
+        cache.set(key, {_ENVELOPE_MARKER: 1, 'value': value, 'fresh_until': fresh_until}, timeout=timeout)
+        count += 1
+    return count
+
+
+def _unwrap(raw: Any) -> tuple[Any, bool]:
+    """Return (value, is_fresh). Entries written before soft TTLs existed count as fresh."""
+    if isinstance(raw, dict) and raw.get(_ENVELOPE_MARKER) == 1:
+        return raw.get('value'), time.time() < float(raw.get('fresh_until') or 0)
+    return raw, True
 
 
 def _key(prefix: str, payload: Any, version: str = 'v4') -> str:
@@ -14,13 +120,321 @@ def _key(prefix: str, payload: Any, version: str = 'v4') -> str:
     return f"landing:{version}:{prefix}:{digest}"
 
 
-def cache_get_or_set(prefix: str, payload: Any, ttl_seconds: int, compute, version: str = 'v4'):
-    """Cache helper with versioning to prevent stale data."""
+class _Flight:
+    """One in-progress compute that other threads in this process can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+
+
+def _wait_timeout() -> float:
+    return float(getattr(settings, 'LANDING_SINGLE_FLIGHT_TIMEOUT_SECONDS', 10.0))
+
+
+def _compute_with_lease(key: str, ttl_seconds: int, stale_ttl_seconds: int, compute) -> tuple[Any, bool]:
+    """Compute under a cache-backed lease so only one process hits the upstream.
+
+    If another process holds the lease, poll for its result until the wait
+    timeout, then fall back to computing locally.
+    """
+    lease_key = f'{key}:lease'
+    token = uuid.uuid4().hex
+    timeout = _wait_timeout()
+
+    if not cache.add(lease_key, token, timeout=max(1, int(timeout) + 1)):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL_SECONDS)
+            existing = cache.get(key)
+            if existing is not None:
+                _bump('coalesced_remote')
+                return _unwrap(existing)[0], True
+            if cache.add(lease_key, token, timeout=max(1, int(timeout) + 1)):
+                break
+        else:
+            _bump('wait_timeouts')
+
+    try:
+        value = compute()
+        _bump('computed')
+        _store(key, value, ttl_seconds, stale_ttl_seconds)
+        return value, False
+    finally:
+        if cache.get(lease_key) == token:
+            cache.delete(lease_key)
+
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    # Kept apart from the fan-out pool: refreshes call compute(), which may itself fan out.
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=int(getattr(settings, 'LANDING_CACHE_REFRESH_WORKERS', 4)),
+                    thread_name_prefix='landing-refresh',
+                )
+    return _refresh_executor
+
+
+def _refresh_in_background(key: str, ttl_seconds: int, stale_ttl_seconds: int, compute) -> None:
+    """Recompute a stale entry off the request path; at most one refresh per key at a time.
+
+    On failure the lease is left to expire, which backs off retries for
+    LANDING_CACHE_REFRESH_RETRY_SECONDS while the stale value keeps being served.
+    """
+    lease_key = f'{key}:refresh'
+    retry_seconds = max(1, int(getattr(settings, 'LANDING_CACHE_REFRESH_RETRY_SECONDS', 60)))
+    if not cache.add(lease_key, 1, timeout=retry_seconds):
+        return
+
+    def run():
+        try:
+            value = compute()
+            _store(key, value, ttl_seconds, stale_ttl_seconds)
+            _bump('refreshes')
+            cache.delete(lease_key)
+        except Exception:
+            _bump('refresh_failures')
+            logger.warning('Background refresh of %s failed; serving stale data', key, exc_info=True)
+        finally:
+            connections.close_all()
+
+    _get_refresh_executor().submit(run)
+
+
+def cache_get_or_set(
+    prefix: str,
+    payload: Any,
+    ttl_seconds: int,
+    compute,
+    version: str = 'v4',
+    *,
+    stale_ttl_seconds: int | None = None,
+):
+    """Cache helper with versioning to prevent stale data.
+
+    ``ttl_seconds`` is the soft TTL. For ``stale_ttl_seconds`` after that
+    (default LANDING_CACHE_STALE_TTL_SECONDS) the old value is still returned
+    immediately while one background refresh recomputes it; if the refresh
+    fails, the stale value keeps being served until the hard TTL.
+
+    Concurrent misses for the same key are coalesced: one caller computes and the
+    rest wait for its result (threads via an in-process flight, other processes
+    via a lease in the cache). The second return value is True when the value
+    was not computed by this caller.
+
+    Stored values are also written to the persistent provider store, which is
+    read on a cache miss (see ``landing.services.store``).
+    """
     key = _key(prefix, payload, version=version)
+    stale_ttl = _stale_ttl(stale_ttl_seconds)
     existing = cache.get(key)
+    if existing is None:
+        existing = _restore(key)
     if existing is not None:
-        return existing, True
+        value, fresh = _unwrap(existing)
+        if fresh:
+            _bump('hits')
+        else:
+            _bump('stale_served')
+            _refresh_in_background(key, ttl_seconds, stale_ttl, compute)
+        return value, True
+
+    _bump('misses')
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if flight.done.wait(_wait_timeout()):
+            if flight.error is not None:
+                raise flight.error
+            _bump('coalesced_local')
+            return flight.value, True
+        # The leader is taking too long; stop waiting and compute ourselves.
+        _bump('wait_timeouts')
+        value = compute()
+        _bump('computed')
+        _store(key, value, ttl_seconds, stale_ttl)
+        return value, False
+
+    try:
+        flight.value, cached = _compute_with_lease(key, ttl_seconds, stale_ttl, compute)
+        return flight.value, cached
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+
+
+# Cache backends are synchronous (Redis/file/locmem); run them off the event loop.
+_aget = sync_to_async(lambda key: cache.get(key), thread_sensitive=False)
+_aadd = sync_to_async(lambda key, value, timeout: cache.add(key, value, timeout=timeout), thread_sensitive=False)
+_astore = sync_to_async(_store, thread_sensitive=False)
+_arestore = sync_to_async(_restore, thread_sensitive=False)
+
+_aflights: dict[tuple[int, str], asyncio.Future] = {}
+_arefresh_tasks: set[asyncio.Task] = set()
+
+
+async def _arefresh_in_background(key: str, ttl_seconds: int, stale_ttl_seconds: int, acompute) -> None:
+    lease_key = f'{key}:refresh'
+    retry_seconds = max(1, int(getattr(settings, 'LANDING_CACHE_REFRESH_RETRY_SECONDS', 60)))
+    if not await _aadd(lease_key, 1, retry_seconds):
+        return
 
+    async def run():
+        try:
+            value = await acompute()
+            await _astore(key, value, ttl_seconds, stale_ttl_seconds)
+            _bump('refreshes')
+            await sync_to_async(cache.delete, thread_sensitive=False)(lease_key)
+        except Exception:
+            _bump('refresh_failures')
+            logger.warning('Background refresh of %s failed; serving stale data', key, exc_info=True)
+
+    # Keep a reference so the task is not garbage collected mid-flight.
+    task = asyncio.get_running_loop().create_task(run())
+    _arefresh_tasks.add(task)
+    task.add_done_callback(_arefresh_tasks.discard)
+
+
+async def acache_get_or_set(
+    prefix: str,
+    payload: Any,
+    ttl_seconds: int,
+    acompute,
+    version: str = 'v4',
+    *,
+    stale_ttl_seconds: int | None = None,
+):
+    """``cache_get_or_set`` for async views; ``acompute`` is a coroutine function.
+
+    Same keys, envelopes and stale-while-revalidate behaviour, so sync and async
+    views share entries. Concurrent misses are coalesced per event loop; there is
+    no cross-process lease, so another process may compute the same key at once.
+    """
+    key = _key(prefix, payload, version=version)
+    stale_ttl = _stale_ttl(stale_ttl_seconds)
+    existing = await _aget(key)
+    if existing is None:
+        existing = await _arestore(key)
+    if existing is not None:
+        value, fresh = _unwrap(existing)
+        if fresh:
+            _bump('hits')
+        else:
+            _bump('stale_served')
+            await _arefresh_in_background(key, ttl_seconds, stale_ttl, acompute)
+        return value, True
+
+    _bump('misses')
+    loop = asyncio.get_running_loop()
+    flight_key = (id(loop), key)
+    flight = _aflights.get(flight_key)
+    if flight is not None:
+        try:
+            value = await asyncio.wait_for(asyncio.shield(flight), _wait_timeout())
+        except asyncio.TimeoutError:
+            _bump('wait_timeouts')
+        except asyncio.CancelledError:
+            if not flight.cancelled():
+                raise
+            # The leader's request was cancelled (client went away); compute ourselves.
+        else:
+            _bump('coalesced_local')
+            return value, True
+
+    flight = _aflights[flight_key] = loop.create_future()
+    try:
+        value = await acompute()
+        _bump('computed')
+        await _astore(key, value, ttl_seconds, stale_ttl)
+        flight.set_result(value)
+        return value, False
+    except asyncio.CancelledError:
+        flight.cancel()
+        raise
+    except BaseException as e:
+        flight.set_exception(e)
+        # Waiters re-raise it; mark it retrieved so an unwaited flight does not log a warning.
+        flight.exception()
+        raise
+    finally:
+        if _aflights.get(flight_key) is flight:
+            del _aflights[flight_key]
+
+
+def cache_refresh(
+    prefix: str,
+    payload: Any,
+    ttl_seconds: int,
+    compute,
+    version: str = 'v4',
+    *,
+    stale_ttl_seconds: int | None = None,
+    min_age_seconds: float = 0,
+):
+    """Recompute and overwrite a cache entry (used by background warm-up).
+
+    Every worker runs its own warm-up, so the rebuild takes the same ``:refresh``
+    lease as the stale-while-revalidate path and is skipped (returning None) while
+    another process holds it, or when the entry was stored less than
+    ``min_age_seconds`` ago. A failing ``compute`` leaves the existing entry and
+    the lease in place, backing off retries like a failed background refresh.
+    """
+    key = _key(prefix, payload, version=version)
+    if min_age_seconds:
+        raw = cache.get(key)
+        if isinstance(raw, dict) and raw.get(_ENVELOPE_MARKER):
+            stored_at = raw['fresh_until'] - ttl_seconds
+            if time.time() - stored_at < min_age_seconds:
+                return None
+
+    lease_key = f'{key}:refresh'
+    retry_seconds = max(1, int(getattr(settings, 'LANDING_CACHE_REFRESH_RETRY_SECONDS', 60)))
+    if not cache.add(lease_key, 1, timeout=retry_seconds):
+        return None
     value = compute()
-    cache.set(key, value, timeout=ttl_seconds)
-    return value, False
+    _store(key, value, ttl_seconds, _stale_ttl(stale_ttl_seconds))
+    _bump('refreshes')
+    cache.delete(lease_key)
+    return value
+
+
+def cache_set(
+    prefix: str,
+    payload: Any,
+    ttl_seconds: int,
+    value: Any,
+    version: str = 'v4',
+    *,
+    stale_ttl_seconds: int | None = None,
+    keep_existing: bool = False,
+) -> bool:
+    """Store ``value`` directly (e.g. a degraded result with a shorter TTL).
+
+    With ``keep_existing`` nothing is written when an entry (fresh or stale) is
+    already cached or persisted. Returns True if the value was stored.
+    """
+    key = _key(prefix, payload, version=version)
+    if keep_existing and (cache.get(key) is not None or _restore(key) is not None):
+        return False
+    _store(key, value, ttl_seconds, _stale_ttl(stale_ttl_seconds))
+    return True
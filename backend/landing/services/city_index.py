@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.conf import settings
+
+
+CITY = 'CITY'
+AIRPORT = 'AIRPORT'
+
+# How often (seconds) a running process checks whether the index file was rebuilt.
+_RELOAD_CHECK_SECONDS = 30
+_NON_ALNUM = re.compile(r'[^a-z0-9 ]+')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and punctuation: 'São Paulo ' -> 'sao paulo'."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = _NON_ALNUM.sub(' ', text)
+    return _SPACES.sub(' ', text).strip()
+
+
+def _deletes(word: str) -> set[str]:
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+@dataclass(frozen=True)
+class Place:
+    code: str
+    name: str
+    subtype: str
+    country: str | None
+    lat: float | None
+    lon: float | None
+    city: str | None = None
+    popularity: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'code': self.code,
+            'name': self.name,
+            'subtype': self.subtype,
+            'country': self.country,
+            'lat': self.lat,
+            'lon': self.lon,
+            'city': self.city,
+            'popularity': self.popularity,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Place':
+        return cls(
+            code=str(data['code']),
+            name=str(data['name']),
+            subtype=str(data.get('subtype') or CITY),
+            country=data.get('country'),
+            lat=data.get('lat'),
+            lon=data.get('lon'),
+            city=data.get('city'),
+            popularity=float(data.get('popularity') or 0.0),
+        )
+
+    def amadeus_raw(self) -> dict[str, Any]:
+        """Same shape as an Amadeus reference-data/locations item."""
+        return {
+            'type': 'location',
+            'subType': self.subtype,
+            'name': self.name,
+            'iataCode': self.code,
+            'geoCode': {'latitude': self.lat, 'longitude': self.lon},
+            'address': {'countryCode': self.country, 'cityName': self.city},
+            'source': 'local_index',
+        }
+
+
+class CityIndex:
+    """Immutable in-memory index over places: code, prefix and 1-edit fuzzy lookups.
+
+    * ``by_code``: IATA code -> places
+    * ``keys``: sorted ``(normalized name, position)`` pairs; a prefix query is a
+      bisect into this list. Every word of a name is also indexed, so "york"
+      finds "New York".
+    * ``fuzzy``: symmetric-delete map (each name with one character removed), so
+      a single typo ("pairs", "londn") is still found without scanning.
+    """
+
+    def __init__(self, places: Iterable[Place]):
+        self.places: list[Place] = []
+        self._names: list[str] = []
+        self.by_code: dict[str, list[int]] = {}
+        keys: list[tuple[str, int]] = []
+        self.fuzzy: dict[str, set[int]] = {}
+        seen: set[tuple[str, str]] = set()
+
+        for place in places:
+            ident = (place.subtype, place.code)
+            if not place.code or ident in seen:
+                continue
+            seen.add(ident)
+            pos = len(self.places)
+            self.places.append(place)
+            self.by_code.setdefault(place.code.upper(), []).append(pos)
+
+            name = normalize(place.name)
+            self._names.append(name)
+            words = name.split()
+            variants = {name, *(' '.join(words[i:]) for i in range(1, len(words)))}
+            for variant in variants:
+                keys.append((variant, pos))
+            for variant in (name, *words):
+                if len(variant) >= 4:
+                    self.fuzzy.setdefault(variant, set()).add(pos)
+                    for deleted in _deletes(variant):
+                        self.fuzzy.setdefault(deleted, set()).add(pos)
+
+        keys.sort()
+        self._key_strings = [k for k, _ in keys]
+        self._key_positions = [p for _, p in keys]
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _rank(self, positions: Iterable[int], query: str) -> list[Place]:
+        def sort_key(pos: int):
+            place = self.places[pos]
+            exact = self._names[pos] == query
+            return (not exact, place.subtype != CITY, -place.popularity, place.name)
+
+        return [self.places[p] for p in sorted(set(positions), key=sort_key)]
+
+    def by_iata(self, code: str) -> list[Place]:
+        return [self.places[p] for p in self.by_code.get(code.strip().upper(), [])]
+
+    def prefix(self, query: str, *, limit: int | None = None) -> list[Place]:
+        q = normalize(query)
+        if not q:
+            return []
+        start = bisect.bisect_left(self._key_strings, q)
+        end = bisect.bisect_left(self._key_strings, q + '\uffff', lo=start)
+        ranked = self._rank(self._key_positions[start:end], q)
+        return ranked[:limit] if limit else ranked
+
+    def fuzzy_match(self, query: str, *, limit: int | None = None) -> list[Place]:
+        q = normalize(query)
+        if len(q) < 4:
+            return []
+        positions: set[int] = set(self.fuzzy.get(q, ()))
+        for deleted in _deletes(q):
+            positions.update(self.fuzzy.get(deleted, ()))
+        ranked = self._rank(positions, q)
+        return ranked[:limit] if limit else ranked
+
+    def search(self, query: str, *, limit: int = 6) -> list[Place]:
+        """Code matches first (for 3-letter queries), then prefix, then fuzzy."""
+        q = (query or '').strip()
+        out: list[Place] = []
+        if len(q) == 3 and q.isalpha():
+            out.extend(self.by_iata(q))
+        for place in self.prefix(q):
+            if place not in out:
+                out.append(place)
+            if len(out) >= limit:
+                break
+        if not out:
+            out = self.fuzzy_match(q, limit=limit)
+        return out[:limit]
+
+
+# -- persistence ---------------------------------------------------------------------------
+
+
+def index_path() -> Path:
+    configured = getattr(settings, 'LANDING_CITY_INDEX_PATH', '')
+    return Path(configured) if configured else Path(settings.BASE_DIR) / '.cache' / 'city_index.json.gz'
+
+
+def write_index(places: Iterable[Place], path: Path | None = None) -> Path:
+    path = path or index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with gzip.open(tmp, 'wt', encoding='utf-8') as fh:
+        json.dump({'version': 1, 'places': [p.to_dict() for p in places]}, fh, separators=(',', ':'))
+    os.replace(tmp, path)
+    return path
+
+
+def read_index(path: Path | None = None) -> list[Place]:
+    path = path or index_path()
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        data = json.load(fh)
+    return [Place.from_dict(item) for item in data.get('places', [])]
+
+
+# -- process-wide instance -----------------------------------------------------------------
+
+_MAX_LEARNED = 2000
+
+_lock = threading.Lock()
+_index: CityIndex | None = None
+_loaded_mtime: float | None = None
+_checked_at = 0.0
+# Places learned from upstream answers (Amadeus fallback results), kept in a small
+# separate index so learning never rebuilds the big one.
+_learned: dict[tuple[str, str], Place] = {}
+_learned_index = CityIndex([])
+
+
+def get_index() -> CityIndex:
+    """Return the loaded index, reloading it if the file on disk was rebuilt."""
+    global _index, _loaded_mtime, _checked_at
+    now = time.monotonic()
+    if _index is not None and now - _checked_at < _RELOAD_CHECK_SECONDS:
+        return _index
+
+    with _lock:
+        _checked_at = now
+        path = index_path()
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if _index is None or mtime != _loaded_mtime:
+            _index = CityIndex(read_index(path) if mtime is not None else [])
+            _loaded_mtime = mtime
+        return _index
+
+
+def remember(places: Iterable[Place]) -> None:
+    """Add upstream results to the in-memory overlay so the next lookup stays local."""
+    global _learned_index
+    new = [p for p in places if p.code and (p.subtype, p.code) not in _learned]
+    if not new:
+        return
+    with _lock:
+        for place in new:
+            _learned[(place.subtype, place.code)] = place
+        while len(_learned) > _MAX_LEARNED:
+            _learned.pop(next(iter(_learned)))
+        _learned_index = CityIndex(_learned.values())
+
+
+def learned_places() -> list[Place]:
+    return list(_learned_index.places)
+
+
+def search(query: str, *, limit: int = 6) -> list[Place]:
+    """Search the built index, then places learned from upstream since startup."""
+    out = get_index().search(query, limit=limit)
+    if len(out) < limit:
+        for place in _learned_index.search(query, limit=limit):
+            if place not in out:
+                out.append(place)
+    return out[:limit]
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, 'LANDING_CITY_INDEX_ENABLED', True))
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from django.conf import settings
+from django.db import connections
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for outbound fan-out (sized by LANDING_FANOUT_MAX_WORKERS)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(getattr(settings, 'LANDING_FANOUT_MAX_WORKERS', 16)),
+                    thread_name_prefix='landing-fanout',
+                )
+    return _executor
+
+
+def _run_in_worker(fn: Callable[[T], R], item: T) -> R:
+    try:
+        return fn(item)
+    finally:
+        # Worker threads outlive requests; never leave a DB connection open on them.
+        connections.close_all()
+
+
+class Deadline:
+    """A wall-clock budget shared by several stages of one request."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def fan_out(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    deadline: Deadline,
+    max_concurrency: int | None = None,
+    default: Any = None,
+) -> list[R | Any]:
+    """Run ``fn`` over ``items`` concurrently and return results in input order.
+
+    At most ``max_concurrency`` calls are in flight at once. Items that raise, or
+    that have not finished when ``deadline`` runs out, yield ``default`` so the
+    caller can still return a partial result.
+    """
+    items = list(items)
+    results: list[Any] = [default] * len(items)
+    if not items:
+        return results
+
+    limit = max_concurrency or int(getattr(settings, 'LANDING_FANOUT_CONCURRENCY', 8))
+    executor = get_executor()
+    pending: dict[Future, int] = {}
+    next_index = 0
+
+    def submit_more():
+        nonlocal next_index
+        while next_index < len(items) and len(pending) < limit:
+            future = executor.submit(_run_in_worker, fn, items[next_index])
+            pending[future] = next_index
+            next_index += 1
+
+    submit_more()
+    while pending:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            break
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except Exception:
+                results[index] = default
+        submit_more()
+
+    # Anything still running finishes in the background and is discarded.
+    for future in pending:
+        future.cancel()
+    return results
+
+
+# Lookups still running at the deadline, kept referenced until they finish.
+_background: set[asyncio.Task] = set()
+
+
+def _discard(task: asyncio.Task) -> None:
+    _background.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieved, so a late failure is not logged as unhandled
+
+
+async def afan_out(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    deadline: Deadline,
+    max_concurrency: int | None = None,
+    default: Any = None,
+) -> list[R | Any]:
+    """``fan_out`` for coroutine functions, run as tasks on the current event loop.
+
+    Same semantics: results in input order, ``default`` for failures and for
+    items unfinished at the deadline. Calls already in flight then are left to
+    finish in the background (so their results still reach the cache); calls
+    not yet started are cancelled.
+    """
+    items = list(items)
+    results: list[Any] = [default] * len(items)
+    if not items:
+        return results
+
+    semaphore = asyncio.Semaphore(max_concurrency or int(getattr(settings, 'LANDING_FANOUT_CONCURRENCY', 8)))
+    started: set[int] = set()
+
+    async def run(index: int, item: T) -> R:
+        async with semaphore:
+            started.add(index)
+            return await fn(item)
+
+    tasks = [asyncio.ensure_future(run(i, item)) for i, item in enumerate(items)]
+    await asyncio.wait(tasks, timeout=deadline.remaining())
+
+    for index, task in enumerate(tasks):
+        if not task.done():
+            if index in started:
+                _background.add(task)
+                task.add_done_callback(_discard)
+            else:
+                task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            results[index] = task.result()
+    return results
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import http.client
 import json
+import time
 from dataclasses import dataclass
-from typing import Any
-from urllib.parse import urlencode
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Any, Iterator
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from landing.services.async_pool import get_async_pool
+from landing.services.breaker import get_breaker
+from landing.services.pool import PoolTimeout, RawResponse, get_pool
+
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
 
 
 @dataclass(frozen=True)
@@ -22,43 +30,106 @@ class UpstreamError(RuntimeError):
         self.details = details
 
 
-def get_json(url: str, *, headers: dict[str, str] | None = None, timeout_seconds: float = 6.0) -> HttpResponse:
+def _send(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: float) -> RawResponse:
+    """Send a request through the shared keep-alive pool, following redirects like urlopen did."""
+    pool = get_pool()
+    for _ in range(_MAX_REDIRECTS + 1):
+        raw = pool.request(method, url, body=body, headers=headers, timeout=timeout_seconds)
+        location = raw.headers.get('Location') or raw.headers.get('location')
+        if raw.status not in _REDIRECT_STATUSES or not location:
+            return raw
+        if method not in ('GET', 'HEAD') and raw.status in (307, 308):
+            # urllib refuses to replay a body on 307/308; surface it as an HTTP error instead.
+            return raw
+        url = urljoin(url, location)
+        if method not in ('GET', 'HEAD'):
+            method, body = 'GET', None
+            headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
+    return raw
+
+
+def _is_host_failure(status: int) -> bool:
+    # 4xx (bad params, expired token) means the host is healthy; only these count against it.
+    return status >= 500 or status == 429
+
+
+def _allow(url: str):
+    parts = urlsplit(url)
+    breaker = get_breaker(parts.netloc)
+    if not breaker.allow():
+        raise UpstreamError(
+            'Upstream temporarily unavailable (circuit open)',
+            status=503,
+            details={'host': parts.netloc, 'retry_in_seconds': round(breaker.retry_in(), 1)},
+        )
+    return parts, breaker
+
+
+def _parse_error_body(text: str) -> Any:
+    try:
+        return json.loads(text) if text else None
+    except Exception:
+        return text
+
+
+def _send_error(e: Exception, breaker) -> UpstreamError:
+    """Map a transport failure to UpstreamError (and count it against the host)."""
+    breaker.record_failure()
+    if isinstance(e, (PoolTimeout, TimeoutError)):
+        return UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e))
+    if isinstance(e, (OSError, http.client.HTTPException)):
+        return UpstreamError('Upstream network error', details=str(e))
+    # Catch unexpected crashes to prevent 500s
+    return UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e))
+
+
+def _to_response(raw: RawResponse, breaker, latency_key: Any, started: float) -> HttpResponse:
+    if _is_host_failure(raw.status):
+        breaker.record_failure()
+    else:
+        breaker.record_success(latency_key, time.monotonic() - started)
+
+    text = raw.body.decode('utf-8', errors='replace')
+    if raw.status >= 400:
+        raise UpstreamError('Upstream HTTP error', status=raw.status, details=_parse_error_body(text))
+
+    try:
+        parsed = json.loads(text) if text else None
+    except Exception as e:
+        raise UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e)) from e
+
+    return HttpResponse(status=raw.status, data=parsed, headers=raw.headers)
+
+
+def _request(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: float) -> HttpResponse:
+    parts, breaker = _allow(url)
+
+    # Calls with different configured timeouts (e.g. a short intent call vs. a long
+    # completion) have different latency profiles, so they are tracked separately.
+    latency_key = (method, parts.path, timeout_seconds)
+    timeout = breaker.timeout_for(latency_key, timeout_seconds)
+    started = time.monotonic()
+    try:
+        raw = _send(method, url, body=body, headers=headers, timeout_seconds=timeout)
+    except Exception as e:
+        raise _send_error(e, breaker) from e
+
+    return _to_response(raw, breaker, latency_key, started)
+
+
+def _json_headers(headers: dict[str, str] | None, content_type: str | None = None) -> dict[str, str]:
     default_headers = {
         'Accept': 'application/json',
         'User-Agent': 'GlobeTrotterTechDecks/1.0',
     }
-    merged_headers = {**default_headers, **(headers or {})}
-    req = Request(url, headers=merged_headers)
+    if content_type:
+        default_headers['Content-Type'] = content_type
+    return {**default_headers, **(headers or {})}
 
-    try:
-        with urlopen(req, timeout=timeout_seconds) as resp:
-            body = resp.read().decode('utf-8')
-            content_type = resp.headers.get('Content-Type', '')
-            parsed: Any
-            if 'application/json' in content_type:
-                parsed = json.loads(body) if body else None
-            else:
-                parsed = json.loads(body) if body else None
-            return HttpResponse(
-                status=resp.status,
-                data=parsed,
-                headers={k: v for k, v in resp.headers.items()},
-            )
-
-    except HTTPError as e:
-        raw = e.read().decode('utf-8') if hasattr(e, 'read') else ''
-        try:
-            parsed = json.loads(raw) if raw else None
-        except Exception:
-            parsed = raw
-        raise UpstreamError('Upstream HTTP error', status=e.code, details=parsed) from e
-
-    except URLError as e:
-        raise UpstreamError('Upstream network error', details=str(e)) from e
-        
-    except (TimeoutError, Exception) as e:
-        # Catch unexpected timeouts or other crashes to prevent 500s
-        raise UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e)) from e
+
+def get_json(url: str, *, headers: dict[str, str] | None = None, timeout_seconds: float = 6.0) -> HttpResponse:
+    merged_headers = _json_headers(headers)
+    return _request('GET', url, body=None, headers=merged_headers, timeout_seconds=timeout_seconds)
 
 
 def post_form(
@@ -68,43 +139,11 @@ def post_form(
     headers: dict[str, str] | None = None,
     timeout_seconds: float = 6.0,
 ) -> HttpResponse:
-    default_headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'User-Agent': 'GlobeTrotterTechDecks/1.0',
-    }
-    merged_headers = {**default_headers, **(headers or {})}
+    merged_headers = _json_headers(headers, 'application/x-www-form-urlencoded')
     data = urlencode(form).encode('utf-8')
-    req = Request(url, data=data, headers=merged_headers, method='POST')
+    return _request('POST', url, body=data, headers=merged_headers, timeout_seconds=timeout_seconds)
+
 
-    try:
-        with urlopen(req, timeout=timeout_seconds) as resp:
-            body = resp.read().decode('utf-8')
-            content_type = resp.headers.get('Content-Type', '')
-            parsed: Any
-            if 'application/json' in content_type:
-                parsed = json.loads(body) if body else None
-            else:
-                parsed = json.loads(body) if body else None
-            return HttpResponse(
-                status=resp.status,
-                data=parsed,
-                headers={k: v for k, v in resp.headers.items()},
-            )
-
-    except HTTPError as e:
-        raw = e.read().decode('utf-8') if hasattr(e, 'read') else ''
-        try:
-            parsed = json.loads(raw) if raw else None
-        except Exception:
-            parsed = raw
-        raise UpstreamError('Upstream HTTP error', status=e.code, details=parsed) from e
-
-    except URLError as e:
-        raise UpstreamError('Upstream network error', details=str(e)) from e
-        
-    except (TimeoutError, Exception) as e:
-        raise UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e)) from e
 def post_json(
     url: str,
     *,
@@ -112,35 +151,117 @@ def post_json(
     headers: dict[str, str] | None = None,
     timeout_seconds: float = 6.0,
 ) -> HttpResponse:
+    merged_headers = _json_headers(headers, 'application/json')
+    data = json.dumps(payload).encode('utf-8')
+    return _request('POST', url, body=data, headers=merged_headers, timeout_seconds=timeout_seconds)
+
+
+def stream_post_json(
+    url: str,
+    *,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    timeout_seconds: float = 6.0,
+) -> Iterator[str]:
+    """POST JSON and yield the response body line by line as it arrives (e.g. SSE).
+
+    ``timeout_seconds`` bounds the wait for the headers and for each following
+    read, not the whole body. Errors are raised as ``UpstreamError`` like
+    ``post_json``; since this is a generator, they surface on the first ``next()``.
+    """
     default_headers = {
-        'Accept': 'application/json',
+        'Accept': 'text/event-stream',
         'Content-Type': 'application/json',
         'User-Agent': 'GlobeTrotterTechDecks/1.0',
     }
     merged_headers = {**default_headers, **(headers or {})}
     data = json.dumps(payload).encode('utf-8')
-    req = Request(url, data=data, headers=merged_headers, method='POST')
 
+    parts, breaker = _allow(url)
+    # Streams have their own latency profile (time to first byte), tracked separately.
+    latency_key = ('STREAM', parts.path, timeout_seconds)
+    timeout = breaker.timeout_for(latency_key, timeout_seconds)
+    started = time.monotonic()
     try:
-        with urlopen(req, timeout=timeout_seconds) as resp:
-            body = resp.read().decode('utf-8')
-            parsed = json.loads(body) if body else None
-            return HttpResponse(
-                status=resp.status,
-                data=parsed,
-                headers={k: v for k, v in resp.headers.items()},
-            )
-
-    except HTTPError as e:
-        raw = e.read().decode('utf-8') if hasattr(e, 'read') else ''
+        resp = get_pool().open('POST', url, body=data, headers=merged_headers, timeout=timeout)
+    except Exception as e:
+        # Any failure must be recorded, or a half-open breaker would keep its probe slot.
+        raise _send_error(e, breaker) from e
+
+    with resp:
+        if _is_host_failure(resp.status):
+            breaker.record_failure()
+        else:
+            breaker.record_success(latency_key, time.monotonic() - started)
+        if resp.status >= 400:
+            text = resp.read().decode('utf-8', errors='replace')
+            raise UpstreamError('Upstream HTTP error', status=resp.status, details=_parse_error_body(text))
+
         try:
-            parsed = json.loads(raw) if raw else None
-        except Exception:
-            parsed = raw
-        raise UpstreamError('Upstream HTTP error', status=e.code, details=parsed) from e
-
-    except URLError as e:
-        raise UpstreamError('Upstream network error', details=str(e)) from e
-        
-    except (TimeoutError, Exception) as e:
-        raise UpstreamError(f'Upstream connection failed: {type(e).__name__}', details=str(e)) from e
+            for line in resp.iter_lines():
+                yield line.decode('utf-8', errors='replace').rstrip('\r\n')
+        except (TimeoutError, OSError, http.client.HTTPException) as e:
+            raise UpstreamError('Upstream stream interrupted', details=str(e)) from e
+
+
+# -- asyncio ---------------------------------------------------------------------------------
+#
+# Same contract as the functions above (breakers, adaptive timeouts, redirects,
+# UpstreamError) for async views, over the per-loop pool in ``async_pool``.
+
+
+async def _asend(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: float) -> RawResponse:
+    pool = get_async_pool()
+    for _ in range(_MAX_REDIRECTS + 1):
+        raw = await pool.request(method, url, body=body, headers=headers, timeout=timeout_seconds)
+        location = raw.headers.get('Location') or raw.headers.get('location')
+        if raw.status not in _REDIRECT_STATUSES or not location:
+            return raw
+        if method not in ('GET', 'HEAD') and raw.status in (307, 308):
+            return raw
+        url = urljoin(url, location)
+        if method not in ('GET', 'HEAD'):
+            method, body = 'GET', None
+            headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
+    return raw
+
+
+async def _arequest(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: float) -> HttpResponse:
+    parts, breaker = _allow(url)
+    latency_key = (method, parts.path, timeout_seconds)
+    timeout = breaker.timeout_for(latency_key, timeout_seconds)
+    started = time.monotonic()
+    try:
+        raw = await _asend(method, url, body=body, headers=headers, timeout_seconds=timeout)
+    except Exception as e:
+        raise _send_error(e, breaker) from e
+
+    return _to_response(raw, breaker, latency_key, started)
+
+
+async def aget_json(url: str, *, headers: dict[str, str] | None = None, timeout_seconds: float = 6.0) -> HttpResponse:
+    return await _arequest('GET', url, body=None, headers=_json_headers(headers), timeout_seconds=timeout_seconds)
+
+
+async def apost_form(
+    url: str,
+    *,
+    form: dict[str, str],
+    headers: dict[str, str] | None = None,
+    timeout_seconds: float = 6.0,
+) -> HttpResponse:
+    merged_headers = _json_headers(headers, 'application/x-www-form-urlencoded')
+    data = urlencode(form).encode('utf-8')
+    return await _arequest('POST', url, body=data, headers=merged_headers, timeout_seconds=timeout_seconds)
+
+
+async def apost_json(
+    url: str,
+    *,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    timeout_seconds: float = 6.0,
+) -> HttpResponse:
+    merged_headers = _json_headers(headers, 'application/json')
+    data = json.dumps(payload).encode('utf-8')
+    return await _arequest('POST', url, body=data, headers=merged_headers, timeout_seconds=timeout_seconds)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import calendar
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from landing.services.city_index import normalize
+
+
+FLIGHT = 'flight'
+HOTEL = 'hotel'
+DESTINATION = 'destination'
+GENERAL = 'general'
+
+# Keyword weights per intent; matched on normalised text, so multi-word phrases work.
+_KEYWORDS: dict[str, dict[str, float]] = {
+    FLIGHT: {
+        'flight': 1.0, 'flights': 1.0, 'fly': 1.0, 'flying': 1.0, 'airfare': 1.0, 'airline': 0.8,
+        'airlines': 0.8, 'plane': 0.8, 'nonstop': 0.8, 'non stop': 0.8, 'direct flight': 1.0,
+        'one way': 0.6, 'round trip': 0.6, 'return ticket': 0.8, 'air ticket': 1.0, 'air tickets': 1.0,
+        'cheapest way to get': 0.6,
+    },
+    HOTEL: {
+        'hotel': 1.0, 'hotels': 1.0, 'stay': 0.7, 'staying': 0.7, 'accommodation': 1.0,
+        'accommodations': 1.0, 'hostel': 1.0, 'hostels': 1.0, 'resort': 0.9, 'resorts': 0.9,
+        'room': 0.6, 'rooms': 0.6, 'lodging': 1.0, 'airbnb': 1.0, 'bnb': 0.9, 'place to stay': 1.0,
+        'places to stay': 1.0, 'where to stay': 1.0, 'check in': 0.5, 'night': 0.3, 'nights': 0.4,
+    },
+    DESTINATION: {
+        'destination': 1.0, 'destinations': 1.0, 'places to visit': 1.0, 'place to visit': 1.0,
+        'where should i go': 1.0, 'where to go': 1.0, 'where can i go': 1.0, 'suggest a city': 1.0,
+        'suggest a place': 1.0, 'suggest somewhere': 1.0, 'recommend a city': 1.0,
+        'recommend a place': 1.0, 'cities': 0.7, 'getaway': 0.8, 'getaways': 0.8, 'explore': 0.5,
+        'vacation spot': 1.0, 'holiday spot': 1.0, 'things to do': 0.7, 'attractions': 0.8,
+        'sightseeing': 0.7, 'trip ideas': 1.0, 'weekend trip': 0.8,
+    },
+    GENERAL: {
+        'visa': 1.0, 'pack': 0.9, 'packing': 1.0, 'weather': 0.9, 'best time': 1.0, 'currency': 1.0,
+        'safe': 0.6, 'safety': 0.8, 'tips': 0.8, 'advice': 0.7, 'budget': 0.5, 'insurance': 1.0,
+        'language': 0.8, 'tip': 0.6, 'vaccination': 1.0, 'luggage': 0.8, 'baggage': 0.6,
+        'jet lag': 1.0, 'thank': 1.0, 'thanks': 1.0, 'hello': 0.8, 'hi': 0.6, 'hey': 0.6,
+        'who are you': 1.0, 'what can you do': 1.0,
+    },
+}
+
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_abbr) if name})
+_MONTHS['sept'] = 9
+_WEEKDAYS = {name.lower(): i for i, name in enumerate(calendar.day_name)}
+_MONTH_RE = '|'.join(sorted(_MONTHS, key=len, reverse=True))
+
+_ISO_DATE = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+_NUMERIC_DATE = re.compile(r'\b(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?\b')
+_DAY_MONTH = re.compile(rf'\b(\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?({_MONTH_RE})\b\.?(?:,?\s+(\d{{4}}))?', re.I)
+_MONTH_DAY = re.compile(rf'\b({_MONTH_RE})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?\b(?:,?\s+(\d{{4}}))?', re.I)
+_RELATIVE_DAY = re.compile(r'\b(today|tonight|tomorrow|day after tomorrow)\b', re.I)
+_NEXT_WEEKDAY = re.compile(r'\b(?:next|this|on)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', re.I)
+_IATA = re.compile(r'\b[A-Z]{3}\b')
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Prepositions that introduce the origin / destination of a trip.
+_ORIGIN_WORDS = {'from', 'leaving', 'departing', 'out'}
+_DESTINATION_WORDS = {'to', 'in', 'at', 'for', 'into', 'near', 'visit', 'visiting', 'around'}
+# Uppercase words that look like IATA codes but are ordinary words in chat.
+_NOT_CODES = {'THE', 'AND', 'FOR', 'YOU', 'ARE', 'CAN', 'ANY', 'ALL', 'BUT', 'NOT', 'HOW', 'WHO', 'WHY', 'USA', 'UAE'}
+
+
+@dataclass(frozen=True)
+class Intent:
+    intent: str
+    origin: str | None
+    destination: str | None
+    date: str | None
+    confidence: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Same keys the LLM classifier returns."""
+        data = asdict(self)
+        data.pop('confidence')
+        return data
+
+
+@dataclass(frozen=True)
+class _Mention:
+    start: int  # token index
+    end: int
+    name: str
+    code: str | None
+
+
+class Gazetteer:
+    """Place names (1-3 words) and IATA codes recognised in chat messages."""
+
+    def __init__(self, names: Iterable[tuple[str, str | None]], codes: Iterable[str] = ()):
+        self.names: dict[str, tuple[str, str | None]] = {}
+        for name, code in names:
+            norm = normalize(name)
+            if norm and norm not in self.names:
+                self.names[norm] = (name, code)
+        self.codes = {c.upper() for c in codes}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def mentions(self, message: str) -> tuple[list[_Mention], list[str]]:
+        tokens = _WORD.findall(normalize(message))
+        found: list[_Mention] = []
+        i = 0
+        while i < len(tokens):
+            for size in (3, 2, 1):
+                phrase = ' '.join(tokens[i:i + size])
+                if len(tokens[i:i + size]) == size and phrase in self.names:
+                    name, code = self.names[phrase]
+                    found.append(_Mention(i, i + size, name, code))
+                    i += size
+                    break
+            else:
+                i += 1
+
+        # Upper-case airport codes as typed ("MAA to DEL").
+        for match in _IATA.finditer(message):
+            code = match.group(0)
+            if code in _NOT_CODES or (self.codes and code not in self.codes):
+                continue
+            index = len(_WORD.findall(normalize(message[:match.start()])))
+            if not any(m.start <= index < m.end for m in found):
+                found.append(_Mention(index, index + 1, code, code))
+        return sorted(found, key=lambda m: m.start), tokens
+
+
+def _future(candidate: date, today: date) -> date:
+    """Dates without a year mean the next occurrence."""
+    if candidate < today:
+        try:
+            return candidate.replace(year=candidate.year + 1)
+        except ValueError:
+            return candidate
+    return candidate
+
+
+def extract_date(message: str, *, today: date | None = None) -> str | None:
+    """First date mentioned in ``message`` as YYYY-MM-DD."""
+    today = today or date.today()
+    candidates: list[tuple[int, date]] = []
+
+    def add(pos: int, year: int | None, month: int, day: int) -> None:
+        try:
+            value = date(year or today.year, month, day)
+        except ValueError:
+            return
+        candidates.append((pos, value if year else _future(value, today)))
+
+    for m in _ISO_DATE.finditer(message):
+        add(m.start(), int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    for m in _DAY_MONTH.finditer(message):
+        add(m.start(), int(m.group(3)) if m.group(3) else None, _MONTHS[m.group(2).lower()], int(m.group(1)))
+    for m in _MONTH_DAY.finditer(message):
+        add(m.start(), int(m.group(3)) if m.group(3) else None, _MONTHS[m.group(1).lower()], int(m.group(2)))
+    if not candidates:
+        for m in _NUMERIC_DATE.finditer(message):
+            year = m.group(3)
+            year = int(year) + 2000 if year and len(year) == 2 else (int(year) if year else None)
+            add(m.start(), year, int(m.group(2)), int(m.group(1)))  # day/month, as used in India and Europe
+    for m in _RELATIVE_DAY.finditer(message):
+        word = m.group(1).lower()
+        offset = 2 if word == 'day after tomorrow' else (1 if word == 'tomorrow' else 0)
+        candidates.append((m.start(), today + timedelta(days=offset)))
+    for m in _NEXT_WEEKDAY.finditer(message):
+        days_ahead = (_WEEKDAYS[m.group(1).lower()] - today.weekday()) % 7 or 7
+        candidates.append((m.start(), today + timedelta(days=days_ahead)))
+
+    if not candidates:
+        return None
+    return min(candidates, key=lambda c: c[0])[1].isoformat()
+
+
+def _scores(text: str) -> dict[str, float]:
+    padded = f' {text} '
+    return {
+        intent: sum(weight for phrase, weight in keywords.items() if f' {phrase} ' in padded)
+        for intent, keywords in _KEYWORDS.items()
+    }
+
+
+def classify(message: str, gazetteer: Gazetteer | None = None, *, today: date | None = None) -> Intent:
+    """Rule-based intent + slot extraction; ``confidence`` says whether to trust it.
+
+    Keyword scores pick the intent, the gazetteer finds places (the one after
+    "from" is the origin, the next one the destination) and dates are parsed
+    into ISO form. Mixed or missing signals give a low confidence so the
+    caller can ask the LLM instead.
+    """
+    gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
+    text = ' '.join(_WORD.findall(normalize(message)))
+    scores = _scores(text)
+    mentions, tokens = gazetteer.mentions(message)
+
+    origin = destination = None
+    for mention in mentions:
+        before = tokens[mention.start - 1] if mention.start > 0 else ''
+        if before in _ORIGIN_WORDS and origin is None:
+            origin = mention
+        elif destination is None:
+            destination = mention
+        elif origin is None and (before in _DESTINATION_WORDS or destination.end == mention.start):
+            # "Chennai to Delhi" / "BLR - BKK": the first place was the origin after all.
+            origin, destination = destination, mention
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    (best, best_score), (_, second_score) = ranked[0], ranked[1]
+    if best_score == 0:
+        intent = GENERAL
+        # A bare place name ("Tell me about Goa") could be any intent.
+        confidence = 0.4 if mentions else 0.75
+    else:
+        intent = best
+        if second_score >= best_score * 0.75:
+            confidence = 0.5  # e.g. "hotel near the airport before my flight"
+        elif best_score < 0.7:
+            confidence = 0.6  # only a weak hint such as "room"
+        else:
+            confidence = 0.9
+        if intent in (FLIGHT, HOTEL) and destination is None:
+            # The LLM would not find a place either, but be less sure of the intent.
+            confidence = min(confidence, 0.75)
+
+    if intent == FLIGHT:
+        origin_value = (origin.code or origin.name) if origin else None
+        destination_value = (destination.code or destination.name) if destination else None
+    else:
+        place = destination or origin
+        origin_value = None
+        destination_value = place.name if place else None
+
+    return Intent(
+        intent=intent,
+        origin=origin_value,
+        destination=destination_value,
+        date=extract_date(message, today=today),
+        confidence=round(confidence, 2),
+    )
+
+
+# -- process-wide gazetteer ------------------------------------------------------------------
+
+_GAZETTEER_TTL_SECONDS = 300
+_lock = threading.Lock()
+_gazetteer: Gazetteer | None = None
+_gazetteer_built_at = 0.0
+
+_stats_lock = threading.Lock()
+_stats = {'local': 0, 'llm_fallback': 0}
+
+
+def get_gazetteer() -> Gazetteer:
+    """City names from the autocomplete index (catalog + city index) and known IATA codes."""
+    global _gazetteer, _gazetteer_built_at
+    if _gazetteer is not None and time.monotonic() - _gazetteer_built_at < _GAZETTEER_TTL_SECONDS:
+        return _gazetteer
+    from landing.services import autocomplete, city_index
+
+    with _lock:
+        if _gazetteer is None or time.monotonic() - _gazetteer_built_at >= _GAZETTEER_TTL_SECONDS:
+            entries = autocomplete.get_completer().entries
+            _gazetteer = Gazetteer(
+                ((e['name'], e.get('code')) for e in entries),
+                codes=city_index.get_index().by_code.keys(),
+            )
+            _gazetteer_built_at = time.monotonic()
+        return _gazetteer
+
+
+def record(source: str) -> None:
+    with _stats_lock:
+        _stats[source] += 1
+
+
+def intent_stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+
+# Errors that mean a kept-alive socket was closed by the server while idle.
+# Only these are retried, and only on a reused connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class PoolTimeout(RuntimeError):
+    """Raised when no connection slot for a host frees up within the timeout."""
+
+
+@dataclass
+class RawResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class StreamedResponse:
+    """A response whose body is read incrementally; holds its connection slot until closed.
+
+    A fully read body lets the connection go back to the idle pool; closing
+    early discards it (the rest of the body would still be on the socket).
+    """
+
+    def __init__(self, resp: http.client.HTTPResponse, release: Callable[[bool], None]):
+        self.status = resp.status
+        self.headers = {k: v for k, v in resp.getheaders()}
+        self._resp = resp
+        self._release = release
+        self._closed = False
+
+    def iter_lines(self) -> Iterator[bytes]:
+        try:
+            while True:
+                line = self._resp.readline()
+                if not line:
+                    break
+                yield line
+        finally:
+            self.close()
+
+    def read(self) -> bytes:
+        try:
+            return self._resp.read()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._release(self._resp.isclosed() or self._resp.length == 0)
+
+    def __enter__(self) -> 'StreamedResponse':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@dataclass
+class PoolStats:
+    connections_opened: int = 0
+    connections_reused: int = 0
+    connections_discarded: int = 0
+    requests: int = 0
+    waits: int = 0
+
+
+class HostPool:
+    """Keep-alive connections for a single (scheme, host, port).
+
+    ``max_connections`` bounds concurrent in-flight requests to the host;
+    ``max_idle`` bounds how many finished connections are kept for reuse.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        *,
+        max_idle: int,
+        max_connections: int,
+        idle_timeout: float,
+        ssl_context: ssl.SSLContext | None,
+        stats: PoolStats,
+    ):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._stats = stats
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            self._stats.connections_opened += 1
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _take_idle(self) -> http.client.HTTPConnection | None:
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    self._stats.connections_reused += 1
+                    return conn
+                self._stats.connections_discarded += 1
+                conn.close()
+        return None
+
+    def _put_idle(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((conn, time.monotonic()))
+                return
+            self._stats.connections_discarded += 1
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def _acquire_slot(self, timeout: float) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats.waits += 1
+            if not self._slots.acquire(timeout=timeout):
+                raise PoolTimeout(f'No free connection to {self.host} within {timeout}s')
+
+    def _send(
+        self, method: str, target: str, body: bytes | None, headers: dict[str, str], timeout: float
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send the request and read the status line + headers (caller holds a slot)."""
+        conn = self._take_idle()
+        reused = conn is not None
+        if conn is None:
+            conn = self._new_connection(timeout)
+
+        while True:
+            try:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive socket; retry once on a fresh one.
+                reused = False
+                conn = self._new_connection(timeout)
+            except BaseException:
+                conn.close()
+                raise
+
+        with self._lock:
+            self._stats.requests += 1
+        return conn, resp
+
+    def _finish(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse, complete: bool) -> None:
+        if complete and not resp.will_close:
+            self._put_idle(conn)
+        else:
+            conn.close()
+
+    def request(self, method: str, target: str, body: bytes | None, headers: dict[str, str], timeout: float) -> RawResponse:
+        self._acquire_slot(timeout)
+        try:
+            conn, resp = self._send(method, target, body, headers, timeout)
+            try:
+                data = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+            self._finish(conn, resp, complete=True)
+
+            return RawResponse(
+                status=resp.status,
+                headers={k: v for k, v in resp.getheaders()},
+                body=data,
+            )
+        finally:
+            self._slots.release()
+
+    def open(self, method: str, target: str, body: bytes | None, headers: dict[str, str], timeout: float) -> StreamedResponse:
+        """Like ``request`` but returns once headers arrive; ``timeout`` applies per read."""
+        self._acquire_slot(timeout)
+        try:
+            conn, resp = self._send(method, target, body, headers, timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        def release(complete: bool) -> None:
+            try:
+                self._finish(conn, resp, complete)
+            finally:
+                self._slots.release()
+
+        return StreamedResponse(resp, release)
+
+
+class ConnectionPool:
+    """Thread-safe registry of per-host keep-alive pools."""
+
+    def __init__(self, *, max_idle: int = 10, max_connections: int = 20, idle_timeout: float = 60.0):
+        self.max_idle = max_idle
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.stats = PoolStats()
+        self._ssl_context = ssl.create_default_context()
+        self._lock = threading.Lock()
+        self._hosts: dict[tuple[str, str, int | None], HostPool] = {}
+
+    def _host_pool(self, scheme: str, host: str, port: int | None) -> HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._hosts.get(key)
+            if pool is None:
+                pool = HostPool(
+                    scheme,
+                    host,
+                    port,
+                    max_idle=self.max_idle,
+                    max_connections=self.max_connections,
+                    idle_timeout=self.idle_timeout,
+                    ssl_context=self._ssl_context if scheme == 'https' else None,
+                    stats=self.stats,
+                )
+                self._hosts[key] = pool
+            return pool
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 6.0,
+    ) -> RawResponse:
+        pool, target = self._resolve(url)
+        return pool.request(method, target, body, headers or {}, timeout)
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 6.0,
+    ) -> StreamedResponse:
+        pool, target = self._resolve(url)
+        return pool.open(method, target, body, headers or {}, timeout)
+
+    def _resolve(self, url: str) -> tuple[HostPool, str]:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'Unsupported URL: {url}')
+        target = parts.path or '/'
+        if parts.query:
+            target = f'{target}?{parts.query}'
+        return self._host_pool(parts.scheme, parts.hostname, parts.port), target
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._hosts = list(self._hosts.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            idle = sum(len(p._idle) for p in self._hosts.values())
+            hosts = len(self._hosts)
+        return {
+            'hosts': hosts,
+            'idle_connections': idle,
+            'connections_opened': self.stats.connections_opened,
+            'connections_reused': self.stats.connections_reused,
+            'connections_discarded': self.stats.connections_discarded,
+            'requests': self.stats.requests,
+            'waits': self.stats.waits,
+        }
+
+
+_default_pool: ConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Process-wide pool configured from ``OUTBOUND_HTTP_POOL_*`` settings."""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ConnectionPool(
+                    max_idle=int(getattr(settings, 'OUTBOUND_HTTP_POOL_MAXSIZE', 10)),
+                    max_connections=int(getattr(settings, 'OUTBOUND_HTTP_MAX_PER_HOST', 20)),
+                    idle_timeout=float(getattr(settings, 'OUTBOUND_HTTP_POOL_IDLE_SECONDS', 60.0)),
+                )
+    return _default_pool
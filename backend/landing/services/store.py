@@ -0,0 +1,126 @@
+"""Durable copies of landing cache entries in the ProviderResponse table.
+
+``cache_get_or_set`` writes the values it stores under the long-lived prefixes
+in LANDING_PERSISTENT_STORE_PREFIXES here as well, and looks here on a cache
+miss, so after a deploy or a cache flush the last good provider payloads are
+served (and refreshed in the background once stale) instead of every worker
+refetching them from Amadeus, Pexels and Wikipedia at once. Short-lived entries
+(fares, hotel rates) and negative results (None) stay cache-only.
+
+Store failures never fail a request: they are logged and treated as misses.
+"""
+from __future__ import annotations
+
+import logging
+import pickle
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Iterable, Iterator
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, 'LANDING_PERSISTENT_STORE_ENABLED', True))
+
+
+def _prefix(key: str) -> str:
+    # Keys look like landing:{version}:{prefix}:{digest}
+    parts = key.split(':')
+    return parts[2] if len(parts) > 3 else ''
+
+
+def persisted_prefixes() -> frozenset[str]:
+    prefixes = getattr(settings, 'LANDING_PERSISTENT_STORE_PREFIXES', ())
+    if isinstance(prefixes, str):
+        prefixes = prefixes.split(',')
+    return frozenset(p.strip() for p in prefixes if p.strip())
+
+
+def persists(key: str) -> bool:
+    """Whether entries under ``key``'s prefix are kept in the table."""
+    return is_enabled() and _prefix(key) in persisted_prefixes()
+
+
+def save(key: str, value: Any, fresh_until: float, timeout_seconds: int) -> None:
+    """Persist ``value`` with its soft TTL (epoch seconds) and hard TTL (seconds from now)."""
+    from landing.models import ProviderResponse
+
+    try:
+        ProviderResponse.objects.update_or_create(
+            key=key,
+            defaults={
+                'prefix': _prefix(key)[:64],
+                'payload': pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                'fresh_until': datetime.fromtimestamp(fresh_until, tz=dt_timezone.utc),
+                'expires_at': timezone.now() + timedelta(seconds=timeout_seconds),
+            },
+        )
+    except (DatabaseError, pickle.PicklingError, TypeError) as e:
+        logger.warning('Could not persist %s: %s', key, e)
+
+
+def _entry(row, now) -> tuple[Any, float, int] | None:
+    try:
+        value = pickle.loads(bytes(row.payload))
+    except Exception:
+        # Written by an older version of a provider class; treat it as a miss.
+        return None
+    return value, row.fresh_until.timestamp(), max(1, int((row.expires_at - now).total_seconds()))
+
+
+def load_many(keys: Iterable[str]) -> dict[str, tuple[Any, float, int]]:
+    """Unexpired entries for ``keys`` in one query: key -> (value, fresh_until, seconds left)."""
+    from landing.models import ProviderResponse
+
+    keys = list(keys)
+    if not keys:
+        return {}
+    now = timezone.now()
+    try:
+        rows = list(ProviderResponse.objects.filter(key__in=keys, expires_at__gt=now))
+    except DatabaseError as e:
+        logger.warning('Could not read the provider store: %s', e)
+        return {}
+    out = {}
+    for row in rows:
+        entry = _entry(row, now)
+        if entry is not None:
+            out[row.key] = entry
+    return out
+
+
+def load(key: str) -> tuple[Any, float, int] | None:
+    return load_many([key]).get(key)
+
+
+def iter_entries(prefixes: Iterable[str] | None = None, *, batch_size: int = 500) -> Iterator[tuple[str, Any, float, int]]:
+    """Every unexpired entry (optionally only these prefixes), streamed from the table."""
+    from landing.models import ProviderResponse
+
+    now = timezone.now()
+    rows = ProviderResponse.objects.filter(expires_at__gt=now)
+    if prefixes:
+        rows = rows.filter(prefix__in=list(prefixes))
+    try:
+        for row in rows.iterator(chunk_size=batch_size):
+            entry = _entry(row, now)
+            if entry is not None:
+                yield (row.key, *entry)
+    except DatabaseError as e:
+        logger.warning('Could not read the provider store: %s', e)
+
+
+def compact(*, prefixes: Iterable[str] | None = None) -> dict[str, int]:
+    """Delete entries past their hard TTL (and every entry under ``prefixes``)."""
+    from landing.models import ProviderResponse
+
+    expired, _ = ProviderResponse.objects.filter(expires_at__lte=timezone.now()).delete()
+    dropped = 0
+    if prefixes:
+        dropped, _ = ProviderResponse.objects.filter(prefix__in=list(prefixes)).delete()
+    return {'expired': expired, 'dropped': dropped, 'remaining': ProviderResponse.objects.count()}
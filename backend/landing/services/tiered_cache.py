@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+
+class LocalLRU:
+    """Bounded, thread-safe in-process LRU with per-entry expiry.
+
+    Values are pickled on the way in (like LocMemCache) so callers can never
+    mutate a shared cached object.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._data: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, blob = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return True, pickle.loads(blob)
+
+    def set(self, key: str, value: Any, timeout: float | None) -> None:
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._data[key] = (expires_at, blob)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+# One L1 per LOCATION per process, shared by every thread's backend instance.
+_local_stores: dict[str, LocalLRU] = {}
+_local_stores_lock = threading.Lock()
+
+# Values written by ``set`` reach L2 as (marker, expires_at, value) so a read
+# knows how long the L2 entry has left; ``add``/``incr`` values are stored bare.
+_STAMP_MARKER = '__tiered__'
+# Coordination keys must always be read from L2: a worker holding a stale copy
+# of a lease would wait on, or skip work for, a lease that is already gone.
+_SHARED_ONLY_SUFFIXES = (':lease', ':refresh')
+
+
+class TieredCache(BaseCache):
+    """Small in-process LRU (L1) in front of a shared cache alias (L2).
+
+    Reads hit L1 first and fall through to L2, back-filling L1. Writes go to
+    both. L1 entries live at most ``LOCAL_TIMEOUT`` seconds, which bounds how
+    long one worker can serve a value another worker has replaced, and a
+    back-filled entry never outlives the L2 entry it was read from. ``add`` and
+    ``incr`` go straight to L2 so leases and counters stay atomic, and lease keys
+    (``:lease`` / ``:refresh``) are never cached in L1.
+
+    OPTIONS:
+        SHARED_ALIAS: alias of the L2 cache in CACHES (default 'landing_shared')
+        MAX_ENTRIES: L1 size limit before LRU eviction (default 512)
+        LOCAL_TIMEOUT: cap on L1 entry lifetime in seconds (default 30)
+    """
+
+    def __init__(self, location, params):
+        options = dict(params.get('OPTIONS') or {})
+        self._shared_alias = options.pop('SHARED_ALIAS', 'landing_shared')
+        max_entries = int(options.pop('MAX_ENTRIES', 512))
+        self._local_timeout = float(options.pop('LOCAL_TIMEOUT', 30))
+        params = {**params, 'OPTIONS': options}
+        super().__init__(params)
+        name = location or 'landing-l1'
+        with _local_stores_lock:
+            self._local = _local_stores.setdefault(name, LocalLRU(max_entries))
+
+    @property
+    def _shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    def _timeout_seconds(self, timeout) -> float | None:
+        # get_backend_timeout() returns an absolute time for some backends; this is relative.
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return None if timeout is None else float(timeout)
+
+    def _local_timeout_for(self, timeout) -> float | None:
+        timeout = self._timeout_seconds(timeout)
+        if timeout is None:
+            return self._local_timeout
+        return min(timeout, self._local_timeout)
+
+    @staticmethod
+    def _shared_only(key) -> bool:
+        return str(key).endswith(_SHARED_ONLY_SUFFIXES)
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        shared_only = self._shared_only(key)
+        if not shared_only:
+            found, value = self._local.get(local_key)
+            if found:
+                return value
+        sentinel = object()
+        value = self._shared.get(key, sentinel, version=version)
+        if value is sentinel:
+            return default
+        local_timeout = self._local_timeout
+        if isinstance(value, tuple) and len(value) == 3 and value[0] == _STAMP_MARKER:
+            _, expires_at, value = value
+            if expires_at is not None:
+                local_timeout = min(local_timeout, expires_at - time.time())
+        if not shared_only and local_timeout > 0:
+            self._local.set(local_key, value, local_timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        seconds = self._timeout_seconds(timeout)
+        expires_at = None if seconds is None else time.time() + seconds
+        self._shared.set(key, (_STAMP_MARKER, expires_at, value), timeout=timeout, version=version)
+        local_timeout = self._local_timeout_for(timeout)
+        if self._shared_only(key) or (local_timeout is not None and local_timeout <= 0):
+            self._local.delete(local_key)
+        else:
+            self._local.set(local_key, value, local_timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        added = self._shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._local.delete(local_key)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        # The stamped expiry is now wrong; an L1 copy would be capped by it.
+        self._local.delete(self.make_and_validate_key(key, version=version))
+        return self._shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local.delete(local_key)
+        return self._shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        if self._shared_only(key):
+            return self._shared.has_key(key, version=version)
+        found, _ = self._local.get(local_key)
+        return found or self._shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local.delete(local_key)
+        return self._shared.incr(key, delta, version=version)
+
+    def clear(self):
+        self._local.clear()
+        self._shared.clear()
+
+    def close(self, **kwargs):
+        self._shared.close(**kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'local': self._local.stats(),
+            'shared_backend': type(self._shared).__name__,
+        }
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+
+from landing.services.cache import _key, cache
+from landing.services.warmup import schedule_warmup
+
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL_SECONDS = 0.05
+# Never hand out a token this close to its expiry.
+_EXPIRY_SAFETY_SECONDS = 30
+
+
+class SharedToken:
+    """OAuth access token stored once per deployment in the shared landing cache.
+
+    ``fetch(timeout_seconds)`` performs the token request and returns
+    ``(token, expires_in)``; callers pass their own request budget to ``get`` /
+    ``invalidate`` (background refreshes use OUTBOUND_HTTP_TIMEOUT_SECONDS).
+    Concurrent refreshes are deduped (a lock within the process, a cache lease
+    across processes). Once a token is within OAUTH_TOKEN_REFRESH_MARGIN_SECONDS
+    of expiry it is refreshed in the background, so callers keep using the current
+    one and never wait for the OAuth round trip.
+    """
+
+    def __init__(self, name: str, fetch: Callable[[float], tuple[str, int]], *, scope: Any = None):
+        self.name = name
+        self._fetch = fetch
+        self._scope = scope
+        self._lock = threading.Lock()
+        self._background_pending = False
+        self.refreshes = 0
+        self.background_refreshes = 0
+
+    @property
+    def _cache_key(self) -> str:
+        return _key('oauth_token', {'name': self.name, 'scope': self._scope})
+
+    @property
+    def _refresh_margin(self) -> float:
+        return float(getattr(settings, 'OAUTH_TOKEN_REFRESH_MARGIN_SECONDS', 300))
+
+    def _read(self) -> dict | None:
+        entry = cache.get(self._cache_key)
+        if isinstance(entry, dict) and entry.get('token') and time.time() < entry.get('expires_at', 0) - _EXPIRY_SAFETY_SECONDS:
+            return entry
+        return None
+
+    def _refresh(self, *, stale_token: str | None = None, timeout_seconds: float | None = None) -> str:
+        """Fetch a new token unless another thread/process already replaced ``stale_token``."""
+        default_timeout = float(getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0))
+        timeout = default_timeout if timeout_seconds is None else float(timeout_seconds)
+        with self._lock:
+            entry = self._read()
+            if entry and entry['token'] != stale_token and time.time() < entry['refresh_at']:
+                return entry['token']
+
+            lease_key = f'{self._cache_key}:lease'
+            lease_seconds = max(1, int(max(timeout, default_timeout)) + 1)
+            have_lease = cache.add(lease_key, 1, timeout=lease_seconds)
+            if not have_lease:
+                # Another worker is fetching; wait for it (within our budget) rather than POSTing again.
+                deadline = time.monotonic() + min(lease_seconds, timeout)
+                while time.monotonic() < deadline:
+                    time.sleep(_POLL_INTERVAL_SECONDS)
+                    entry = self._read()
+                    if entry and entry['token'] != stale_token:
+                        return entry['token']
+                # Fall through and use the current token if it is still valid.
+                if entry and entry['token'] != stale_token:
+                    return entry['token']
+
+            try:
+                token, expires_in = self._fetch(timeout)
+                now = time.time()
+                expires_in = max(60, int(expires_in))
+                refresh_at = now + max(expires_in / 2, expires_in - self._refresh_margin)
+                cache.set(
+                    self._cache_key,
+                    {'token': token, 'expires_at': now + expires_in, 'refresh_at': refresh_at},
+                    timeout=max(30, expires_in - _EXPIRY_SAFETY_SECONDS),
+                )
+                self.refreshes += 1
+                return token
+            finally:
+                if have_lease:
+                    cache.delete(lease_key)
+
+    def refresh_if_due(self) -> None:
+        """Background tick: refresh ahead of expiry (no-op when the token is fresh)."""
+        entry = self._read()
+        if entry is None and not self.refreshes:
+            return  # nothing to keep alive until the first token has been fetched
+        if entry is None or time.time() >= entry['refresh_at']:
+            self._refresh_quietly(entry['token'] if entry else None)
+
+    def _ensure_background_refresh(self) -> None:
+        interval = float(getattr(settings, 'OAUTH_TOKEN_CHECK_INTERVAL_SECONDS', 60))
+        schedule_warmup(f'oauth:{self.name}', self.refresh_if_due, interval_seconds=interval)
+
+    def get(self, *, timeout_seconds: float | None = None) -> str:
+        self._ensure_background_refresh()
+        entry = self._read()
+        if entry is not None:
+            if time.time() >= entry['refresh_at'] and not self._background_pending:
+                # Past the refresh point but still valid: keep serving it and refresh off-thread.
+                self._background_pending = True
+                threading.Thread(target=self._refresh_quietly, args=(entry['token'],), daemon=True).start()
+            return entry['token']
+        return self._refresh(timeout_seconds=timeout_seconds)
+
+    def _refresh_quietly(self, stale_token: str | None) -> None:
+        try:
+            self.background_refreshes += 1
+            self._refresh(stale_token=stale_token)
+        except Exception:
+            logger.warning('Background refresh of %s token failed', self.name, exc_info=True)
+        finally:
+            self._background_pending = False
+
+    def invalidate(self, rejected_token: str, *, timeout_seconds: float | None = None) -> str:
+        """Called after a 401/403: get a different token, fetching only if nobody else has."""
+        return self._refresh(stale_token=rejected_token, timeout_seconds=timeout_seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        entry = self._read()
+        return {
+            'cached': entry is not None,
+            'expires_in_seconds': round(entry['expires_at'] - time.time()) if entry else None,
+            'refreshes': self.refreshes,
+            'background_refreshes': self.background_refreshes,
+        }
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+_warmers: dict[str, threading.Event] = {}
+_warmers_lock = threading.Lock()
+
+
+def _loop(name: str, fn: Callable[[], object], interval_seconds: float, run_first: bool, stop: threading.Event) -> None:
+    if not run_first and stop.wait(interval_seconds):
+        return
+    while True:
+        try:
+            fn()
+        except Exception:
+            logger.exception('Background warm-up %r failed', name)
+        finally:
+            connections.close_all()
+        if stop.wait(interval_seconds):
+            return
+
+
+def schedule_warmup(name: str, fn: Callable[[], object], *, interval_seconds: float, run_first: bool = False) -> bool:
+    """Run ``fn`` every ``interval_seconds`` on a daemon thread, once per process.
+
+    Returns True if this call started the warmer. Subsequent calls with the same
+    name are no-ops, so views can call this on every request.
+    """
+    if name in _warmers:
+        return False
+    with _warmers_lock:
+        if name in _warmers:
+            return False
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=_loop,
+            args=(name, fn, max(1.0, interval_seconds), run_first, stop),
+            name=f'landing-warmup-{name}',
+            daemon=True,
+        )
+        _warmers[name] = stop
+        thread.start()
+        return True
+
+
+def stop_warmups() -> None:
+    """Signal every background warmer in this process to exit."""
+    with _warmers_lock:
+        events = list(_warmers.values())
+        _warmers.clear()
+    for stop in events:
+        stop.set()
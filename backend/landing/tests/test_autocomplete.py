@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.models import City
+from landing.services import autocomplete
+from landing.services.autocomplete import Autocompleter
+from landing.services.city_index import AIRPORT, CITY, CityIndex, Place
+from landing.tests.test_cache import LOCMEM_CACHES
+
+
+def _entry(name, popularity, **extra):
+    return {'name': name, 'country': None, 'code': None, 'lat': None, 'lon': None,
+            'popularity': popularity, 'source': 'catalog', **extra}
+
+
+class AutocompleterTests(SimpleTestCase):
+    def setUp(self):
+        self.completer = Autocompleter([
+            _entry('Goa', 5),
+            _entry('Gothenburg', 2),
+            _entry('Gold Coast', 3),
+            _entry('New York', 9),
+            _entry('Newcastle', 4),
+            _entry('Zürich', 6),
+        ])
+
+    def _names(self, query, **kwargs):
+        return [e['name'] for e in self.completer.complete(query, **kwargs)]
+
+    def test_precomputed_short_prefixes_are_ranked_by_popularity(self):
+        self.assertEqual(self._names('go'), ['Goa', 'Gold Coast', 'Gothenburg'])
+        self.assertEqual(self._names('g', limit=2), ['Goa', 'Gold Coast'])
+
+    def test_long_prefixes_are_ranked_by_popularity(self):
+        self.assertEqual(self._names('newc'), ['Newcastle'])
+        self.assertEqual(self._names('gold c'), ['Gold Coast'])
+
+    def test_later_words_and_accents_match(self):
+        self.assertEqual(self._names('york'), ['New York'])
+        self.assertEqual(self._names('coa'), ['Gold Coast'])
+        self.assertEqual(self._names('ZUR'), ['Zürich'])
+
+    def test_empty_or_unknown_query(self):
+        self.assertEqual(self._names('  '), [])
+        self.assertEqual(self._names('xyz'), [])
+        self.assertEqual(self._names('xyzzy'), [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AutocompleteEntriesTests(TestCase):
+    def test_catalog_ranks_and_index_fills_in_codes(self):
+        City.objects.create(name='Paris', country='France', cost_index=1, popularity_score=9)
+        City.objects.create(name='Pune', country='India', cost_index=1, popularity_score=4)
+        index = CityIndex([
+            Place('PAR', 'PARIS', CITY, 'FR', 48.9, 2.4, popularity=1),
+            Place('CDG', 'Charles de Gaulle', AIRPORT, 'FR', 49.0, 2.5, city='Paris'),
+            Place('PNQ', 'Pune', CITY, 'IN', 18.5, 73.9),
+            Place('PTY', 'Panama City', CITY, 'PA', 9.0, -79.5, popularity=2),
+        ])
+
+        with mock.patch('landing.services.city_index.get_index', return_value=index), \
+                mock.patch('landing.services.city_index.learned_places', return_value=[]):
+            completer = Autocompleter(autocomplete._entries())
+
+        results = completer.complete('p')
+        self.assertEqual(
+            [(e['name'], e['code']) for e in results],
+            [('Paris', 'PAR'), ('Pune', 'PNQ'), ('Panama City', 'PTY')],
+        )
+        self.assertEqual(results[0]['popularity'], 9)
+        self.assertEqual(completer.complete('charles'), [])
@@ -0,0 +1,111 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from landing.services import breaker as breaker_module
+from landing.services.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from landing.services.http import UpstreamError, get_json
+from landing.services.pool import RawResponse
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(breaker_module.time, 'monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker('api.example', failure_threshold=3, reset_seconds=30)
+
+    def _state(self):
+        return self.breaker.snapshot()['state']
+
+    def _open(self):
+        for _ in range(3):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+        self.assertEqual(self._state(), OPEN)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success(('GET', '/'), 0.1)
+        self.breaker.record_failure()
+        self.assertEqual(self._state(), CLOSED)
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self._state(), OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_in(), 30)
+
+    def test_half_open_lets_one_probe_through(self):
+        self._open()
+        self.now += 29
+        self.assertFalse(self.breaker.allow())
+
+        self.now += 1
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self._state(), HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success(('GET', '/'), 0.1)
+        self.assertEqual(self._state(), CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens_at_once(self):
+        self._open()
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self._state(), OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_in(), 30)
+        self.assertEqual(self.breaker.snapshot()['times_opened'], 2)
+
+    def test_timeout_follows_observed_latency_within_bounds(self):
+        key = ('GET', '/search', 6.0)
+        for _ in range(19):
+            self.breaker.record_success(key, 0.2)
+        self.assertEqual(self.breaker.timeout_for(key, 6.0), 6.0)  # too few samples yet
+
+        self.breaker.record_success(key, 0.5)
+        self.assertEqual(self.breaker.timeout_for(key, 6.0), 1.5)  # p99 * 3
+        self.assertEqual(self.breaker.timeout_for(key, 1.2), 1.2)  # never above the caller's timeout
+        with override_settings(OUTBOUND_ADAPTIVE_TIMEOUTS=False):
+            self.assertEqual(self.breaker.timeout_for(key, 6.0), 6.0)
+
+        fast = ('GET', '/fast', 6.0)
+        for _ in range(20):
+            self.breaker.record_success(fast, 0.01)
+        self.assertEqual(self.breaker.timeout_for(fast, 6.0), 1.0)  # OUTBOUND_ADAPTIVE_TIMEOUT_MIN_SECONDS
+
+
+@override_settings(OUTBOUND_BREAKER_FAILURE_THRESHOLD=2, OUTBOUND_BREAKER_RESET_SECONDS=30)
+class OutboundBreakerTests(SimpleTestCase):
+    """get_json counts transport errors and 5xx/429 against the host, but not other 4xx."""
+
+    def _url(self, path='/v1/search'):
+        return f'https://{self.id()}.example{path}'
+
+    def test_open_breaker_rejects_without_sending(self):
+        with mock.patch('landing.services.http._send', side_effect=TimeoutError('timed out')) as send:
+            for _ in range(2):
+                with self.assertRaises(UpstreamError):
+                    get_json(self._url())
+            with self.assertRaises(UpstreamError) as rejected:
+                get_json(self._url('/v1/other'))
+
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(rejected.exception.status, 503)
+        self.assertEqual(rejected.exception.details['host'], f'{self.id()}.example')
+
+    def test_client_errors_do_not_open_the_breaker(self):
+        not_found = RawResponse(status=404, headers={}, body=b'{}')
+        with mock.patch('landing.services.http._send', return_value=not_found) as send:
+            for _ in range(3):
+                with self.assertRaises(UpstreamError) as error:
+                    get_json(self._url())
+                self.assertEqual(error.exception.status, 404)
+
+        self.assertEqual(send.call_count, 3)
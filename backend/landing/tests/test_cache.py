@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from landing.services import cache as landing_cache
+from landing.services.cache import _key, acache_get_or_set, cache_get_or_set
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'landing-tests-default'},
+    'landing': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'landing-tests'},
+}
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('condition not met in time')
+        time.sleep(0.02)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LANDING_CACHE_STALE_TTL_SECONDS=0)
+class SingleFlightTests(SimpleTestCase):
+    """Concurrent misses for one key share a single compute, in-process and across processes."""
+
+    def setUp(self):
+        caches['landing'].clear()
+
+    def _stat(self, name):
+        return landing_cache.cache_stats()[name]
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'value'
+
+        def worker():
+            results.append(cache_get_or_set('test', {'q': 'flight'}, 60, compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(results), [('value', False)] + [('value', True)] * 7)
+
+    def test_leader_error_reaches_waiters(self):
+        errors = []
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError('upstream down')
+
+        def worker():
+            try:
+                cache_get_or_set('test', {'q': 'error'}, 60, compute)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait(1)
+        follower = threading.Thread(target=worker)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertIs(errors[0], errors[1])
+
+    def test_waits_for_another_process_holding_the_lease(self):
+        key = _key('test', {'q': 'remote'})
+        caches['landing'].add(f'{key}:lease', 'other-process', timeout=5)
+
+        def other_process_finishes():
+            time.sleep(0.2)
+            landing_cache._store(key, 'remote value', 60, 0)
+
+        threading.Thread(target=other_process_finishes).start()
+        coalesced = self._stat('coalesced_remote')
+        value, cached = cache_get_or_set('test', {'q': 'remote'}, 60, lambda: self.fail('computed twice'))
+
+        self.assertEqual((value, cached), ('remote value', True))
+        self.assertEqual(self._stat('coalesced_remote'), coalesced + 1)
+
+    def test_expired_lease_is_taken_over(self):
+        key = _key('test', {'q': 'abandoned'})
+        # The holder died without writing a value; its lease expires after a second.
+        caches['landing'].add(f'{key}:lease', 'dead-process', timeout=1)
+
+        started = time.monotonic()
+        value, cached = cache_get_or_set('test', {'q': 'abandoned'}, 60, lambda: 'recomputed')
+
+        self.assertEqual((value, cached), ('recomputed', False))
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertIsNone(caches['landing'].get(f'{key}:lease'))
+
+    @override_settings(LANDING_SINGLE_FLIGHT_TIMEOUT_SECONDS=0.3)
+    def test_gives_up_waiting_after_the_single_flight_timeout(self):
+        key = _key('test', {'q': 'slow'})
+        caches['landing'].add(f'{key}:lease', 'slow-process', timeout=30)
+        timeouts = self._stat('wait_timeouts')
+
+        started = time.monotonic()
+        value, cached = cache_get_or_set('test', {'q': 'slow'}, 60, lambda: 'local value')
+
+        self.assertEqual((value, cached), ('local value', False))
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(self._stat('wait_timeouts'), timeouts + 1)
+        # The other process still owns its lease.
+        self.assertEqual(caches['landing'].get(f'{key}:lease'), 'slow-process')
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LANDING_CACHE_REFRESH_RETRY_SECONDS=60)
+class StaleWhileRevalidateTests(SimpleTestCase):
+    """Past the soft TTL the old value is served at once while one background refresh runs."""
+
+    def setUp(self):
+        caches['landing'].clear()
+        self.key = _key('test', {'q': 'swr'})
+        landing_cache._store(self.key, 'old', 0, 60)  # already stale, kept for a minute
+
+    def _cached_value(self):
+        return landing_cache._unwrap(caches['landing'].get(self.key))
+
+    def test_stale_value_is_served_and_refreshed_once(self):
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return 'new'
+
+        for _ in range(3):
+            self.assertEqual(cache_get_or_set('test', {'q': 'swr'}, 60, compute, stale_ttl_seconds=60), ('old', True))
+        release.set()
+        _wait_for(lambda: self._cached_value() == ('new', True))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache_get_or_set('test', {'q': 'swr'}, 60, compute, stale_ttl_seconds=60), ('new', True))
+        self.assertIsNone(caches['landing'].get(f'{self.key}:refresh'))
+
+    def test_failed_refresh_keeps_serving_stale_and_backs_off(self):
+        calls = []
+        failures = landing_cache.cache_stats()['refresh_failures']
+
+        def compute():
+            calls.append(1)
+            raise ValueError('upstream down')
+
+        with self.assertLogs('landing.services.cache', 'WARNING'):
+            self.assertEqual(cache_get_or_set('test', {'q': 'swr'}, 60, compute, stale_ttl_seconds=60), ('old', True))
+            _wait_for(lambda: landing_cache.cache_stats()['refresh_failures'] == failures + 1)
+
+        # The refresh lease stays until LANDING_CACHE_REFRESH_RETRY_SECONDS, so no retry yet.
+        self.assertEqual(cache_get_or_set('test', {'q': 'swr'}, 60, compute, stale_ttl_seconds=60), ('old', True))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self._cached_value(), ('old', False))
+
+    def test_value_past_the_hard_ttl_is_recomputed(self):
+        landing_cache._store(self.key, 'old', 0, 1)
+        time.sleep(1.1)
+
+        self.assertEqual(cache_get_or_set('test', {'q': 'swr'}, 60, lambda: 'new', stale_ttl_seconds=60), ('new', False))
+
+    async def test_async_stale_value_is_served_and_refreshed(self):
+        async def acompute():
+            return 'new'
+
+        self.assertEqual(await acache_get_or_set('test', {'q': 'swr'}, 60, acompute, stale_ttl_seconds=60), ('old', True))
+        await asyncio.gather(*landing_cache._arefresh_tasks)
+
+        self.assertEqual(await acache_get_or_set('test', {'q': 'swr'}, 60, acompute, stale_ttl_seconds=60), ('new', True))
@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from landing.providers import amadeus
+from landing.services.city_index import AIRPORT, CITY, CityIndex, Place, normalize
+
+
+PLACES = [
+    Place('LON', 'London', CITY, 'GB', 51.5, -0.1, popularity=9),
+    Place('LHR', 'London Heathrow', AIRPORT, 'GB', 51.5, -0.5, city='London', popularity=8),
+    Place('YXU', 'London', CITY, 'CA', 43.0, -81.2, popularity=1),
+    Place('NYC', 'New York', CITY, 'US', 40.7, -74.0, popularity=9),
+    Place('PAR', 'Paris', CITY, 'FR', 48.9, 2.4, popularity=9),
+    Place('SAO', 'São Paulo', CITY, 'BR', -23.5, -46.6, popularity=7),
+    Place('BOM', 'Mumbai', CITY, 'IN', 19.1, 72.9, popularity=8),
+    Place('MUC', 'Munich', CITY, 'DE', 48.1, 11.6, popularity=7),
+]
+
+
+class CityIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = CityIndex(PLACES)
+
+    def _codes(self, places):
+        return [p.code for p in places]
+
+    def test_normalize(self):
+        self.assertEqual(normalize('  São   Paulo! '), 'sao paulo')
+
+    def test_code_matches_come_first(self):
+        self.assertEqual(self._codes(self.index.search('lhr')), ['LHR'])
+        self.assertEqual(self._codes(self.index.search('LON')), ['LON', 'YXU', 'LHR'])
+
+    def test_prefix_ranks_cities_then_popularity(self):
+        self.assertEqual(self._codes(self.index.search('lond')), ['LON', 'YXU', 'LHR'])
+        self.assertEqual(self._codes(self.index.search('london', limit=2)), ['LON', 'YXU'])
+
+    def test_any_word_of_a_name_is_a_prefix(self):
+        self.assertEqual(self._codes(self.index.search('york')), ['NYC'])
+        self.assertEqual(self._codes(self.index.search('sao pa')), ['SAO'])
+        self.assertEqual(self._codes(self.index.search('paulo')), ['SAO'])
+
+    def test_one_typo_is_found_by_fuzzy_match(self):
+        self.assertEqual(self._codes(self.index.search('pairs')), ['PAR'])
+        self.assertEqual(self._codes(self.index.search('munbai')), ['BOM'])
+        self.assertEqual(self._codes(self.index.search('londn')), ['LON', 'YXU', 'LHR'])
+
+    def test_short_or_distant_queries_find_nothing(self):
+        self.assertEqual(self.index.search('zzz'), [])
+        self.assertEqual(self.index.search('prs'), [])  # too short for fuzzy matching
+        self.assertEqual(self.index.search('pxrxs'), [])
+
+
+class SearchCitiesTests(SimpleTestCase):
+    """search_cities answers from the index and asks Amadeus only for fuzzy-only partial results."""
+
+    def setUp(self):
+        index = CityIndex(PLACES)
+        for target, replacement in (
+            ('landing.services.city_index.search', index.search),
+            ('landing.providers.amadeus._remember_cities', lambda cities: None),
+        ):
+            patcher = mock.patch(target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _upstream(self, *places):
+        return mock.patch.object(
+            amadeus, '_search_cities_upstream', return_value=[amadeus._city_from_place(p) for p in places]
+        )
+
+    def test_prefix_hit_is_answered_locally(self):
+        with self._upstream() as upstream:
+            cities = amadeus.search_cities('par', limit=6)
+        upstream.assert_not_called()
+        self.assertEqual([c.provider_place_id for c in cities], ['PAR'])
+
+    def test_fuzzy_only_results_are_merged_with_upstream(self):
+        mumbai_airport = Place('BOM', 'Chhatrapati Shivaji', AIRPORT, 'IN', 19.1, 72.9, city='Mumbai')
+        munich = Place('MUC', 'Munich', CITY, 'DE', 48.1, 11.6)
+        with self._upstream(mumbai_airport, munich) as upstream:
+            cities = amadeus.search_cities('munbai', limit=6)
+        upstream.assert_called_once()
+        self.assertEqual([c.name for c in cities], ['Chhatrapati Shivaji', 'Munich'])
+
+    def test_city_and_its_airport_are_returned_once(self):
+        heathrow = Place('LHR', 'Heathrow', AIRPORT, 'GB', 51.5, -0.5, city='LONDON')
+        local = [amadeus._city_from_place(PLACES[0])]
+        merged = amadeus._merge_cities([amadeus._city_from_place(heathrow)], local, 6)
+        self.assertEqual([c.provider_place_id for c in merged], ['LHR'])
@@ -0,0 +1,125 @@
+from datetime import date
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from landing.providers import groq
+from landing.services import intent
+from landing.services.intent import Gazetteer, classify, extract_date
+
+
+TODAY = date(2026, 3, 1)  # a Sunday
+THRESHOLD = 0.7
+
+PLACES = [
+    ('Chennai', 'MAA'), ('Delhi', 'DEL'), ('Mumbai', 'BOM'), ('Bangalore', 'BLR'), ('Goa', 'GOI'),
+    ('Pune', 'PNQ'), ('Jaipur', 'JAI'), ('London', 'LON'), ('Paris', 'PAR'), ('Dubai', 'DXB'),
+    ('Bangkok', 'BKK'), ('Rome', 'ROM'), ('Bali', 'DPS'), ('Lisbon', 'LIS'), ('Maldives', 'MLE'),
+    ('Manali', None), ('Shimla', None), ('Phuket', 'HKT'), ('Zurich', 'ZRH'),
+]
+GAZETTEER = Gazetteer(PLACES, codes=[code for _, code in PLACES if code])
+
+# (message, intent, slots) the classifier must get right with confidence >= THRESHOLD.
+CONFIDENT = [
+    ('Find me flights from Chennai to Delhi on 5th April', 'flight', {'origin': 'MAA', 'destination': 'DEL', 'date': '2026-04-05'}),
+    ('MAA to DEL flights tomorrow', 'flight', {'origin': 'MAA', 'destination': 'DEL', 'date': '2026-03-02'}),
+    ('cheapest flight to Goa next friday', 'flight', {'origin': None, 'destination': 'GOI', 'date': '2026-03-06'}),
+    ('flights BLR - BKK on 2026-05-10', 'flight', {'origin': 'BLR', 'destination': 'BKK', 'date': '2026-05-10'}),
+    ('flying to Rome from Chennai', 'flight', {'origin': 'MAA', 'destination': 'ROM'}),
+    ('Need a flight out of Pune to Jaipur on 3/4', 'flight', {'origin': 'PNQ', 'destination': 'JAI', 'date': '2026-04-03'}),
+    ('Hotels in Paris', 'hotel', {'destination': 'Paris'}),
+    ('Find a hotel in Goa for 3 nights from 10 April', 'hotel', {'destination': 'Goa', 'date': '2026-04-10'}),
+    ('where to stay in Bangkok', 'hotel', {'destination': 'Bangkok'}),
+    ('Suggest a resort in the Maldives', 'hotel', {'destination': 'Maldives'}),
+    ('Show me hotels in Dubai tomorrow', 'hotel', {'destination': 'Dubai', 'date': '2026-03-02'}),
+    ('Where should I go for a beach holiday?', 'destination', {'destination': None}),
+    ('What are the best places to visit near Manali', 'destination', {'destination': 'Manali'}),
+    ('things to do in Bali', 'destination', {'destination': 'Bali'}),
+    ('cities like Lisbon', 'destination', {'destination': 'Lisbon'}),
+    ('Do I need a visa for Singapore?', 'general', {}),
+    ('What should I pack for Zurich in winter?', 'general', {}),
+    ('thanks, that helps!', 'general', {}),
+    ('How is the weather in London in March?', 'general', {}),
+]
+
+# Mixed or missing signals: these must be left to the LLM.
+UNSURE = [
+    'Tell me about Shimla',
+    'how much luggage can I carry on a flight',
+    'I want to go to Phuket',
+    'round trip from Chennai to Bangkok in may',
+    'hi',
+]
+
+
+class ClassifyTests(SimpleTestCase):
+    def test_confident_corpus(self):
+        for message, expected, slots in CONFIDENT:
+            with self.subTest(message=message):
+                result = classify(message, GAZETTEER, today=TODAY)
+                self.assertGreaterEqual(result.confidence, THRESHOLD)
+                self.assertEqual(result.intent, expected)
+                for name, value in slots.items():
+                    self.assertEqual(getattr(result, name), value, name)
+
+    def test_unsure_corpus(self):
+        for message in UNSURE:
+            with self.subTest(message=message):
+                self.assertLess(classify(message, GAZETTEER, today=TODAY).confidence, THRESHOLD)
+
+    def test_as_dict_matches_the_llm_shape(self):
+        result = classify('Hotels in Paris', GAZETTEER, today=TODAY).as_dict()
+        self.assertEqual(set(result), {'intent', 'origin', 'destination', 'date'})
+
+    def test_extract_date(self):
+        for message, expected in (
+            ('on 2026-02-10', '2026-02-10'),  # explicit ISO dates are kept as given
+            ('on 5th April', '2026-04-05'),
+            ('on Feb 3', '2027-02-03'),  # already past this year
+            ('on 3/4', '2026-04-03'),
+            ('day after tomorrow', '2026-03-03'),
+            ('this sunday', '2026-03-08'),
+            ('sometime soon', None),
+        ):
+            with self.subTest(message=message):
+                self.assertEqual(extract_date(message, today=TODAY), expected)
+
+
+@override_settings(GROQ_LOCAL_INTENT_ENABLED=True, GROQ_LOCAL_INTENT_MIN_CONFIDENCE=THRESHOLD)
+class DetectIntentRoutingTests(SimpleTestCase):
+    """_detect_intent answers confident messages locally and sends the rest to the LLM."""
+
+    def setUp(self):
+        for target, kwargs in (
+            ('landing.services.intent.get_gazetteer', {'return_value': GAZETTEER}),
+            ('landing.providers.groq._detect_intent_llm', {'return_value': {'intent': 'general'}}),
+        ):
+            patcher = mock.patch(target, **kwargs)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        self.llm = groq._detect_intent_llm
+
+    def _detect(self, message):
+        return groq._detect_intent(message, api_key='key', model='model')
+
+    def test_confident_messages_skip_the_llm(self):
+        before = intent.intent_stats()
+        for message, expected, _ in CONFIDENT:
+            with self.subTest(message=message):
+                self.assertEqual(self._detect(message)['intent'], expected)
+
+        self.llm.assert_not_called()
+        self.assertEqual(intent.intent_stats()['local'], before['local'] + len(CONFIDENT))
+
+    def test_unsure_messages_go_to_the_llm(self):
+        before = intent.intent_stats()
+        for message in UNSURE:
+            self.assertEqual(self._detect(message), {'intent': 'general'})
+
+        self.assertEqual(self.llm.call_count, len(UNSURE))
+        self.assertEqual(intent.intent_stats()['llm_fallback'], before['llm_fallback'] + len(UNSURE))
+
+    @override_settings(GROQ_LOCAL_INTENT_ENABLED=False)
+    def test_disabled_classifier_always_asks_the_llm(self):
+        self._detect('Hotels in Paris')
+        self.llm.assert_called_once()
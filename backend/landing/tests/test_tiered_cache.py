@@ -0,0 +1,91 @@
+import time
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from landing.services.tiered_cache import LocalLRU, TieredCache
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'landing-tests-default'},
+    'tiered_shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'landing-tests-l2'},
+})
+class TieredCacheTests(SimpleTestCase):
+    """Two TieredCache instances with their own L1 stand in for two workers sharing one L2."""
+
+    def setUp(self):
+        caches['tiered_shared'].clear()
+
+    def _worker(self, name, **options):
+        options = {'SHARED_ALIAS': 'tiered_shared', **options}
+        return TieredCache(f'{self.id()}-{name}', {'TIMEOUT': 60, 'OPTIONS': options})
+
+    def test_read_back_fills_the_local_tier(self):
+        a, b = self._worker('a'), self._worker('b')
+        a.set('key', 'value')
+        self.assertEqual(b.get('key'), 'value')
+
+        caches['tiered_shared'].clear()
+        self.assertEqual(b.get('key'), 'value')
+        self.assertEqual(b.stats()['local']['hits'], 1)
+
+    def test_local_copy_lives_at_most_local_timeout(self):
+        a, b = self._worker('a'), self._worker('b', LOCAL_TIMEOUT=1)
+        a.set('key', 'old')
+        self.assertEqual(b.get('key'), 'old')
+        a.set('key', 'new')
+        self.assertEqual(b.get('key'), 'old')
+
+        time.sleep(1.1)
+        self.assertEqual(b.get('key'), 'new')
+
+    def test_back_fill_never_outlives_the_shared_entry(self):
+        a, b = self._worker('a'), self._worker('b')
+        a.set('key', 'value', timeout=1)
+        self.assertEqual(b.get('key'), 'value')
+
+        time.sleep(1.1)
+        self.assertIsNone(b.get('key'))
+
+    def test_lease_keys_are_always_read_from_the_shared_tier(self):
+        a, b = self._worker('a'), self._worker('b')
+        self.assertIsNone(b.get('key:lease'))
+        self.assertTrue(a.add('key:lease', 'token-a', timeout=30))
+        self.assertEqual(b.get('key:lease'), 'token-a')
+        self.assertFalse(b.add('key:lease', 'token-b', timeout=30))
+
+        a.delete('key:lease')
+        self.assertIsNone(b.get('key:lease'))
+        self.assertFalse(b.has_key('key:refresh'))
+        a.set('key:refresh', 1)
+        self.assertTrue(b.has_key('key:refresh'))
+
+    def test_delete_removes_both_tiers(self):
+        a = self._worker('a')
+        a.set('key', 'value')
+        a.delete('key')
+        self.assertIsNone(a.get('key'))
+        self.assertIsNone(caches['tiered_shared'].get('key'))
+
+
+class LocalLRUTests(SimpleTestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        lru = LocalLRU(2)
+        lru.set('a', 1, None)
+        lru.set('b', 2, None)
+        lru.get('a')
+        lru.set('c', 3, None)
+
+        self.assertEqual(lru.get('b'), (False, None))
+        self.assertEqual((lru.get('a'), lru.get('c')), ((True, 1), (True, 3)))
+        self.assertEqual(lru.stats()['evictions'], 1)
+
+    def test_cached_values_are_copies(self):
+        lru = LocalLRU(2)
+        value = {'results': [1]}
+        lru.set('a', value, 30)
+        value['results'].append(2)
+        _, cached = lru.get('a')
+        cached['results'].append(3)
+
+        self.assertEqual(lru.get('a'), (True, {'results': [1]}))
@@ -0,0 +1,76 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from landing.services.tokens import SharedToken
+from landing.tests.test_cache import LOCMEM_CACHES, _wait_for
+
+
+@override_settings(CACHES=LOCMEM_CACHES, OUTBOUND_HTTP_TIMEOUT_SECONDS=6.0, OAUTH_TOKEN_REFRESH_MARGIN_SECONDS=300)
+class SharedTokenTests(SimpleTestCase):
+    def setUp(self):
+        caches['landing'].clear()
+        patcher = mock.patch('landing.services.tokens.schedule_warmup')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fetches = []
+
+    def _token(self, expires_in=1800, delay=0.0):
+        def fetch(timeout_seconds):
+            self.fetches.append(timeout_seconds)
+            time.sleep(delay)
+            return f'token-{len(self.fetches)}', expires_in
+
+        return SharedToken(self.id(), fetch)
+
+    def test_concurrent_callers_share_one_fetch(self):
+        token = self._token(delay=0.2)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(token.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['token-1'] * 5)
+        self.assertEqual(len(self.fetches), 1)
+        # Another worker's instance reads the shared entry instead of fetching.
+        self.assertEqual(SharedToken(self.id(), lambda timeout: self.fail('fetched again')).get(), 'token-1')
+
+    def test_token_past_refresh_point_is_served_while_refreshing(self):
+        token = self._token()
+        self.assertEqual(token.get(), 'token-1')
+        entry = caches['landing'].get(token._cache_key)
+        caches['landing'].set(token._cache_key, {**entry, 'refresh_at': time.time() - 1})
+
+        self.assertEqual(token.get(), 'token-1')
+        _wait_for(lambda: token.get() == 'token-2')
+        self.assertEqual(token.background_refreshes, 1)
+
+    def test_invalidate_fetches_only_once_per_rejected_token(self):
+        token = self._token()
+        self.assertEqual(token.get(), 'token-1')
+
+        self.assertEqual(token.invalidate('token-1'), 'token-2')
+        # A second caller holding the same rejected token gets the replacement.
+        self.assertEqual(token.invalidate('token-1'), 'token-2')
+        self.assertEqual(len(self.fetches), 2)
+
+    def test_fetch_uses_the_caller_timeout(self):
+        token = self._token()
+        token.get(timeout_seconds=2.5)
+        token.invalidate('token-1', timeout_seconds=1.5)
+        token.invalidate('token-2')
+
+        self.assertEqual(self.fetches, [2.5, 1.5, 6.0])
+
+    def test_wait_for_another_worker_is_bounded_by_the_caller_timeout(self):
+        token = self._token()
+        caches['landing'].add(f'{token._cache_key}:lease', 1, timeout=30)
+
+        started = time.monotonic()
+        self.assertEqual(token.get(timeout_seconds=0.3), 'token-1')
+        self.assertLess(time.monotonic() - started, 1)
@@ -1,16 +1,30 @@
 from django.urls import path
 
+from landing.async_views import (
+    AsyncAttractionsView,
+    AsyncBannerView,
+    AsyncChatBotView,
+    AsyncDestinationsView,
+    AsyncHomeView,
+    AsyncTrendingView,
+    AsyncTripAIEnhanceView,
+    AsyncTripSearchFlightsView,
+    AsyncTripSearchHotelsView,
+)
 from landing.views import (
     LandingHealthView,
     LandingConfigView,
+    LandingMetricsView,
     LandingHomeView,
     LandingBannerView,
+    LandingAutocompleteView,
     LandingDestinationsView,
     LandingTrendingView,
     LandingAttractionsView,
     TripSearchFlightsView,
     TripSearchHotelsView,
     TripAIEnhanceView,
+    TripAIEnhanceImagesView,
     ChatBotView,
 )
 
@@ -19,13 +33,27 @@ app_name = 'landing'
 urlpatterns = [
     path('health/', LandingHealthView.as_view(), name='health'),
     path('config/', LandingConfigView.as_view(), name='config'),
+    path('metrics/', LandingMetricsView.as_view(), name='metrics'),
     path('home/', LandingHomeView.as_view(), name='home'),
     path('banner/', LandingBannerView.as_view(), name='banner'),
+    path('autocomplete/', LandingAutocompleteView.as_view(), name='autocomplete'),
     path('destinations/', LandingDestinationsView.as_view(), name='destinations'),
     path('trending/', LandingTrendingView.as_view(), name='trending'),
     path('attractions/', LandingAttractionsView.as_view(), name='attractions'),
     path('trip/enhance/', TripAIEnhanceView.as_view(), name='trip_enhance'),
+    path('trip/enhance/images/', TripAIEnhanceImagesView.as_view(), name='trip_enhance_images'),
     path('trip/flights/', TripSearchFlightsView.as_view(), name='trip_flights'),
     path('trip/hotels/', TripSearchHotelsView.as_view(), name='trip_hotels'),
     path('chat/', ChatBotView.as_view(), name='chat'),
+
+    # Same endpoints as async views (use under ASGI, e.g. uvicorn backend.asgi:application).
+    path('async/home/', AsyncHomeView.as_view(), name='async_home'),
+    path('async/banner/', AsyncBannerView.as_view(), name='async_banner'),
+    path('async/destinations/', AsyncDestinationsView.as_view(), name='async_destinations'),
+    path('async/trending/', AsyncTrendingView.as_view(), name='async_trending'),
+    path('async/attractions/', AsyncAttractionsView.as_view(), name='async_attractions'),
+    path('async/trip/enhance/', AsyncTripAIEnhanceView.as_view(), name='async_trip_enhance'),
+    path('async/trip/flights/', AsyncTripSearchFlightsView.as_view(), name='async_trip_flights'),
+    path('async/trip/hotels/', AsyncTripSearchHotelsView.as_view(), name='async_trip_hotels'),
+    path('async/chat/', AsyncChatBotView.as_view(), name='async_chat'),
 ]
@@ -8,11 +8,19 @@ from rest_framework.throttling import AnonRateThrottle
 
 from landing.api.base import LandingAPIView
 from landing.api.errors import error_response
-from landing.providers.amadeus import search_cities, search_flights_offer
-from landing.providers.pexels import search_image
-from landing.providers.serpapi import search_hotels
-from landing.services.cache import cache_get_or_set
+from landing.api.streaming import EventStreamMixin, event_stream_response, wants_event_stream
+from landing.providers.amadeus import find_flight_offers, search_cities, token_state as amadeus_token_state
+from landing.providers.groq import response_cache_stats as groq_cache_stats
+from landing.providers.pexels import image_cache_stats, search_image
+from landing.providers.serpapi import find_hotels
+from landing.services import autocomplete, intent
+from landing.services.attractions import attractions_url, parse_attractions, stored_attractions
+from landing.services.async_pool import async_pool_snapshot
+from landing.services.breaker import breaker_states
+from landing.services.cache import cache_get_or_set, cache_refresh, cache_set, cache_stats
+from landing.services.concurrency import Deadline, fan_out
 from landing.services.http import UpstreamError, get_json
+from landing.services.pool import get_pool
 
 
 # Default popular destinations for Screen 3 initial load  
@@ -35,6 +43,94 @@ DEFAULT_DESTINATIONS = [
 ]
 
 
+# Amadeus test API limitation workaround: cities it only finds by airport code.
+AIRPORT_CODE_MAP = {
+    'dubai': ['DXB', 'DWC'],  # Dubai Int'l and Al Maktoum
+    'tokyo': ['TYO', 'NRT', 'HND'],  # Tokyo, Narita, Haneda
+    'madrid': ['MAD'],
+    'barcelona': ['BCN'],
+    'rome': ['FCO', 'CIA'],  # Fiumicino and Ciampino
+    'milan': ['MXP', 'LIN'],  # Malpensa and Linate
+    'sydney': ['SYD'],
+    'melbourne': ['MEL'],
+    'istanbul': ['IST'],
+    'moscow': ['MOW', 'SVO'],
+    'beijing': ['PEK'],
+    'shanghai': ['PVG', 'SHA'],
+}
+
+
+def _best_match_first(q: str, places: list) -> list:
+    """Up to 8 places, the best match (exact or starts with) first."""
+    search_lower = q.lower()
+    best_match = None
+    other_matches = []
+
+    for p in places:
+        name_lower = p.name.lower()
+
+        if not best_match and (name_lower == search_lower or name_lower.startswith(search_lower)):
+            best_match = p
+        else:
+            other_matches.append(p)
+
+    # Start with the best match, then other search results
+    selected = [best_match] if best_match else []
+    selected.extend(other_matches[:7 if best_match else 8])
+    return selected
+
+
+def _default_fill(selected: list, places: list) -> tuple[int, list[dict]]:
+    """How many popular destinations to add, and which ones to try (0, [] for none)."""
+    # If we don't have 8 results and no specific search was done, fill with defaults
+    # For actual searches, only fill if we got very few results (< 4)
+    # This prevents mixing Dubai results with Indian cities
+    if len(selected) >= 8 or (places and len(selected) >= 4):
+        return 0, []
+    # Either no results or very few - add some popular destinations
+    needed = 8 - len(selected)
+    existing_names = {p.name.lower() for p in selected}
+    candidates = [
+        d for d in DEFAULT_DESTINATIONS
+        if d['name'].lower() not in existing_names
+    ][:needed + 2]  # small slack in case a lookup fails
+    return needed, candidates
+
+
+def _banner_payload(query: str, img) -> dict:
+    return {
+        'query': query,
+        'image_url': img.url if img else None,
+        'source': 'pexels' if img else None,
+    }
+
+
+def _request_deadline() -> Deadline:
+    """Overall budget for the upstream fan-out of a single landing request."""
+    return Deadline(float(getattr(settings, 'LANDING_FANOUT_DEADLINE_SECONDS', 8.0)))
+
+
+def _place_image(place, timeout: float):
+    image_query = f"{place.name} {place.country or ''} travel".strip()
+    try:
+        return search_image(image_query, timeout_seconds=timeout)
+    except UpstreamError:
+        return None
+
+
+def _place_result(place, img) -> dict:
+    return {
+        'provider': 'amadeus',
+        'provider_place_id': place.provider_place_id,
+        'name': place.name,
+        'country': place.country,
+        'lat': place.lat,
+        'lon': place.lon,
+        'image_url': img.url if img else None,
+        'image_source': 'pexels' if img else None,
+    }
+
+
 class LandingHealthView(LandingAPIView):
     permission_classes = (AllowAny,)
     throttle_classes = (AnonRateThrottle,)
@@ -43,6 +139,25 @@ class LandingHealthView(LandingAPIView):
         return Response({'status': 'ok'})
 
 
+class LandingMetricsView(LandingAPIView):
+    """Operational counters for this worker process (no secrets)."""
+
+    permission_classes = (AllowAny,)
+    throttle_classes = (AnonRateThrottle,)
+
+    def get(self, request):
+        return Response({
+            'cache': cache_stats(),
+            'images': image_cache_stats(),
+            'intent': intent.intent_stats(),
+            'llm_cache': groq_cache_stats(),
+            'http_pool': get_pool().snapshot(),
+            'async_http_pool': async_pool_snapshot(),
+            'breakers': breaker_states(),
+            'tokens': {'amadeus': amadeus_token_state()},
+        })
+
+
 class LandingConfigView(LandingAPIView):
     permission_classes = (AllowAny,)
     throttle_classes = (AnonRateThrottle,)
@@ -55,6 +170,93 @@ class LandingConfigView(LandingAPIView):
         })
 
 
+TRENDING_MAX_LIMIT = 12
+
+
+class DegradedTrending(UpstreamError):
+    """Too few trending destinations got an image; ``results`` is the list without them."""
+
+    def __init__(self, message: str, results: list[dict]):
+        super().__init__(message, status=502)
+        self.results = results
+
+
+def _check_trending(places: list, images: list) -> None:
+    """Refuse to replace a cached trending list with a degraded one.
+
+    Raises UpstreamError when no destination resolved, and DegradedTrending when
+    Pexels is configured but fewer than LANDING_TRENDING_MIN_IMAGE_RATIO of the
+    destinations got an image. Refreshes then keep the previous entry; a cold
+    request serves the degraded list instead (see ``_store_degraded_trending``).
+    """
+    if not places:
+        raise UpstreamError('No trending destinations could be resolved', status=502)
+    if not getattr(settings, 'LANDING_INTEGRATIONS', {}).get('pexels'):
+        return
+    min_ratio = float(getattr(settings, 'LANDING_TRENDING_MIN_IMAGE_RATIO', 0.5))
+    with_image = sum(1 for img in images if img)
+    if with_image < len(places) * min_ratio:
+        raise DegradedTrending(
+            f'Only {with_image}/{len(places)} trending destinations have an image',
+            [_place_result(p, img) for p, img in zip(places, images)],
+        )
+
+
+def _store_degraded_trending(results: list[dict]) -> None:
+    """Cache a degraded list briefly when nothing better is cached, so the next rebuild comes soon."""
+    ttl = int(getattr(settings, 'LANDING_TRENDING_DEGRADED_TTL_SECONDS', 300))
+    cache_set('trending', {'limit': TRENDING_MAX_LIMIT}, ttl, results, keep_existing=True)
+
+
+def build_trending(*, timeout: float) -> list[dict]:
+    """Build the full trending list (up to TRENDING_MAX_LIMIT destinations).
+
+    City lookups run concurrently, then images for the cities found; both stages
+    share one deadline. A destination whose lookup fails is skipped, and one whose
+    image lookup fails or runs out of time is returned without an image; when too
+    many are, DegradedTrending is raised instead (see ``_check_trending``).
+    """
+    deadline = _request_deadline()
+
+    def lookup(dest):
+        # Search for the city to get proper Amadeus data
+        places = search_cities(dest['name'], limit=1, timeout_seconds=timeout)
+        return places[0] if places else None
+
+    found = fan_out(lookup, DEFAULT_DESTINATIONS[:TRENDING_MAX_LIMIT], deadline=deadline)
+    places = [p for p in found if p is not None]
+    images = fan_out(lambda p: _place_image(p, timeout), places, deadline=deadline)
+    _check_trending(places, images)
+    return [_place_result(p, img) for p, img in zip(places, images)]
+
+
+def trending_refresh_interval() -> float:
+    """Rebuild trending a little before it expires (LANDING_TRENDING_REFRESH_SECONDS overrides)."""
+    ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+    return float(getattr(settings, 'LANDING_TRENDING_REFRESH_SECONDS', 0) or ttl * 0.8)
+
+
+def warm_trending() -> list[dict] | None:
+    """Rebuild the cached trending payload so no visitor pays the cold cost.
+
+    Returns None when another worker rebuilt it recently or is rebuilding it now.
+    A degraded rebuild keeps the cached list, or is stored briefly if there is none.
+    """
+    timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
+    ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
+    try:
+        return cache_refresh(
+            'trending',
+            {'limit': TRENDING_MAX_LIMIT},
+            ttl,
+            lambda: build_trending(timeout=timeout),
+            min_age_seconds=trending_refresh_interval() * 0.9,
+        )
+    except DegradedTrending as e:
+        _store_degraded_trending(e.results)
+        raise
+
+
 class LandingTrendingView(LandingAPIView):
     """Screen 3: Default trending/popular destinations shown on page load."""
 
@@ -65,40 +267,23 @@ class LandingTrendingView(LandingAPIView):
         timeout = getattr(settings, 'OUTBOUND_HTTP_TIMEOUT_SECONDS', 6.0)
         ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
         limit = int(request.query_params.get('limit') or 8)
-        limit = max(4, min(limit, 12))
+        limit = max(4, min(limit, TRENDING_MAX_LIMIT))
 
-        def compute():
-            results = []
-            for dest in DEFAULT_DESTINATIONS[:limit]:
-                try:
-                    # Search for the city to get proper Amadeus data
-                    places = search_cities(dest['name'], limit=1, timeout_seconds=timeout)
-                    if places:
-                        p = places[0]
-                        image_query = f"{p.name} {p.country or ''} travel".strip()
-                        try:
-                            img = search_image(image_query, timeout_seconds=timeout)
-                        except UpstreamError:
-                            img = None
-                        results.append({
-                            'provider': 'amadeus',
-                            'provider_place_id': p.provider_place_id,
-                            'name': p.name,
-                            'country': p.country,
-                            'lat': p.lat,
-                            'lon': p.lon,
-                            'image_url': img.url if img else None,
-                            'image_source': 'pexels' if img else None,
-                        })
-                except Exception:
-                    # Skip if city lookup fails
-                    continue
-            return results
-
-        results, cached = cache_get_or_set('trending', {'limit': limit}, ttl, compute)
+        # One cached list serves every limit, kept warm by the warmer started in LandingConfig.ready().
+        try:
+            results, cached = cache_get_or_set(
+                'trending',
+                {'limit': TRENDING_MAX_LIMIT},
+                ttl,
+                lambda: build_trending(timeout=timeout),
+            )
+        except DegradedTrending as e:
+            # Cold miss: a list without images beats an error (refreshes keep the old entry instead).
+            _store_degraded_trending(e.results)
+            results, cached = e.results, False
         return Response({
             'cached': cached,
-            'results': results,
+            'results': results[:limit],
         })
 
 
@@ -119,11 +304,7 @@ class LandingBannerView(LandingAPIView):
                 img = search_image(query, timeout_seconds=timeout)
             except UpstreamError:
                 img = None
-            return {
-                'query': query,
-                'image_url': img.url if img else None,
-                'source': 'pexels' if img else None,
-            }
+            return _banner_payload(query, img)
 
         payload, cached = cache_get_or_set('banner', {'q': query}, ttl, compute)
         return Response({
@@ -132,6 +313,31 @@ class LandingBannerView(LandingAPIView):
         })
 
 
+class LandingAutocompleteView(LandingAPIView):
+    """Search-bar typeahead: city suggestions from the in-process index.
+
+    Never calls an upstream provider, so it is safe to hit on every keystroke.
+    """
+
+    permission_classes = (AllowAny,)
+    throttle_classes = (AnonRateThrottle,)
+
+    def get(self, request):
+        q = (request.query_params.get('q') or '').strip()
+        try:
+            limit = int(request.query_params.get('limit') or 8)
+        except ValueError:
+            limit = 8
+        limit = max(1, min(limit, 20))
+        if not q:
+            return Response({'query': q, 'results': []})
+
+        return Response({
+            'query': q,
+            'results': autocomplete.complete(q, limit=limit),
+        })
+
+
 class LandingDestinationsView(LandingAPIView):
     """Screen 3: Destination discovery list (no dummy data).
 
@@ -165,98 +371,33 @@ class LandingDestinationsView(LandingAPIView):
         ttl = int(getattr(settings, 'CACHES', {}).get('default', {}).get('TIMEOUT', 3600) or 3600)
 
         def compute():
+            deadline = _request_deadline()
+
             # Search for up to 15 destinations to have options
             search_query = q
             places = search_cities(search_query, limit=15, timeout_seconds=timeout)
             
             # If no results, try airport code mapping (Amadeus test API limitation workaround)
             if not places:
-                airport_code_map = {
-                    'dubai': ['DXB', 'DWC'],  # Dubai Int'l and Al Maktoum
-                    'tokyo': ['TYO', 'NRT', 'HND'],  # Tokyo, Narita, Haneda
-                    'madrid': ['MAD'],
-                    'barcelona': ['BCN'],
-                    'rome': ['FCO', 'CIA'],  # Fiumicino and Ciampino
-                    'milan': ['MXP', 'LIN'],  # Malpensa and Linate
-                    'sydney': ['SYD'],
-                    'melbourne': ['MEL'],
-                    'istanbul': ['IST'],
-                    'moscow': ['MOW', 'SVO'],
-                    'beijing': ['PEK'],
-                    'shanghai': ['PVG', 'SHA'],
-                }
-                codes = airport_code_map.get(q.lower(), [])
-                for code in codes:
+                for code in AIRPORT_CODE_MAP.get(q.lower(), []):
                     places = search_cities(code, limit=15, timeout_seconds=timeout)
                     if places:
                         break
             
-            # Helper to convert place to result dict
-            def place_to_result(p):
-                image_query = f"{p.name} {p.country or ''} travel".strip()
-                try:
-                    img = search_image(image_query, timeout_seconds=timeout)
-                except UpstreamError:
-                    img = None
-                return {
-                    'provider': 'amadeus',
-                    'provider_place_id': p.provider_place_id,
-                    'name': p.name,
-                    'country': p.country,
-                    'lat': p.lat,
-                    'lon': p.lon,
-                    'image_url': img.url if img else None,
-                    'image_source': 'pexels' if img else None,
-                }
-            
-            results = []
-            search_lower = q.lower()
-            
-            # Find the best match (exact or starts with)
-            best_match = None
-            other_matches = []
-            
-            for p in places:
-                result = place_to_result(p)
-                name_lower = p.name.lower()
-                
-                if not best_match and (name_lower == search_lower or name_lower.startswith(search_lower)):
-                    best_match = result
-                else:
-                    other_matches.append(result)
-            
-            # Start with the best match
-            if best_match:
-                results.append(best_match)
-            
-            # Add other search results
-            results.extend(other_matches[:7 if best_match else 8])
-            
-            # If we don't have 8 results and no specific search was done, fill with defaults
-            # For actual searches, only fill if we got very few results (< 4)
-            if len(results) < 8:
-                # If it's a real search and we have at least 4 results, don't add defaults
-                # This prevents mixing Dubai results with Indian cities
-                if places and len(results) >= 4:
-                    # Just return what we found, padded to 8 if needed
-                    pass
-                else:
-                    # Either no results or very few - add some popular destinations
-                    needed = 8 - len(results)
-                    existing_names = {r['name'].lower() for r in results}
-                    
-                    for default_dest in DEFAULT_DESTINATIONS:
-                        if needed <= 0:
-                            break
-                        if default_dest['name'].lower() not in existing_names:
-                            try:
-                                default_places = search_cities(default_dest['name'], limit=1, timeout_seconds=timeout)
-                                if default_places:
-                                    results.append(place_to_result(default_places[0]))
-                                    needed -= 1
-                            except Exception:
-                                continue
-            
+            selected = _best_match_first(q, places)
+            needed, candidates = _default_fill(selected, places)
+            if needed:
+                def lookup_default(default_dest):
+                    default_places = search_cities(default_dest['name'], limit=1, timeout_seconds=timeout)
+                    return default_places[0] if default_places else None
+
+                found = fan_out(lookup_default, candidates, deadline=deadline)
+                selected.extend([p for p in found if p is not None][:needed])
+
+            # Enrich every selected place with an image concurrently; slow lookups degrade to no image.
+            images = fan_out(lambda p: _place_image(p, timeout), selected, deadline=deadline)
+            results = [_place_result(p, img) for p, img in zip(selected, images)]
+
             return results  # Return what we found (may be less than 8 for specific searches)
 
         results, cached = cache_get_or_set('destinations', {'q': q}, ttl, compute)
@@ -290,62 +431,18 @@ class LandingAttractionsView(LandingAPIView):
         limit = int(request.query_params.get('limit') or 18)
         limit = max(6, min(limit, 40))
 
-        def compute():
-            search = f"tourist attractions in {city}"
-            url = (
-                "https://en.wikipedia.org/w/api.php"
-                "?action=query"
-                "&format=json"
-                "&origin=*"
-                "&generator=search"
-                f"&gsrsearch={search.replace(' ', '%20')}"
-                f"&gsrlimit={limit}"
-                "&gsrnamespace=0"
-                "&prop=pageimages%7Cextracts%7Cdescription"
-                "&piprop=thumbnail"
-                "&pithumbsize=400"
-                "&exintro=1"
-                "&explaintext=1"
-                "&exsentences=2"
-                "&redirects=1"
-            )
+        # Cities prefetched by `manage.py prefetch_attractions` are served from the table.
+        stored = stored_attractions(city, limit)
+        if stored is not None:
+            return Response({
+                'cached': True,
+                'city': city,
+                'results': stored,
+            })
 
-            resp = get_json(url, timeout_seconds=timeout)
-            data = resp.data or {}
-            pages = (data.get('query') or {}).get('pages') or {}
-
-            out = []
-            city_lower = city.lower()
-            for page in pages.values():
-                title = (page.get('title') or '').strip()
-                if not title:
-                    continue
-                if title.lower() == city_lower:
-                    continue
-
-                title_lower = title.lower()
-                if title_lower.startswith('lists of tourist attractions'):
-                    continue
-
-                thumb = (page.get('thumbnail') or {}).get('source')
-                extract = (page.get('extract') or '').strip()
-                desc = (page.get('description') or '').strip()
-                pageid = page.get('pageid')
-
-                # Keep results relevant to the selected destination.
-                extract_lower = extract.lower() if extract else ''
-                if city_lower not in title_lower and city_lower not in extract_lower:
-                    continue
-
-                out.append({
-                    'name': title,
-                    'description': extract or desc or '',
-                    'image_url': thumb,
-                    'source': 'wikipedia',
-                    'source_url': f"https://en.wikipedia.org/?curid={pageid}" if pageid else None,
-                })
-
-            return out[:limit]
+        def compute():
+            resp = get_json(attractions_url(city, limit), timeout_seconds=timeout)
+            return parse_attractions(resp.data or {}, city, limit)
 
         results, cached = cache_get_or_set('attractions', {'city': city, 'limit': limit, 'v': 2}, ttl, compute)
         return Response({
@@ -376,11 +473,7 @@ class LandingHomeView(LandingAPIView):
                 img = search_image(banner_query, timeout_seconds=timeout)
             except UpstreamError:
                 img = None
-            return {
-                'query': banner_query,
-                'image_url': img.url if img else None,
-                'source': 'pexels' if img else None,
-            }
+            return _banner_payload(banner_query, img)
 
         banner, banner_cached = cache_get_or_set('home_banner', {'q': banner_query}, ttl, compute_banner)
 
@@ -397,24 +490,8 @@ class LandingHomeView(LandingAPIView):
 
             def compute_destinations():
                 places = search_cities(q, limit=6, timeout_seconds=timeout)
-                out = []
-                for p in places:
-                    image_query = f"{p.name} {p.country or ''} travel".strip()
-                    try:
-                        img = search_image(image_query, timeout_seconds=timeout)
-                    except UpstreamError:
-                        img = None
-                    out.append({
-                        'provider': 'amadeus',
-                        'provider_place_id': p.provider_place_id,
-                        'name': p.name,
-                        'country': p.country,
-                        'lat': p.lat,
-                        'lon': p.lon,
-                        'image_url': img.url if img else None,
-                        'image_source': 'pexels' if img else None,
-                    })
-                return out
+                images = fan_out(lambda p: _place_image(p, timeout), places, deadline=_request_deadline())
+                return [_place_result(p, img) for p, img in zip(places, images)]
 
             destinations, destinations_cached = cache_get_or_set('home_destinations', {'q': q}, ttl, compute_destinations)
 
@@ -427,7 +504,7 @@ class LandingHomeView(LandingAPIView):
 
 
 class TripSearchFlightsView(LandingAPIView):
-    """Fetch flight offers for a trip."""
+    """Fetch flight offers for a trip (cached briefly per route, dates and passengers)."""
     permission_classes = (AllowAny,)
     throttle_classes = (AnonRateThrottle,)
 
@@ -444,13 +521,16 @@ class TripSearchFlightsView(LandingAPIView):
                 message='origin, destination, and departure_date are required.'
             )
 
-        flights = search_flights_offer(
+        offers, cached = find_flight_offers(
             origin_code=origin,
             destination_code=destination,
             departure_date=departure_date,
             return_date=return_date
         )
-        return Response({'results': flights})
+        return Response({
+            'cached': cached,
+            'results': [offer.as_dict() for offer in offers],
+        })
 
 
 class TripSearchHotelsView(LandingAPIView):
@@ -470,16 +550,23 @@ class TripSearchHotelsView(LandingAPIView):
                 message='city, check_in, and check_out are required.'
             )
 
-        hotels = search_hotels(
+        hotels, cached = find_hotels(
             city_name=city,
             check_in_date=check_in,
             check_out_date=check_out
         )
-        return Response({'results': hotels})
+        return Response({
+            'cached': cached,
+            'results': hotels,
+        })
+
 
+class TripAIEnhanceView(EventStreamMixin, LandingAPIView):
+    """Enhance a trip itinerary using AI.
 
-class TripAIEnhanceView(LandingAPIView):
-    """Enhance a trip itinerary using AI."""
+    With ``?stream=1`` (or ``Accept: text/event-stream``) each day is sent as a
+    ``day`` event as soon as the model finishes it, followed by ``images``.
+    """
     permission_classes = (AllowAny,)
     throttle_classes = (AnonRateThrottle,)
     
@@ -497,11 +584,32 @@ class TripAIEnhanceView(LandingAPIView):
                 code='missing_params',
                 message='destination and duration are required.'
             )
+
+        try:
+            duration = int(duration)
+        except (TypeError, ValueError):
+            duration = 0
+        if duration < 1:
+            return error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='invalid_params',
+                message='duration must be a positive whole number of days.'
+            )
             
+        if wants_event_stream(request):
+            from landing.providers.groq import stream_itinerary_enhancement
+
+            return event_stream_response(stream_itinerary_enhancement(
+                destination=destination,
+                duration=duration,
+                current_activities=current_activities,
+                hotel=hotel
+            ))
+
         try:
             enhanced_days = generate_itinerary_enhancement(
                 destination=destination,
-                duration=int(duration),
+                duration=duration,
                 current_activities=current_activities,
                 hotel=hotel
             )
@@ -513,8 +621,38 @@ class TripAIEnhanceView(LandingAPIView):
                 message=str(e)
             )
 
-class ChatBotView(LandingAPIView):
-    """General AI chatbot for travel assistance."""
+class TripAIEnhanceImagesView(LandingAPIView):
+    """Images for itinerary items returned with an ``image_query`` (lookup missed the deadline)."""
+    permission_classes = (AllowAny,)
+    throttle_classes = (AnonRateThrottle,)
+
+    MAX_QUERIES = 60
+
+    def post(self, request):
+        from landing.providers.groq import IMAGE_PENDING, lookup_images
+
+        queries = request.data.get('queries')
+        if not isinstance(queries, list) or not queries:
+            return error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                code='missing_params',
+                message='queries must be a non-empty list.'
+            )
+        queries = [str(q) for q in queries[:self.MAX_QUERIES] if str(q).strip()]
+
+        images = lookup_images(queries, deadline=_request_deadline())
+        return Response({
+            'images': {q: url for q, url in images.items() if url is not IMAGE_PENDING},
+            'pending': [q for q, url in images.items() if url is IMAGE_PENDING],
+        })
+
+class ChatBotView(EventStreamMixin, LandingAPIView):
+    """General AI chatbot for travel assistance.
+
+    With ``?stream=1`` (or ``Accept: text/event-stream``) the reply is sent as
+    ``delta`` events while Groq generates it (or one ``data`` event for
+    flight/hotel/destination results).
+    """
     permission_classes = (AllowAny,)
     throttle_classes = (AnonRateThrottle,)
 
@@ -531,6 +669,11 @@ class ChatBotView(LandingAPIView):
                 message='Message is required.'
             )
             
+        if wants_event_stream(request):
+            from landing.providers.groq import stream_chat_with_ai
+
+            return event_stream_response(stream_chat_with_ai(message=message, history=history))
+
         try:
             result = chat_with_ai(message=message, history=history)
             # result is now a dict with 'response' and optional 'data'